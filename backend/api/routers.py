@@ -1,18 +1,63 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
-from backend.config.config_db import get_db
-from backend.schemas.job_schema import JobCreate
+from collections.abc import Awaitable, Callable
+from urllib.parse import urlencode
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+from typing import List, Optional, Union
+from backend.config.config_db import get_async_db
+from backend.schemas.job_schema import JobCreate, JobFilters
 from backend.schemas.response_schemas import (
+    ApplicantSeriesResponseModel,
+    CompanyApplicantSeriesResponseModel,
+    IngestResponseModel,
     ResponseModel,
     ListResponseModel,
+    ProjectedListResponseModel,
+    SearchResponseModel,
     SingleResponseModel,
 )
-from backend.services.job_service import JobService
+from backend.services.export_service import EXPORT_FORMATS, ExportService, accepts_gzip
+from backend.services.job_service import JOB_FIELDS, AsyncJobService
+from backend.utils.response_cache import etag_matches, response_cache
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
 
+async def cached_json(request: Request, build: Callable[[], Awaitable[bytes]]) -> Response:
+    """
+    Serve a JSON response from the response cache, building it on a miss.
+
+    The body is sent with its ETag; a matching If-None-Match gets a 304
+    without a body. Errors raised by `build` are not cached.
+
+    Args:
+        request (Request): Incoming request; its path and query (and the
+            write generation) are the key.
+        build (Callable[[], Awaitable[bytes]]): Produces the JSON response body.
+
+    Returns:
+        Response: The JSON body, or an empty 304.
+    """
+    # Read before building: a write committed meanwhile bumps it
+    generation = await response_cache.generation()
+    query = urlencode(sorted(request.query_params.multi_items()))
+    key = f"{generation}:{request.url.path}?{query}"
+    cached = await response_cache.get(key)
+    if cached is None:
+        body = await build()
+        etag = await response_cache.set(key, body)
+    else:
+        etag, body = cached
+
+    # no-cache: clients may store the response but must revalidate it
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        response_cache.not_modified += 1
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @router.post(
     "/",
     status_code=status.HTTP_201_CREATED,
@@ -27,40 +72,235 @@ router = APIRouter(prefix="/jobs", tags=["jobs"])
 )
 async def create_jobs(
     payload: List[JobCreate],
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> ResponseModel:
     """
     Create or update multiple job listings.
 
     Args:
         payload (List[JobCreate]): List of job listings to create or update.
-        db (Session): Database session, injected by FastAPI.
+        db (AsyncSession): Async database session, injected by FastAPI.
+
+    Returns:
+        ResponseModel: Confirmation message with count of processed listings
+        and the inserted/updated/unchanged breakdown.
+    """
+    result = await AsyncJobService(db).create_jobs(payload)
+    return ResponseModel(
+        message=f"{len(payload)} job(s) added or updated",
+        data=result.model_dump(),
+    )
+
+
+@router.post(
+    "/ingest",
+    status_code=status.HTTP_200_OK,
+    response_model=IngestResponseModel,
+    summary="Stream NDJSON job listings in and upsert them in chunks",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/x-ndjson": {"schema": {"type": "string"}}},
+        }
+    },
+)
+async def ingest_jobs(
+    request: Request,
+    chunk_size: int = Query(1000, ge=1, le=5000, description="Valid rows per upsert"),
+    db: AsyncSession = Depends(get_async_db),
+) -> IngestResponseModel:
+    """
+    Ingest job listings sent as NDJSON (one JobCreate object per line).
+
+    The body is read as it streams in; every `chunk_size` valid lines are
+    upserted, and invalid lines are reported by line number instead of
+    rejecting the whole request.
+
+    Args:
+        request (Request): Incoming request whose body is streamed.
+        chunk_size (int): Valid rows per upsert statement.
+        db (AsyncSession): Async database session, injected by FastAPI.
 
     Returns:
-        ResponseModel: Confirmation message with count of processed listings.
+        IngestResponseModel: Accepted/rejected counts, per-chunk results and errors.
     """
-    JobService(db).create_jobs(payload)
-    return ResponseModel(message=f"{len(payload)} job(s) added or updated")
+    report = await AsyncJobService(db).ingest_ndjson(request.stream(), chunk_size)
+    return IngestResponseModel(
+        message=f"{report.accepted} job(s) added or updated, {report.rejected} line(s) rejected",
+        data=report,
+    )
 
 
 @router.get(
     "/",
     status_code=status.HTTP_200_OK,
-    response_model=ListResponseModel,
-    summary="Retrieve all job listings",
+    response_model=Union[ListResponseModel, ProjectedListResponseModel],
+    summary="Retrieve a page of job listings",
+    responses={
+        status.HTTP_304_NOT_MODIFIED: {"description": "If-None-Match matched the ETag"},
+        status.HTTP_400_BAD_REQUEST: {"description": "Unknown field requested"},
+    },
+)
+async def read_jobs(
+    request: Request,
+    cursor: Optional[int] = Query(
+        None, ge=0, description="Return jobs with an id greater than this (next_cursor)"
+    ),
+    limit: int = Query(100, ge=1, le=1000, description="Page size"),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated fields to return, e.g. 'id,title,company'"
+    ),
+    filters: JobFilters = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
+    """
+    Retrieve stored job listings one page at a time, ordered by id.
+
+    Pages are served from the response cache and carry an ETag.
+
+    Args:
+        request (Request): Incoming request, used for caching and If-None-Match.
+        cursor (Optional[int]): Cursor returned as next_cursor by the previous page.
+        limit (int): Maximum number of listings in the page.
+        fields (Optional[str]): Optional comma-separated projection.
+        filters (JobFilters): Company, location, date_posted and applicants filters.
+        db (AsyncSession): Async database session, injected by FastAPI.
+
+    Raises:
+        HTTPException(400): If `fields` names an unknown field.
+
+    Returns:
+        Response: A serialized ListResponseModel or ProjectedListResponseModel,
+        with the cursor of the next page (null on the last page), or a 304.
+    """
+    async def build() -> bytes:
+        field_list = None
+        if fields:
+            field_list = [f.strip() for f in fields.split(",") if f.strip()]
+            unknown = sorted(set(field_list) - set(JOB_FIELDS))
+            if unknown:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Unknown field(s): {', '.join(unknown)}",
+                )
+
+        return await AsyncJobService(db).get_jobs_page_json(cursor, limit, filters, field_list)
+
+    return await cached_json(request, build)
+
+
+@router.get(
+    "/search",
+    status_code=status.HTTP_200_OK,
+    response_model=SearchResponseModel,
+    summary="Search job listings by title, company and location",
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "If-None-Match matched the ETag"}},
+)
+async def search_jobs(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200, description='e.g. python "data engineer" -senior'),
+    limit: int = Query(20, ge=1, le=100, description="Page size"),
+    offset: int = Query(0, ge=0, le=10000, description="next_offset of the previous page"),
+    fuzzy: bool = Query(True, description="Also match misspellings (needs pg_trgm)"),
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
+    """
+    Full-text search over titles, companies and locations, ranked by relevance.
+
+    Title matches weigh more than company matches, which weigh more than
+    location matches. With `fuzzy`, near spellings of titles and companies
+    match too when the pg_trgm extension is installed.
+
+    Args:
+        request (Request): Incoming request, used for caching and If-None-Match.
+        q (str): Web-search style query (quoted phrases, OR, -word).
+        limit (int): Page size.
+        offset (int): Hits to skip.
+        fuzzy (bool): Enable typo-tolerant matching.
+        db (AsyncSession): Async database session, injected by FastAPI.
+
+    Returns:
+        Response: A serialized SearchResponseModel, or a 304.
+    """
+    async def build() -> bytes:
+        return await AsyncJobService(db).search_jobs_json(q, limit, offset, fuzzy)
+
+    return await cached_json(request, build)
+
+
+@router.get(
+    "/export",
+    status_code=status.HTTP_200_OK,
+    summary="Stream every job listing as NDJSON or CSV",
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "content": {media_type: {} for media_type in EXPORT_FORMATS.values()},
+            "description": "The full job table, streamed in chunks",
+        }
+    },
+)
+async def export_jobs(
+    request: Request,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="ndjson or csv"),
+    chunk_size: int = Query(1000, ge=1, le=50000, description="Rows per cursor fetch"),
+) -> StreamingResponse:
+    """
+    Stream the whole job table from a server-side cursor.
+
+    Memory use does not depend on the table size and the first bytes are
+    sent before the query finishes. The body is gzipped when the client's
+    `Accept-Encoding` allows gzip, and flushed after every chunk.
+
+    Args:
+        request (Request): Incoming request, used for content negotiation.
+        format (str): Output format, "ndjson" or "csv".
+        chunk_size (int): Rows fetched from the cursor per chunk.
+
+    Returns:
+        StreamingResponse: The streamed export.
+    """
+    compress = accepts_gzip(request.headers.get("accept-encoding"))
+    headers = {"Content-Disposition": f'attachment; filename="jobs.{format}"'}
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+        headers["Vary"] = "Accept-Encoding"
+    return StreamingResponse(
+        ExportService().export_jobs(format, compress=compress, chunk_size=chunk_size),
+        media_type=EXPORT_FORMATS[format],
+        headers=headers,
+    )
+
+
+@router.get(
+    "/applicants",
+    status_code=status.HTTP_200_OK,
+    response_model=CompanyApplicantSeriesResponseModel,
+    summary="Applicant growth of a company's listings",
 )
-async def read_jobs(db: Session = Depends(get_db)) -> ListResponseModel:
+async def read_company_applicants(
+    company: str = Query(..., min_length=1, description="Exact company name"),
+    bucket: str = Query("day", pattern="^(hour|day|week|month)$", description="Bucket size"),
+    since: Optional[datetime] = Query(None, description="Earliest observation (inclusive)"),
+    until: Optional[datetime] = Query(None, description="Latest observation (exclusive)"),
+    db: AsyncSession = Depends(get_async_db),
+) -> CompanyApplicantSeriesResponseModel:
     """
-    Retrieve all stored job listings.
+    Aggregate the applicant observations of a company's listings per bucket.
 
     Args:
-        db (Session): Database session, injected by FastAPI.
+        company (str): Exact company name.
+        bucket (str): Bucket size: hour, day, week or month.
+        since (Optional[datetime]): Earliest observation (inclusive).
+        until (Optional[datetime]): Latest observation (exclusive).
+        db (AsyncSession): Async database session, injected by FastAPI.
 
     Returns:
-        ListResponseModel: Wrapper containing list of job listings.
+        CompanyApplicantSeriesResponseModel: One point per bucket and the
+        growth between the first and last one.
     """
-    jobs = JobService(db).get_jobs()
-    return ListResponseModel(data=jobs)
+    series = await AsyncJobService(db).get_company_applicants(company, bucket, since, until)
+    return CompanyApplicantSeriesResponseModel(data=series)
 
 
 @router.get(
@@ -68,31 +308,79 @@ async def read_jobs(db: Session = Depends(get_db)) -> ListResponseModel:
     status_code=status.HTTP_200_OK,
     response_model=SingleResponseModel,
     summary="Get a single job listing by ID",
-    responses={status.HTTP_404_NOT_FOUND: {"description": "Job not found"}},
+    responses={
+        status.HTTP_304_NOT_MODIFIED: {"description": "If-None-Match matched the ETag"},
+        status.HTTP_404_NOT_FOUND: {"description": "Job not found"},
+    },
 )
 async def read_job(
+    request: Request,
     job_id: int,
-    db: Session = Depends(get_db),
-) -> SingleResponseModel:
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
     """
-    Retrieve a job listing by its ID.
+    Retrieve a job listing by its ID, through the response cache.
 
     Args:
+        request (Request): Incoming request, used for caching and If-None-Match.
         job_id (int): The ID of the job listing to retrieve.
-        db (Session): Database session, injected by FastAPI.
+        db (AsyncSession): Async database session, injected by FastAPI.
+
+    Raises:
+        HTTPException(404): If the job listing does not exist.
+
+    Returns:
+        Response: A serialized SingleResponseModel, or a 304.
+    """
+    async def build() -> bytes:
+        body = await AsyncJobService(db).get_job_json(job_id)
+        if body is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Job not found"
+            )
+        return body
+
+    return await cached_json(request, build)
+
+
+@router.get(
+    "/{job_id}/applicants",
+    status_code=status.HTTP_200_OK,
+    response_model=ApplicantSeriesResponseModel,
+    summary="Applicant history of a single job listing",
+    responses={status.HTTP_404_NOT_FOUND: {"description": "Job not found"}},
+)
+async def read_job_applicants(
+    job_id: int,
+    since: Optional[datetime] = Query(None, description="Earliest observation (inclusive)"),
+    until: Optional[datetime] = Query(None, description="Latest observation (exclusive)"),
+    limit: int = Query(1000, ge=1, le=10000, description="Maximum observations (the latest)"),
+    db: AsyncSession = Depends(get_async_db),
+) -> ApplicantSeriesResponseModel:
+    """
+    Retrieve the latest `limit` applicant observations of a job listing,
+    oldest first.
+
+    Args:
+        job_id (int): The ID of the job listing.
+        since (Optional[datetime]): Earliest observation (inclusive).
+        until (Optional[datetime]): Latest observation (exclusive).
+        limit (int): Maximum number of observations.
+        db (AsyncSession): Async database session, injected by FastAPI.
 
     Raises:
         HTTPException(404): If the job listing does not exist.
 
     Returns:
-        SingleResponseModel: Wrapper containing the job listing.
+        ApplicantSeriesResponseModel: The observations and the growth between
+        the first and last observation in the range.
     """
-    job = JobService(db).get_job(job_id)
-    if not job:
+    series = await AsyncJobService(db).get_job_applicants(job_id, since, until, limit)
+    if series is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Job not found"
         )
-    return SingleResponseModel(data=job)
+    return ApplicantSeriesResponseModel(data=series)
 
 
 @router.delete(
@@ -104,14 +392,14 @@ async def read_job(
 )
 async def delete_job(
     job_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> ResponseModel:
     """
     Delete a job listing by its ID.
 
     Args:
         job_id (int): The ID of the job listing to delete.
-        db (Session): Database session, injected by FastAPI.
+        db (AsyncSession): Async database session, injected by FastAPI.
 
     Raises:
         HTTPException(404): If the job listing does not exist.
@@ -119,7 +407,7 @@ async def delete_job(
     Returns:
         ResponseModel: Confirmation message of deletion.
     """
-    success = JobService(db).delete_job(job_id)
+    success = await AsyncJobService(db).delete_job(job_id)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Job not found"
@@ -1,8 +1,14 @@
+import time
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from sqlalchemy import create_engine
-from sqlalchemy.exc import OperationalError
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import DBAPIError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from backend.models.job_listing import SEARCH_VECTOR_SQL
 from backend.utils.logger import logger
+from backend.utils.metrics import DB_POOL_CHECKOUT
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
@@ -11,17 +17,74 @@ class Settings(BaseSettings):
     )
 
     DATABASE_URL: str
+    # Defaults to DATABASE_URL with the asyncpg driver
+    ASYNC_DATABASE_URL: str | None = None
+
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+
+    # Rows per INSERT ... ON CONFLICT statement; keeps bind parameters far
+    # below PostgreSQL's 65535 limit
+    UPSERT_CHUNK_SIZE: int = 1000
+    # Batches at least this large go through COPY + a staging-table merge
+    COPY_THRESHOLD: int = 5000
+    INGEST_MAX_ERRORS: int = 100
+    # Longer NDJSON lines are rejected without being buffered
+    INGEST_MAX_LINE_BYTES: int = 64 * 1024
+    # Unchanged rows get last_seen_at refreshed at most this often
+    LAST_SEEN_RESOLUTION_HOURS: float = 12.0
+
+    # GET /jobs and /jobs/{id} responses, keyed by a write generation: API
+    # writes bump it at once, writes from the scraper or queue workers are
+    # noticed within RESPONSE_CACHE_POLL_SECONDS; the TTL only bounds memory
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_TTL_SECONDS: float = 300.0
+    RESPONSE_CACHE_POLL_SECONDS: float = 5.0
+    RESPONSE_CACHE_MAX_ENTRIES: int = 256
+    # "memory" (per process) or "redis" (shared; needs the redis package)
+    RESPONSE_CACHE_BACKEND: str = "memory"
+    REDIS_URL: str | None = None
+
+    # Minimum pg_trgm word similarity for a fuzzy search match
+    SEARCH_FUZZY_THRESHOLD: float = 0.5
 
 settings = Settings()
 logger.info(f"DATABASE_URI read from environment")
 
-engine = create_engine(
-    settings.DATABASE_URL,
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waits for a connection"""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT.observe(time.perf_counter() - start, pool="sync")
+
+
+class TimedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records how long each checkout waits"""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT.observe(time.perf_counter() - start, pool="async")
+
+
+pool_options = dict(
     pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
 )
 
+engine = create_engine(settings.DATABASE_URL, poolclass=TimedQueuePool, **pool_options)
+
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
@@ -29,16 +92,118 @@ SessionLocal = sessionmaker(
 )
 
 
-def init_db():
+def _async_url() -> str:
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+    url = make_url(settings.DATABASE_URL)
+    return url.set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+
+
+async_engine = create_async_engine(_async_url(), poolclass=TimedAsyncQueuePool, **pool_options)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+
+# Idempotent DDL for columns/indexes added after the tables were first
+# created; create_all() never alters an existing table.
+SCHEMA_UPGRADES = [
+    "ALTER TABLE job_listings ADD COLUMN IF NOT EXISTS applicants_checked_at TIMESTAMPTZ",
+    "ALTER TABLE job_listings ADD COLUMN IF NOT EXISTS last_seen_at TIMESTAMPTZ DEFAULT now()",
+    # Free space on each page keeps last_seen_at refreshes (no indexed
+    # column touched) as HOT updates
+    "ALTER TABLE job_listings SET (fillfactor = 90)",
+    "ALTER TABLE job_listings ADD COLUMN IF NOT EXISTS search_vector tsvector "
+    f"GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED",
+    # Filled in for existing rows by backend.db.job_ids.migrate_job_ids
+    "ALTER TABLE job_listings ADD COLUMN IF NOT EXISTS linkedin_id BIGINT",
+    # Response cache generation, bumped by JobRepository after each write
+    "CREATE SEQUENCE IF NOT EXISTS response_cache_generation",
+]
+
+# Trigram indexes for typo-tolerant search; only built when the pg_trgm
+# extension can be installed, search falls back to full-text otherwise
+TRIGRAM_UPGRADES = [
+    "CREATE INDEX IF NOT EXISTS ix_job_listings_title_trgm "
+    "ON job_listings USING gin (title gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_job_listings_company_trgm "
+    "ON job_listings USING gin (company gin_trgm_ops)",
+]
+
+
+def init_db(migrate: bool = True):
+    """
+    Create missing tables and apply the schema upgrades. With `migrate`,
+    a database from before linkedin_id is migrated in the same transaction
+    (see backend.db.job_ids); a failed migration fails startup.
+    """
     from backend.db.base import Base
+    from backend.db.job_ids import migrate_job_ids, needs_migration
+    # Register the models on Base.metadata before creating/upgrading tables
+    import backend.models.job_listing  # noqa: F401
+    import backend.models.applicant_observation  # noqa: F401
+    import backend.models.scrape_task  # noqa: F401
+    import backend.models.scrape_rate_limit  # noqa: F401
     try:
         Base.metadata.create_all(bind=engine)
+        migrated = False
+        with engine.begin() as conn:
+            for statement in SCHEMA_UPGRADES:
+                conn.execute(text(statement))
+            # create_all() only builds indexes together with a new table
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(bind=conn, checkfirst=True)
+            if migrate and needs_migration(conn):
+                counts = migrate_job_ids(conn)
+                migrated = True
+                logger.info(
+                    f"Job listings keyed on linkedin_id: {counts['parsed']} IDs backfilled, "
+                    f"{counts['merged']} duplicates merged."
+                )
+        if migrated:
+            # Cached responses from before the migration are stale
+            with engine.begin() as conn:
+                conn.execute(text("SELECT nextval('response_cache_generation')"))
+        _create_trigram_indexes()
+        _check_job_ids()
         logger.info("Tables created successfully.")
     except OperationalError as e:
         logger.error(f"Error creating tables: {e}")
         raise
 
 
+def _create_trigram_indexes() -> None:
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    except DBAPIError as e:
+        message = str(e.orig).splitlines()[0]
+        logger.warning(f"pg_trgm unavailable, fuzzy search disabled: {message}")
+        return
+    with engine.begin() as conn:
+        for statement in TRIGRAM_UPGRADES:
+            conn.execute(text(statement))
+
+
+def _check_job_ids() -> None:
+    # Left over by the migration: listings whose job_url names no posting.
+    # Upserts never match them, and linkedin_id stays nullable meanwhile
+    with engine.connect() as conn:
+        missing = conn.execute(text(
+            "SELECT count(*) FROM job_listings WHERE linkedin_id IS NULL"
+        )).scalar()
+    if missing:
+        logger.warning(
+            f"{missing} job listings have no linkedin_id; remove them with "
+            "`python -m backend.scripts.backfill_job_ids --delete-unparseable`."
+        )
+
+
 def get_db():
     db = SessionLocal()
     try:
@@ -46,3 +211,11 @@ def get_db():
     finally:
         db.close()
         logger.info("Closed database session.")
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        finally:
+            logger.info("Closed async database session.")
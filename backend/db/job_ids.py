@@ -0,0 +1,134 @@
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from backend.utils.linkedin import canonical_job_url, job_id_from_url
+
+
+def needs_migration(conn: Connection) -> bool:
+    """
+    True while the table still has the unique key on job_url from before
+    listings were keyed on linkedin_id. Upserts conflict on linkedin_id, so
+    a leftover job_url key rejects every re-scrape of a listing with a
+    UniqueViolation.
+    """
+    return conn.execute(text(
+        "SELECT to_regclass('ix_job_listings_job_url') IS NOT NULL "
+        "OR EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'job_listings_job_url_key')"
+    )).scalar()
+
+
+def _parse_job_ids(conn: Connection, batch_size: int) -> tuple[int, int]:
+    """
+    Parse the job ID of every row still without one into the temporary
+    table job_id_backfill. Returns (parsed, unparseable) row counts.
+    """
+    conn.execute(text(
+        "CREATE TEMP TABLE job_id_backfill "
+        "(id integer PRIMARY KEY, linkedin_id bigint NOT NULL, job_url text NOT NULL) "
+        "ON COMMIT DROP"
+    ))
+    parsed = unparseable = 0
+    after_id = 0
+    while True:
+        rows = conn.execute(text(
+            "SELECT id, job_url FROM job_listings "
+            "WHERE linkedin_id IS NULL AND id > :after_id ORDER BY id LIMIT :limit"
+        ), {"after_id": after_id, "limit": batch_size}).all()
+        if not rows:
+            break
+        after_id = rows[-1].id
+
+        ids, job_ids, urls = [], [], []
+        for row in rows:
+            job_id = job_id_from_url(row.job_url)
+            if job_id is None:
+                unparseable += 1
+                continue
+            ids.append(row.id)
+            job_ids.append(job_id)
+            urls.append(canonical_job_url(job_id))
+        if ids:
+            conn.execute(text(
+                "INSERT INTO job_id_backfill SELECT * FROM unnest("
+                "CAST(:ids AS integer[]), CAST(:job_ids AS bigint[]), CAST(:urls AS text[]))"
+            ), {"ids": ids, "job_ids": job_ids, "urls": urls})
+        parsed += len(ids)
+    return parsed, unparseable
+
+
+def _merge_duplicates(conn: Connection) -> tuple[int, int]:
+    """
+    Collapse rows sharing a job ID onto the most recently seen one, moving
+    the applicant observations of the others over first. Returns (merged
+    rows, moved observations).
+    """
+    conn.execute(text(
+        "CREATE TEMP TABLE job_id_merges ON COMMIT DROP AS "
+        "SELECT id AS loser, winner FROM ("
+        "  SELECT k.id, first_value(k.id) OVER ("
+        "    PARTITION BY k.linkedin_id ORDER BY k.last_seen_at DESC NULLS LAST, k.id DESC"
+        "  ) AS winner "
+        "  FROM ("
+        "    SELECT j.id, coalesce(j.linkedin_id, b.linkedin_id) AS linkedin_id, j.last_seen_at "
+        "    FROM job_listings j LEFT JOIN job_id_backfill b ON b.id = j.id "
+        "    WHERE j.linkedin_id IS NOT NULL OR b.id IS NOT NULL"
+        "  ) k"
+        ") ranked WHERE id <> winner"
+    ))
+    moved = conn.execute(text(
+        "INSERT INTO applicant_observations (job_id, observed_at, applicants, days_since_posted) "
+        "SELECT m.winner, o.observed_at, o.applicants, o.days_since_posted "
+        "FROM applicant_observations o JOIN job_id_merges m ON o.job_id = m.loser "
+        "ON CONFLICT DO NOTHING"
+    )).rowcount
+    # The losers' own observations go with them (ON DELETE CASCADE)
+    merged = conn.execute(text(
+        "DELETE FROM job_listings j USING job_id_merges m WHERE j.id = m.loser"
+    )).rowcount
+    return merged, moved
+
+
+def migrate_job_ids(
+    conn: Connection, batch_size: int = 5000, delete_unparseable: bool = False
+) -> dict:
+    """
+    Give every job listing its LinkedIn job ID, merge listings that turn
+    out to be the same posting, and retire the job_url unique key.
+
+    Runs inside the caller's transaction and takes an advisory lock first,
+    so processes upgrading the same database never interleave. Listings
+    whose job_url names no posting keep a NULL linkedin_id (NULLs never
+    conflict) unless `delete_unparseable` removes them.
+
+    Returns:
+        dict: parsed, merged, moved, unparseable and deleted row counts.
+    """
+    conn.execute(text("SELECT pg_advisory_xact_lock(hashtext('backfill_job_ids'))"))
+
+    parsed, unparseable = _parse_job_ids(conn, batch_size)
+    merged, moved = _merge_duplicates(conn)
+    conn.execute(text(
+        "UPDATE job_listings j SET linkedin_id = b.linkedin_id, job_url = b.job_url "
+        "FROM job_id_backfill b WHERE j.id = b.id"
+    ))
+    # Upserts conflict on linkedin_id now; the 512-char URL index only
+    # slowed every insert down
+    conn.execute(text("DROP INDEX IF EXISTS ix_job_listings_job_url"))
+    conn.execute(text(
+        "ALTER TABLE job_listings DROP CONSTRAINT IF EXISTS job_listings_job_url_key"
+    ))
+
+    deleted = 0
+    if unparseable and delete_unparseable:
+        deleted = conn.execute(text(
+            "DELETE FROM job_listings WHERE linkedin_id IS NULL"
+        )).rowcount
+    if not unparseable or delete_unparseable:
+        conn.execute(text("ALTER TABLE job_listings ALTER COLUMN linkedin_id SET NOT NULL"))
+
+    return {
+        "parsed": parsed,
+        "merged": merged,
+        "moved": moved,
+        "unparseable": unparseable,
+        "deleted": deleted,
+    }
@@ -1,13 +1,17 @@
+import time
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from backend.api.routers import router as jobs_router, ResponseModel
-from backend.config.config_db import init_db
+from backend.config.config_db import async_engine, init_db
+from backend.utils.metrics import CONTENT_TYPE, REQUEST_LATENCY, registry
+from backend.utils.response_cache import response_cache
 from contextlib import asynccontextmanager
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     init_db()
     yield
+    await async_engine.dispose()
 
 app = FastAPI(
     title="LinkedIn Scraper API",
@@ -27,4 +31,47 @@ async def http_exception_handler(request: Request, exc: HTTPException):
         ).dict()
     )
 
-app.include_router(jobs_router)
\ No newline at end of file
+@app.middleware("http")
+async def record_latency(request: Request, call_next):
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        # The route template keeps label values bounded (/jobs/{job_id},
+        # not one series per ID); unmatched paths share one series
+        route = request.scope.get("route")
+        REQUEST_LATENCY.observe(
+            time.perf_counter() - start,
+            method=request.method,
+            route=getattr(route, "path", "unmatched"),
+            status=str(status),
+        )
+
+app.include_router(jobs_router)
+
+
+@app.get("/cache/stats", response_model=ResponseModel, tags=["cache"])
+async def cache_stats() -> ResponseModel:
+    """
+    Report this process's response-cache hit ratio and counters.
+
+    Returns:
+        ResponseModel: Hits, misses, hit ratio, 304s and invalidations.
+    """
+    return ResponseModel(data=response_cache.stats())
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    """
+    Expose this process's metrics in the Prometheus text format: request
+    latency per route, DB pool checkout wait, upsert time and rows, and
+    rows serialized.
+
+    Returns:
+        Response: text/plain exposition.
+    """
+    return Response(registry.render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,46 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, SmallInteger
+from backend.db.base import Base
+
+class ApplicantObservation(Base):
+    """Append-only applicant counts, one row per job and applicants read"""
+
+    __tablename__ = "applicant_observations"
+
+    job_id = Column(
+        Integer, ForeignKey("job_listings.id", ondelete="CASCADE"), nullable=False
+    )
+    # When the count was read (applicants_checked_at), so re-upserting a
+    # cached count does not add a new point
+    observed_at = Column(DateTime(timezone=True), nullable=False)
+    applicants = Column(Integer, nullable=False)
+    days_since_posted = Column(SmallInteger, nullable=True)
+
+    # (job_id, observed_at) is the key, enforced by a unique index that also
+    # carries `applicants` so series are read with index-only scans. The
+    # table has no primary key constraint: PostgreSQL accepts PRIMARY KEY
+    # ... INCLUDE, but SQLAlchemy's PrimaryKeyConstraint cannot emit it, and
+    # a plain primary key next to the covering index would store the key
+    # twice. The mapper's primary_key gives the ORM its identity. Rows
+    # arrive roughly in time order, so a BRIN index covers time-range scans
+    # at a few pages in size.
+    __table_args__ = (
+        Index(
+            "ux_applicant_observations_job_id_observed_at",
+            "job_id",
+            "observed_at",
+            unique=True,
+            postgresql_include=["applicants"],
+        ),
+        Index(
+            "ix_applicant_observations_observed_at",
+            "observed_at",
+            postgresql_using="brin",
+        ),
+    )
+    __mapper_args__ = {"primary_key": [job_id, observed_at]}
+
+    def __repr__(self):
+        return (
+            f"<ApplicantObservation(job_id={self.job_id!r}, "
+            f"observed_at={self.observed_at!r}, applicants={self.applicants!r})>"
+        )
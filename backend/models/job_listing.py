@@ -1,6 +1,23 @@
-from sqlalchemy import Column, Integer, String, Date
+from sqlalchemy import BigInteger, Column, Computed, Integer, String, Date, DateTime, Index, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred
 from backend.db.base import Base
 
+# Columns whose change is a real content change. days_since_posted and
+# applicants_checked_at move on every scrape, so they are refreshed together
+# with last_seen_at instead of forcing a rewrite of the row
+CONTENT_COLUMNS = ("title", "company", "location", "date_posted", "applicants")
+BOOKKEEPING_COLUMNS = ("days_since_posted", "applicants_checked_at")
+
+# Listings mix Spanish and English, so no stemming; titles rank above
+# companies, companies above locations
+SEARCH_CONFIG = "simple"
+SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(company, '')), 'B') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(location, '')), 'C')"
+)
+
 class JobListing(Base):
     __tablename__ = "job_listings"
 
@@ -10,8 +27,26 @@ class JobListing(Base):
     location = Column(String(128), nullable=False)
     date_posted = Column(Date, nullable=True)
     days_since_posted = Column(Integer, nullable=True)
-    job_url = Column(String(512), nullable=False, unique=True, index=True)
+    job_url = Column(String(512), nullable=False)
+    # Numeric LinkedIn posting ID parsed from job_url; the upsert key, so
+    # slug and tracking variants of one posting land on the same row
+    linkedin_id = Column(BigInteger, nullable=False)
     applicants = Column(Integer, nullable=True)
+    applicants_checked_at = Column(DateTime(timezone=True), nullable=True)
+    last_seen_at = Column(DateTime(timezone=True), nullable=True, server_default=func.now())
+    # Maintained by PostgreSQL; deferred so ORM loads never fetch it
+    search_vector = deferred(Column(TSVECTOR, Computed(SEARCH_VECTOR_SQL, persisted=True)))
+
+    # Keyset pagination walks `id`; the composite indexes let equality
+    # filters seek straight to `(value, id > cursor)`
+    __table_args__ = (
+        Index("ux_job_listings_linkedin_id", "linkedin_id", unique=True),
+        Index("ix_job_listings_company_id", "company", "id"),
+        Index("ix_job_listings_location_id", "location", "id"),
+        Index("ix_job_listings_date_posted", "date_posted"),
+        Index("ix_job_listings_applicants", "applicants"),
+        Index("ix_job_listings_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     def __repr__(self):
         return (
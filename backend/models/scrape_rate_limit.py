@@ -0,0 +1,24 @@
+from sqlalchemy import BigInteger, Column, DateTime, Float, Integer, String, func
+from backend.db.base import Base
+
+
+class ScrapeRateLimit(Base):
+    """Token bucket shared by every scraper process pacing requests to one site"""
+
+    __tablename__ = "scrape_rate_limits"
+
+    name = Column(String(64), primary_key=True)
+    # Requests per second, adapted as responses come back healthy or throttled
+    rate = Column(Float, nullable=False)
+    # Tokens left at updated_at; negative while requests are queued
+    tokens = Column(Float, nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    # No request goes out before this; set when a throttle page is detected
+    backoff_until = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    # Consecutive throttles; each one doubles the backoff
+    streak = Column(Integer, nullable=False, server_default="0")
+    # Total throttles; waiters holding an older value take a new token
+    throttles = Column(BigInteger, nullable=False, server_default="0")
+
+    def __repr__(self):
+        return f"<ScrapeRateLimit(name={self.name!r}, rate={self.rate!r}, streak={self.streak!r})>"
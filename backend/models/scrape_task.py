@@ -0,0 +1,50 @@
+from sqlalchemy import BigInteger, Column, DateTime, Index, SmallInteger, String, Text, func, text
+from sqlalchemy.dialects.postgresql import JSONB
+from backend.db.base import Base
+
+# Task kinds, and the statuses a task moves through:
+# pending -> running -> done, or back to pending for a retry, or failed
+TASK_KINDS = ("search", "detail")
+TASK_STATUSES = ("pending", "running", "done", "failed")
+
+class ScrapeTask(Base):
+    """A unit of scrape work shared by every queue worker"""
+
+    __tablename__ = "scrape_tasks"
+
+    id = Column(BigInteger, primary_key=True)
+    # Groups the tasks of one enqueued campaign run
+    run = Column(String(64), nullable=False)
+    kind = Column(String(16), nullable=False)
+    # Unique per run: enqueueing a search or a job twice is a no-op
+    task_key = Column(String(128), nullable=False)
+    payload = Column(JSONB, nullable=False)
+    status = Column(String(16), nullable=False, server_default="pending")
+    attempts = Column(SmallInteger, nullable=False, server_default="0")
+    # Earliest time the task may be claimed (retries back off)
+    run_after = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    # A running task whose lease expired is claimed again by another worker
+    lease_until = Column(DateTime(timezone=True), nullable=True)
+    worker = Column(String(128), nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Claims only scan claimable rows: the partial index stays small however
+    # many finished tasks accumulate
+    __table_args__ = (
+        Index("ux_scrape_tasks_run_task_key", "run", "task_key", unique=True),
+        Index(
+            "ix_scrape_tasks_claimable",
+            "run_after",
+            "id",
+            postgresql_where=text("status IN ('pending', 'running')"),
+        ),
+        Index("ix_scrape_tasks_run_status", "run", "status"),
+    )
+
+    def __repr__(self):
+        return (
+            f"<ScrapeTask(id={self.id!r}, kind={self.kind!r}, "
+            f"task_key={self.task_key!r}, status={self.status!r})>"
+        )
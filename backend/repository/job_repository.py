@@ -1,8 +1,281 @@
-from collections.abc import Iterable
+import io
+import time
+from datetime import timedelta
+from collections.abc import AsyncIterator, Iterable, Sequence
 from typing import Optional
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import Select, TextClause, delete, func, literal, literal_column, or_, select, text
+from sqlalchemy.dialects.postgresql import Insert, insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from backend.models.job_listing import JobListing
+from backend.models.job_listing import (
+    BOOKKEEPING_COLUMNS,
+    CONTENT_COLUMNS,
+    SEARCH_CONFIG,
+    JobListing,
+)
+from backend.config.config_db import settings
+from backend.schemas.job_schema import JobFilters, UpsertResult
+from backend.utils.linkedin import canonical_job_url, job_id_from_url
+from backend.utils.metrics import DB_UPSERT, DB_UPSERT_ROWS
+
+
+# Bumped after every committed write to job_listings, from whatever process
+# made it; the response cache keys its entries by the current value
+BUMP_CACHE_GENERATION = text("SELECT nextval('response_cache_generation')")
+
+
+def changed_rows(result: UpsertResult) -> bool:
+    """
+    Whether an upsert changed anything a cached response could show.
+    """
+    return bool(result.inserted or result.updated or result.refreshed)
+
+
+def record_upsert(result: UpsertResult, path: str, elapsed: float) -> None:
+    """
+    Feed one batch upsert into the db_upsert metrics.
+    """
+    DB_UPSERT.observe(elapsed, path=path)
+    for outcome in ("inserted", "updated", "unchanged", "skipped"):
+        count = getattr(result, outcome)
+        if count:
+            DB_UPSERT_ROWS.inc(count, outcome=outcome)
+
+
+def page_statement(
+    after_id: Optional[int],
+    limit: int,
+    filters: Optional[JobFilters] = None,
+    columns: Optional[Sequence[str]] = None,
+) -> Select:
+    """
+    Build the keyset-pagination SELECT shared by the sync and async repositories.
+    """
+    if columns:
+        stmt = select(*(JobListing.__table__.c[name] for name in columns))
+    else:
+        stmt = select(JobListing)
+
+    if after_id is not None:
+        stmt = stmt.where(JobListing.id > after_id)
+    if filters is not None:
+        if filters.company is not None:
+            stmt = stmt.where(JobListing.company == filters.company)
+        if filters.location is not None:
+            stmt = stmt.where(JobListing.location == filters.location)
+        if filters.posted_from is not None:
+            stmt = stmt.where(JobListing.date_posted >= filters.posted_from)
+        if filters.posted_to is not None:
+            stmt = stmt.where(JobListing.date_posted <= filters.posted_to)
+        if filters.min_applicants is not None:
+            stmt = stmt.where(JobListing.applicants >= filters.min_applicants)
+        if filters.max_applicants is not None:
+            stmt = stmt.where(JobListing.applicants <= filters.max_applicants)
+
+    return stmt.order_by(JobListing.id).limit(limit)
+
+
+def search_statement(
+    q: str, limit: int, offset: int, fuzzy: bool, columns: Sequence[str]
+) -> Select:
+    """
+    Build the ranked search SELECT: full-text matches on the weighted
+    search_vector (GIN), plus trigram word-similarity matches on title and
+    company when `fuzzy` is set (needs pg_trgm and its GIN indexes).
+    The `score` column is ts_rank_cd plus the best word similarity.
+    """
+    table = JobListing.__table__
+    query = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+    score = func.ts_rank_cd(table.c.search_vector, query)
+    match = table.c.search_vector.op("@@")(query)
+    if fuzzy:
+        # `q <% column` is the index-backed form of word_similarity() >= threshold
+        score = score + func.greatest(
+            func.word_similarity(q, table.c.title), func.word_similarity(q, table.c.company)
+        )
+        match = or_(
+            match,
+            literal(q).op("<%")(table.c.title),
+            literal(q).op("<%")(table.c.company),
+        )
+    return (
+        select(*(table.c[name] for name in columns), score.label("score"))
+        .where(match)
+        .order_by(score.desc(), table.c.id)
+        .offset(offset)
+        .limit(limit)
+    )
+
+
+def upsert_statement(records: list[dict]) -> Insert:
+    """
+    Build the INSERT ... ON CONFLICT (linkedin_id) DO UPDATE statement for `records`.
+
+    Existing rows are only rewritten when one of the supplied CONTENT_COLUMNS
+    differs from the stored value; unchanged rows are left to seen_statement().
+    """
+    stmt = insert(JobListing).values(records)
+
+    # Build a dict of columns to update on conflict, excluding the keys and
+    # any column the caller did not supply (e.g. applicants_checked_at
+    # from API payloads), so it keeps its stored value
+    supplied = set(records[0]) if records else set()
+    update_columns = {
+        col.name: getattr(stmt.excluded, col.name)
+        for col in JobListing.__table__.columns
+        if col.name not in ("id", "linkedin_id") and col.name in supplied
+    }
+    update_columns["last_seen_at"] = func.now()
+
+    changed = or_(*(
+        JobListing.__table__.c[name].is_distinct_from(getattr(stmt.excluded, name))
+        for name in CONTENT_COLUMNS
+        if name in supplied
+    ))
+
+    # xmax is 0 only for freshly inserted tuples
+    return stmt.on_conflict_do_update(
+        index_elements=["linkedin_id"], set_=update_columns, where=changed
+    ).returning(literal_column("xmax = 0").label("inserted"))
+
+
+# unnest() needs typed arrays: a chunk may hold nothing but NULLs
+_ARRAY_TYPES = {
+    "linkedin_id": "bigint[]",
+    "applicants": "integer[]",
+    "days_since_posted": "integer[]",
+    "applicants_checked_at": "timestamptz[]",
+}
+
+
+def _unnest(records: list[dict], columns: Sequence[str]) -> tuple[str, dict]:
+    """
+    Return an `unnest(...) AS v(columns)` FROM item and its array parameters,
+    one bind parameter per column instead of one per value.
+    """
+    arrays = ", ".join(f"CAST(:{name} AS {_ARRAY_TYPES[name]})" for name in columns)
+    params = {name: [record.get(name) for record in records] for name in columns}
+    return f"unnest({arrays}) AS v({', '.join(columns)})", params
+
+
+def _seen_condition(source: str, columns: Sequence[str]) -> str:
+    # A newer count check is stored even within the resolution window;
+    # a stored NULL counts as older than any check
+    condition = (
+        "job_listings.last_seen_at IS NULL "
+        "OR job_listings.last_seen_at < now() - :resolution"
+    )
+    if "applicants_checked_at" in columns:
+        condition += (
+            f" OR {source}.applicants_checked_at > "
+            "COALESCE(job_listings.applicants_checked_at, '-infinity')"
+        )
+    return f"({condition})"
+
+
+def seen_statement(records: list[dict]) -> TextClause:
+    """
+    Build the UPDATE that refreshes last_seen_at (and the supplied
+    BOOKKEEPING_COLUMNS) of rows not refreshed within
+    LAST_SEEN_RESOLUTION_HOURS, or whose applicants_checked_at is older
+    than the supplied one. Run it after upsert_statement() in the same
+    transaction: rows that statement just wrote are skipped. Only untouched
+    columns get written, so PostgreSQL can apply it as a HOT update.
+    """
+    supplied = set(records[0]) if records else set()
+    columns = ["linkedin_id"] + [name for name in BOOKKEEPING_COLUMNS if name in supplied]
+    set_clause = ", ".join(
+        [f"{name} = v.{name}" for name in columns[1:]] + ["last_seen_at = now()"]
+    )
+    source, params = _unnest(records, columns)
+    return text(
+        f"UPDATE job_listings SET {set_clause} "
+        f"FROM {source} "
+        "WHERE job_listings.linkedin_id = v.linkedin_id "
+        f"AND {_seen_condition('v', columns)} "
+        "RETURNING job_listings.id"
+    ).bindparams(
+        resolution=timedelta(hours=settings.LAST_SEEN_RESOLUTION_HOURS), **params
+    )
+
+
+def _observation_sql(source: str, columns: Sequence[str]) -> str:
+    # Observations are keyed by the time the count was read; records without
+    # one (API payloads) are observed at the transaction time
+    checked_at = "v.applicants_checked_at" if "applicants_checked_at" in columns else "NULL"
+    days = "v.days_since_posted" if "days_since_posted" in columns else "NULL"
+    return (
+        "INSERT INTO applicant_observations "
+        "(job_id, observed_at, applicants, days_since_posted) "
+        f"SELECT j.id, COALESCE({checked_at}, now()), v.applicants, {days} "
+        f"FROM {source} JOIN job_listings j ON j.linkedin_id = v.linkedin_id "
+        "WHERE v.applicants IS NOT NULL "
+        "ON CONFLICT DO NOTHING "
+        "RETURNING job_id"
+    )
+
+
+def observation_statement(records: list[dict]) -> TextClause:
+    """
+    Build the INSERT that appends one applicant observation per record with
+    a known applicants count. Run it in the upsert's transaction.
+    """
+    columns = ["linkedin_id", "applicants", "days_since_posted", "applicants_checked_at"]
+    source, params = _unnest(records, columns)
+    return text(_observation_sql(source, columns)).bindparams(**params)
+
+
+def upsert_result(
+    rows: Sequence, total: int, seen_rows: Sequence = (), observed_rows: Sequence = ()
+) -> UpsertResult:
+    inserted = sum(1 for row in rows if row.inserted)
+    return UpsertResult(
+        inserted=inserted,
+        updated=len(rows) - inserted,
+        unchanged=total - len(rows),
+        refreshed=len(seen_rows),
+        observed=len(observed_rows),
+    )
+
+
+def keyed_records(records: Iterable[dict]) -> tuple[list[dict], int]:
+    """
+    Key records on their LinkedIn job ID and keep the last one per ID: one
+    statement must not touch the same row twice.
+
+    Records without a `linkedin_id` get it (and a canonical job_url) from
+    their job_url. Returns the records and how many were skipped because
+    their job_url names no posting.
+    """
+    keyed: dict[int, dict] = {}
+    skipped = 0
+    for record in records:
+        if record.get("linkedin_id") is None:
+            job_id = job_id_from_url(record["job_url"])
+            if job_id is None:
+                skipped += 1
+                continue
+            record = {**record, "linkedin_id": job_id, "job_url": canonical_job_url(job_id)}
+        keyed[record["linkedin_id"]] = record
+    return list(keyed.values()), skipped
+
+
+# Whether pg_trgm is installed; looked up on the first search
+_trigram_available: Optional[bool] = None
+
+
+def _copy_value(value) -> str:
+    # COPY csv: an unquoted empty field is NULL, a quoted one is ''
+    if value is None:
+        return ""
+    if isinstance(value, int):
+        return str(value)
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def chunked(records: list[dict], size: int):
+    for start in range(0, len(records), size):
+        yield records[start:start + size]
 
 
 class JobRepository:
@@ -25,6 +298,30 @@ class JobRepository:
         """
         return self.db.query(JobListing).all()
 
+    def list_page(
+        self,
+        after_id: Optional[int],
+        limit: int,
+        filters: Optional[JobFilters] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> list:
+        """
+        Retrieve one page of job listings ordered by id (keyset pagination).
+
+        Args:
+            after_id (Optional[int]): Only rows with an id greater than this.
+            limit (int): Maximum number of rows to return.
+            filters (Optional[JobFilters]): Optional column filters.
+            columns (Optional[Sequence[str]]): If given, select only these
+                columns and return plain rows instead of ORM instances.
+
+        Returns:
+            list: JobListing instances, or rows when `columns` is given.
+        """
+        stmt = page_statement(after_id, limit, filters, columns)
+        result = self.db.execute(stmt)
+        return list(result.all() if columns else result.scalars().all())
+
     def get_by_id(self, job_id: int) -> Optional[JobListing]:
         """
         Find a job listing by its ID.
@@ -37,30 +334,138 @@ class JobRepository:
         """
         return self.db.query(JobListing).filter(JobListing.id == job_id).first()
 
-    def upsert_batch(self, records: Iterable[dict]) -> None:
+    def find_by_job_ids(self, job_ids: Iterable[int]) -> list[JobListing]:
+        """
+        Retrieve the job listings whose LinkedIn job ID is in `job_ids`.
+
+        Args:
+            job_ids (Iterable[int]): LinkedIn job IDs to look up.
+
+        Returns:
+            list[JobListing]: Matching JobListing instances.
+        """
+        ids = list(job_ids)
+        if not ids:
+            return []
+        return self.db.query(JobListing).filter(JobListing.linkedin_id.in_(ids)).all()
+
+    def upsert_batch(self, records: Iterable[dict], mode: Optional[str] = None) -> UpsertResult:
         """
-        Bulk insert or update job listings in a single statement.
-        On conflict of 'job_url', all other columns are updated.
+        Bulk insert or update job listings.
+        On conflict of 'linkedin_id', the other supplied columns are updated only
+        when the listing's content changed; otherwise just last_seen_at is
+        refreshed, at most every LAST_SEEN_RESOLUTION_HOURS.
+
+        Batches of COPY_THRESHOLD rows or more are COPY'd into a temporary
+        staging table and merged with one set-based statement; smaller ones
+        are sent as INSERT ... ON CONFLICT statements of UPSERT_CHUNK_SIZE
+        rows. Either way the whole batch is committed once.
 
         Args:
             records (Iterable[dict]): An iterable of dicts representing job data.
+            mode (Optional[str]): Force "copy" or "statement"; None picks by size.
+
+        Returns:
+            UpsertResult: Inserted, updated, unchanged and refreshed row counts.
         """
-        stmt = insert(JobListing).values(list(records))
+        records, skipped = keyed_records(records)
+        if not records:
+            return UpsertResult(skipped=skipped)
 
-        # Build a dict of columns to update on conflict, excluding 'id'
-        update_columns = {
-            col.name: getattr(stmt.excluded, col.name)
-            for col in JobListing.__table__.columns
-            if col.name != "id"
-        }
+        if mode is None:
+            mode = "copy" if len(records) >= settings.COPY_THRESHOLD else "statement"
 
-        stmt = stmt.on_conflict_do_update(
-            index_elements=["job_url"], set_=update_columns
-        )
+        start = time.perf_counter()
+        if mode == "copy":
+            result = self._copy_merge(records)
+        else:
+            result = UpsertResult()
+            for chunk in chunked(records, settings.UPSERT_CHUNK_SIZE):
+                rows = self.db.execute(upsert_statement(chunk)).all()
+                seen_rows = self.db.execute(seen_statement(chunk)).all()
+                observed_rows = self.db.execute(observation_statement(chunk)).all()
+                result.add(upsert_result(rows, len(chunk), seen_rows, observed_rows))
+        self.db.commit()
+        if changed_rows(result):
+            self._bump_cache_generation()
+        result.skipped = skipped
+        record_upsert(result, mode, time.perf_counter() - start)
+        return result
 
-        self.db.execute(stmt)
+    def _bump_cache_generation(self) -> None:
+        # After the commit: a response built from the old rows in the
+        # meantime is stored under the old generation and never served again
+        self.db.execute(BUMP_CACHE_GENERATION)
         self.db.commit()
 
+    def _copy_merge(self, records: list[dict]) -> UpsertResult:
+        """
+        COPY `records` into a transaction-scoped staging table, then merge it
+        into job_listings in a single INSERT ... SELECT ... ON CONFLICT.
+        Rows whose content did not change are left untouched and counted;
+        stale ones get last_seen_at refreshed by a second set-based UPDATE.
+        """
+        columns = [
+            col.name for col in JobListing.__table__.columns
+            if col.name != "id" and col.name in records[0]
+        ]
+        column_list = ", ".join(columns)
+        updates = [name for name in columns if name != "linkedin_id"]
+
+        buffer = io.StringIO()
+        for record in records:
+            buffer.write(",".join(_copy_value(record.get(name)) for name in columns))
+            buffer.write("\n")
+        buffer.seek(0)
+
+        connection = self.db.connection()
+        connection.execute(text(
+            "CREATE TEMP TABLE job_listings_stage ON COMMIT DROP AS "
+            f"SELECT {column_list} FROM job_listings WITH NO DATA"
+        ))
+        cursor = connection.connection.dbapi_connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY job_listings_stage ({column_list}) FROM STDIN WITH (FORMAT csv)",
+                buffer,
+            )
+        finally:
+            cursor.close()
+
+        set_clause = ", ".join(
+            [f"{name} = EXCLUDED.{name}" for name in updates] + ["last_seen_at = now()"]
+        )
+        content = [name for name in CONTENT_COLUMNS if name in columns]
+        current = ", ".join(f"job_listings.{name}" for name in content)
+        incoming = ", ".join(f"EXCLUDED.{name}" for name in content)
+        rows = connection.execute(text(
+            f"INSERT INTO job_listings ({column_list}) "
+            f"SELECT {column_list} FROM job_listings_stage "
+            f"ON CONFLICT (linkedin_id) DO UPDATE SET {set_clause} "
+            f"WHERE ROW({current}) IS DISTINCT FROM ROW({incoming}) "
+            "RETURNING (xmax = 0) AS inserted"
+        )).all()
+
+        # Same UPDATE as seen_statement(), reading the staging table
+        seen_clause = ", ".join(
+            [f"{name} = s.{name}" for name in BOOKKEEPING_COLUMNS if name in columns]
+            + ["last_seen_at = now()"]
+        )
+        seen_rows = connection.execute(text(
+            f"UPDATE job_listings SET {seen_clause} "
+            "FROM job_listings_stage s "
+            "WHERE job_listings.linkedin_id = s.linkedin_id "
+            f"AND {_seen_condition('s', columns)} "
+            "RETURNING job_listings.id"
+        ), {"resolution": timedelta(hours=settings.LAST_SEEN_RESOLUTION_HOURS)}).all()
+
+        observed_rows = []
+        if "applicants" in columns:
+            observed_rows = connection.execute(text(
+                _observation_sql("job_listings_stage v", columns)
+            )).all()
+        return upsert_result(rows, len(records), seen_rows, observed_rows)
+
     def delete(self, job_id: int) -> bool:
         """
         Delete a job listing by its ID.
@@ -76,5 +481,180 @@ class JobRepository:
         )
         if deleted_count:
             self.db.commit()
+            self._bump_cache_generation()
+            return True
+        return False
+
+
+class AsyncJobRepository:
+
+    def __init__(self, db: AsyncSession) -> None:
+        """
+        Initialize the repository with an async database session.
+
+        Args:
+            db (AsyncSession): SQLAlchemy async session.
+        """
+        self.db = db
+
+    async def list_page(
+        self,
+        after_id: Optional[int],
+        limit: int,
+        filters: Optional[JobFilters] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> list:
+        """
+        Retrieve one page of job listings ordered by id (keyset pagination).
+
+        Args:
+            after_id (Optional[int]): Only rows with an id greater than this.
+            limit (int): Maximum number of rows to return.
+            filters (Optional[JobFilters]): Optional column filters.
+            columns (Optional[Sequence[str]]): If given, select only these
+                columns and return plain rows instead of ORM instances.
+
+        Returns:
+            list: JobListing instances, or rows when `columns` is given.
+        """
+        stmt = page_statement(after_id, limit, filters, columns)
+        result = await self.db.execute(stmt)
+        return list(result.all() if columns else result.scalars().all())
+
+    async def trigram_available(self) -> bool:
+        """
+        Tell whether pg_trgm is installed, checked once per process.
+
+        Returns:
+            bool: True if fuzzy search can be used.
+        """
+        global _trigram_available
+        if _trigram_available is None:
+            _trigram_available = bool(await self.db.scalar(text(
+                "SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')"
+            )))
+        return _trigram_available
+
+    async def search(
+        self, q: str, limit: int, offset: int, fuzzy: bool, columns: Sequence[str]
+    ) -> list:
+        """
+        Retrieve job listings matching a search query, best match first.
+
+        Args:
+            q (str): Web-search style query (quoted phrases, OR, -word).
+            limit (int): Maximum number of rows to return.
+            offset (int): Rows to skip.
+            fuzzy (bool): Also match near spellings (ignored without pg_trgm).
+            columns (Sequence[str]): Columns to select; `score` is appended.
+
+        Returns:
+            list: Rows of `columns` + score.
+        """
+        fuzzy = fuzzy and await self.trigram_available()
+        if fuzzy:
+            await self.db.execute(
+                text("SELECT set_config('pg_trgm.word_similarity_threshold', :threshold, true)"),
+                {"threshold": str(settings.SEARCH_FUZZY_THRESHOLD)},
+            )
+        result = await self.db.execute(search_statement(q, limit, offset, fuzzy, columns))
+        return list(result.all())
+
+    async def stream_rows(
+        self, columns: Sequence[str], chunk_size: int = 1000
+    ) -> AsyncIterator[list]:
+        """
+        Stream every job listing ordered by id through a server-side cursor.
+
+        Args:
+            columns (Sequence[str]): Columns to select.
+            chunk_size (int): Rows fetched from the cursor per chunk.
+
+        Yields:
+            list: Chunks of at most `chunk_size` plain rows.
+        """
+        stmt = (
+            select(*(JobListing.__table__.c[name] for name in columns))
+            .order_by(JobListing.id)
+            .execution_options(yield_per=chunk_size)
+        )
+        result = await self.db.stream(stmt)
+        async for partition in result.partitions(chunk_size):
+            yield partition
+
+    async def get_by_id(self, job_id: int) -> Optional[JobListing]:
+        """
+        Find a job listing by its ID.
+
+        Args:
+            job_id (int): The ID of the job listing to retrieve.
+
+        Returns:
+            Optional[JobListing]: The JobListing if found, else None.
+        """
+        return await self.db.get(JobListing, job_id)
+
+    async def get_row_by_id(self, job_id: int, columns: Sequence[str]) -> Optional[tuple]:
+        """
+        Select `columns` of one job listing as a plain row, without the ORM.
+
+        Args:
+            job_id (int): The ID of the job listing to retrieve.
+            columns (Sequence[str]): Column names to select.
+
+        Returns:
+            Optional[tuple]: The row if found, else None.
+        """
+        stmt = select(*(JobListing.__table__.c[name] for name in columns))
+        result = await self.db.execute(stmt.where(JobListing.id == job_id))
+        return result.first()
+
+    async def upsert_batch(self, records: Iterable[dict]) -> UpsertResult:
+        """
+        Bulk insert or update job listings in UPSERT_CHUNK_SIZE statements.
+        On conflict of 'linkedin_id', the other supplied columns are updated only
+        when the listing's content changed; otherwise just last_seen_at is
+        refreshed, at most every LAST_SEEN_RESOLUTION_HOURS.
+
+        Args:
+            records (Iterable[dict]): An iterable of dicts representing job data.
+
+        Returns:
+            UpsertResult: Inserted, updated, unchanged and refreshed row counts.
+        """
+        records, skipped = keyed_records(records)
+        result = UpsertResult(skipped=skipped)
+        if not records:
+            return result
+        start = time.perf_counter()
+        for chunk in chunked(records, settings.UPSERT_CHUNK_SIZE):
+            rows = (await self.db.execute(upsert_statement(chunk))).all()
+            seen_rows = (await self.db.execute(seen_statement(chunk))).all()
+            observed_rows = (await self.db.execute(observation_statement(chunk))).all()
+            result.add(upsert_result(rows, len(chunk), seen_rows, observed_rows))
+        await self.db.commit()
+        if changed_rows(result):
+            await self._bump_cache_generation()
+        record_upsert(result, "statement", time.perf_counter() - start)
+        return result
+
+    async def _bump_cache_generation(self) -> None:
+        await self.db.execute(BUMP_CACHE_GENERATION)
+        await self.db.commit()
+
+    async def delete(self, job_id: int) -> bool:
+        """
+        Delete a job listing by its ID.
+
+        Args:
+            job_id (int): The ID of the job listing to delete.
+
+        Returns:
+            bool: True if a record was deleted, False otherwise.
+        """
+        result = await self.db.execute(delete(JobListing).where(JobListing.id == job_id))
+        if result.rowcount:
+            await self.db.commit()
+            await self._bump_cache_generation()
             return True
         return False
@@ -0,0 +1,137 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import Select, func, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.models.applicant_observation import ApplicantObservation
+from backend.models.job_listing import JobListing
+
+# date_trunc() units accepted for company series
+BUCKETS = ("hour", "day", "week", "month")
+
+
+def _time_range(stmt: Select, since: Optional[datetime], until: Optional[datetime]) -> Select:
+    if since is not None:
+        stmt = stmt.where(ApplicantObservation.observed_at >= since)
+    if until is not None:
+        stmt = stmt.where(ApplicantObservation.observed_at < until)
+    return stmt
+
+
+class AsyncObservationRepository:
+
+    def __init__(self, db: AsyncSession) -> None:
+        """
+        Initialize the repository with an async database session.
+
+        Args:
+            db (AsyncSession): SQLAlchemy async session.
+        """
+        self.db = db
+
+    async def job_series(
+        self,
+        job_id: int,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: int = 1000,
+    ) -> list[ApplicantObservation]:
+        """
+        Retrieve the latest `limit` applicant observations of one job,
+        oldest first. Served by the unique (job_id, observed_at) index,
+        which covers `applicants`.
+
+        Args:
+            job_id (int): The job listing ID.
+            since (Optional[datetime]): Earliest observed_at (inclusive).
+            until (Optional[datetime]): Latest observed_at (exclusive).
+            limit (int): Maximum number of observations.
+
+        Returns:
+            list[ApplicantObservation]: The observations in time order.
+        """
+        stmt = select(ApplicantObservation).where(ApplicantObservation.job_id == job_id)
+        stmt = _time_range(stmt, since, until)
+        stmt = stmt.order_by(ApplicantObservation.observed_at.desc()).limit(limit)
+        rows = list((await self.db.scalars(stmt)).all())
+        rows.reverse()
+        return rows
+
+    async def job_growth(
+        self,
+        job_id: int,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Optional[int]:
+        """
+        Applicants gained between the first and last observation of one job
+        in the range, however many observations lie between them. Two
+        index lookups, one from each end.
+
+        Args:
+            job_id (int): The job listing ID.
+            since (Optional[datetime]): Earliest observed_at (inclusive).
+            until (Optional[datetime]): Latest observed_at (exclusive).
+
+        Returns:
+            Optional[int]: The growth, or None without observations.
+        """
+        def end(order) -> Select:
+            stmt = select(ApplicantObservation.applicants).where(
+                ApplicantObservation.job_id == job_id
+            )
+            return _time_range(stmt, since, until).order_by(order).limit(1)
+
+        first = end(ApplicantObservation.observed_at).scalar_subquery()
+        last = end(ApplicantObservation.observed_at.desc()).scalar_subquery()
+        return await self.db.scalar(select(last - first))
+
+    async def company_series(
+        self,
+        company: str,
+        bucket: str = "day",
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> list:
+        """
+        Aggregate the applicant observations of a company's jobs per time bucket.
+
+        Each job contributes its highest count within the bucket; `jobs` is
+        the number of listings observed in it.
+
+        Args:
+            company (str): Exact company name.
+            bucket (str): date_trunc() unit, one of BUCKETS.
+            since (Optional[datetime]): Earliest observed_at (inclusive).
+            until (Optional[datetime]): Latest observed_at (exclusive).
+
+        Returns:
+            list: Rows of (bucket, jobs, applicants), oldest bucket first.
+        """
+        if bucket not in BUCKETS:
+            raise ValueError(f"Unknown bucket: {bucket}")
+        # Inlined rather than bound: the GROUP BY must repeat the exact
+        # same expression, which a second bind parameter would not be
+        start = func.date_trunc(literal_column(f"'{bucket}'"), ApplicantObservation.observed_at)
+
+        per_job = (
+            select(
+                start.label("bucket"),
+                ApplicantObservation.job_id,
+                func.max(ApplicantObservation.applicants).label("applicants"),
+            )
+            .join(JobListing, JobListing.id == ApplicantObservation.job_id)
+            .where(JobListing.company == company)
+        )
+        per_job = _time_range(per_job, since, until)
+        per_job = per_job.group_by(start, ApplicantObservation.job_id).subquery()
+
+        stmt = (
+            select(
+                per_job.c.bucket,
+                func.count().label("jobs"),
+                func.sum(per_job.c.applicants).label("applicants"),
+            )
+            .group_by(per_job.c.bucket)
+            .order_by(per_job.c.bucket)
+        )
+        return list((await self.db.execute(stmt)).all())
@@ -0,0 +1,168 @@
+from typing import Optional
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+
+class RateLimitRepository:
+    """
+    Token buckets in scrape_rate_limits, shared by every scraper process.
+    Each method is a single statement on the bucket's row, so concurrent
+    processes serialize on its row lock; times come from clock_timestamp()
+    so every process uses the database clock.
+
+    Methods do not commit; callers commit right away to release the row.
+    """
+
+    def __init__(self, db: Session) -> None:
+        """
+        Initialize the repository with a database session.
+
+        Args:
+            db (Session): SQLAlchemy session.
+        """
+        self.db = db
+
+    def ensure(self, name: str, rate: float, burst: float) -> None:
+        """
+        Create the bucket with a full burst if it does not exist yet. An
+        existing bucket keeps the rate it has learned.
+
+        Args:
+            name (str): Bucket name.
+            rate (float): Initial requests per second.
+            burst (float): Initial tokens.
+        """
+        self.db.execute(text(
+            "INSERT INTO scrape_rate_limits (name, rate, tokens, updated_at, backoff_until) "
+            "VALUES (:name, :rate, :burst, clock_timestamp(), clock_timestamp()) "
+            "ON CONFLICT (name) DO NOTHING"
+        ), {"name": name, "rate": rate, "burst": burst})
+
+    def take(self, name: str, burst: float) -> tuple[float, int]:
+        """
+        Reserve one token. Tokens refill at the bucket's rate up to `burst`,
+        never during a backoff; a negative balance queues the request.
+
+        Args:
+            name (str): Bucket name.
+            burst (float): Maximum tokens.
+
+        Returns:
+            tuple[float, int]: Seconds to wait before sending the request,
+                and the bucket's throttle count when it was reserved.
+        """
+        row = self.db.execute(text(
+            "WITH c AS (SELECT clock_timestamp() AS now_ts) "
+            "UPDATE scrape_rate_limits l SET "
+            "tokens = least(CAST(:burst AS float8), l.tokens + l.rate * greatest(0, extract(epoch FROM "
+            "  greatest(c.now_ts, l.backoff_until) - l.updated_at))) - 1, "
+            "updated_at = greatest(l.updated_at, c.now_ts, l.backoff_until) "
+            "FROM c WHERE l.name = :name "
+            "RETURNING extract(epoch FROM greatest(c.now_ts, l.backoff_until) - c.now_ts) "
+            "  + greatest(0, -l.tokens) / l.rate AS wait, l.throttles"
+        ), {"name": name, "burst": burst}).one()
+        return float(row.wait), row.throttles
+
+    def throttles(self, name: str) -> int:
+        """
+        Return the bucket's throttle count.
+
+        Args:
+            name (str): Bucket name.
+
+        Returns:
+            int: Throttles recorded so far.
+        """
+        return self.db.execute(text(
+            "SELECT throttles FROM scrape_rate_limits WHERE name = :name"
+        ), {"name": name}).scalar_one()
+
+    def succeed(self, name: str, increase: float, max_rate: float) -> float:
+        """
+        Raise the rate additively after a healthy response and reset the
+        throttle streak.
+
+        Args:
+            name (str): Bucket name.
+            increase (float): Requests per second added.
+            max_rate (float): Rate ceiling.
+
+        Returns:
+            float: The new rate.
+        """
+        return self.db.execute(text(
+            "UPDATE scrape_rate_limits SET "
+            "rate = least(CAST(:max_rate AS float8), rate + :increase), streak = 0 "
+            "WHERE name = :name RETURNING rate"
+        ), {"name": name, "increase": increase, "max_rate": max_rate}).scalar_one()
+
+    def throttle(
+        self,
+        name: str,
+        decrease: float,
+        min_rate: float,
+        backoff: float,
+        backoff_max: float,
+    ) -> Optional[tuple[float, float]]:
+        """
+        Cut the rate multiplicatively and stop every request for
+        `backoff` * 2^streak seconds (at most `backoff_max`). Throttles
+        reported while a backoff is running are responses to requests sent
+        before it and change nothing.
+
+        Args:
+            name (str): Bucket name.
+            decrease (float): Factor applied to the rate.
+            min_rate (float): Rate floor.
+            backoff (float): Backoff of the first throttle in a streak.
+            backoff_max (float): Backoff ceiling.
+
+        Returns:
+            Optional[tuple[float, float]]: (new rate, backoff seconds), or
+                None if a backoff was already running.
+        """
+        row = self.db.execute(text(
+            "WITH c AS (SELECT clock_timestamp() AS now_ts) "
+            "UPDATE scrape_rate_limits l SET "
+            "rate = greatest(CAST(:min_rate AS float8), l.rate * :decrease), "
+            "streak = l.streak + 1, throttles = l.throttles + 1, "
+            "backoff_until = c.now_ts + make_interval(secs => "
+            "  least(CAST(:backoff_max AS float8), :backoff * 2 ^ l.streak)), "
+            # The first request after the backoff goes out at once, the rest
+            # follow at the reduced rate
+            "tokens = 1, updated_at = c.now_ts + make_interval(secs => "
+            "  least(CAST(:backoff_max AS float8), :backoff * 2 ^ l.streak)) "
+            "FROM c WHERE l.name = :name AND l.backoff_until <= c.now_ts "
+            "RETURNING l.rate, extract(epoch FROM l.backoff_until - c.now_ts) AS backoff"
+        ), {
+            "name": name, "decrease": decrease, "min_rate": min_rate,
+            "backoff": backoff, "backoff_max": backoff_max,
+        }).first()
+        if row is None:
+            return None
+        return row.rate, float(row.backoff)
+
+    def state(self, name: str) -> Optional[dict]:
+        """
+        Read the bucket's current rate and remaining backoff.
+
+        Args:
+            name (str): Bucket name.
+
+        Returns:
+            Optional[dict]: rate, backoff_remaining, streak and throttles,
+                or None if the bucket does not exist.
+        """
+        row = self.db.execute(text(
+            "SELECT rate, streak, throttles, greatest(0, extract(epoch FROM "
+            "  backoff_until - clock_timestamp())) AS backoff_remaining "
+            "FROM scrape_rate_limits WHERE name = :name"
+        ), {"name": name}).first()
+        if row is None:
+            return None
+        return {
+            "rate": row.rate,
+            "backoff_remaining": float(row.backoff_remaining),
+            "streak": row.streak,
+            "throttles": row.throttles,
+        }
@@ -0,0 +1,204 @@
+from collections.abc import Iterable, Sequence
+from datetime import timedelta
+from typing import Optional
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from backend.models.scrape_task import TASK_KINDS, ScrapeTask
+
+
+class TaskRepository:
+    """
+    Postgres work queue of scrape tasks. Workers claim tasks with
+    FOR UPDATE SKIP LOCKED under a lease; a task whose lease runs out (a
+    crashed or stuck worker) is claimed again by someone else.
+
+    Except for claim(), methods do not commit, so a task's outcome is
+    committed together with the rows it produced.
+    """
+
+    def __init__(self, db: Session) -> None:
+        """
+        Initialize the repository with a database session.
+
+        Args:
+            db (Session): SQLAlchemy session.
+        """
+        self.db = db
+
+    def enqueue(self, run: str, kind: str, tasks: Iterable[tuple[str, dict]]) -> int:
+        """
+        Add tasks to a run, skipping keys the run already has.
+
+        Args:
+            run (str): Run the tasks belong to.
+            kind (str): One of TASK_KINDS.
+            tasks (Iterable[tuple[str, dict]]): (task_key, payload) pairs.
+
+        Returns:
+            int: Number of tasks actually added.
+        """
+        values = [
+            {"run": run, "kind": kind, "task_key": key, "payload": payload}
+            for key, payload in tasks
+        ]
+        if not values:
+            return 0
+        stmt = (
+            insert(ScrapeTask)
+            .values(values)
+            .on_conflict_do_nothing(index_elements=["run", "task_key"])
+            .returning(ScrapeTask.id)
+        )
+        return len(self.db.execute(stmt).all())
+
+    def claim(
+        self,
+        worker: str,
+        limit: int,
+        lease: timedelta,
+        max_attempts: int,
+        kinds: Sequence[str] = TASK_KINDS,
+    ) -> list:
+        """
+        Lease up to `limit` claimable tasks to `worker` and commit.
+
+        Claimable tasks are pending ones whose run_after has passed and
+        running ones whose lease expired. Expired tasks that already used
+        `max_attempts` are marked failed instead.
+
+        Args:
+            worker (str): Name recorded on the claimed tasks.
+            limit (int): Maximum tasks to claim.
+            lease (timedelta): How long the tasks stay leased.
+            max_attempts (int): Attempts before a task fails for good.
+            kinds (Sequence[str]): Task kinds this worker handles.
+
+        Returns:
+            list: Rows with id, run, kind, task_key, payload and attempts.
+        """
+        self.db.execute(text(
+            "UPDATE scrape_tasks SET status = 'failed', finished_at = now(), "
+            "last_error = coalesce(last_error, 'lease expired') "
+            "WHERE status = 'running' AND lease_until < now() AND attempts >= :max_attempts"
+        ), {"max_attempts": max_attempts})
+        rows = self.db.execute(text(
+            "UPDATE scrape_tasks t SET status = 'running', attempts = t.attempts + 1, "
+            "worker = :worker, lease_until = now() + :lease "
+            "FROM ("
+            "  SELECT id FROM scrape_tasks "
+            "  WHERE status IN ('pending', 'running') AND run_after <= now() "
+            "  AND (status = 'pending' OR lease_until < now()) "
+            "  AND kind = ANY(:kinds) "
+            "  ORDER BY run_after, id "
+            "  LIMIT :limit FOR UPDATE SKIP LOCKED"
+            ") claimable "
+            "WHERE t.id = claimable.id "
+            "RETURNING t.id, t.run, t.kind, t.task_key, t.payload, t.attempts"
+        ), {"worker": worker, "lease": lease, "kinds": list(kinds), "limit": limit}).all()
+        self.db.commit()
+        return sorted(rows, key=lambda row: row.id)
+
+    def complete(self, task_id: int, attempts: int) -> bool:
+        """
+        Mark a claimed task done.
+
+        Args:
+            task_id (int): Task ID.
+            attempts (int): Attempt number returned by claim(); if the task
+                was claimed again since, this worker no longer owns it.
+
+        Returns:
+            bool: False if the lease was lost and nothing was updated.
+        """
+        result = self.db.execute(text(
+            "UPDATE scrape_tasks SET status = 'done', finished_at = now(), "
+            "lease_until = NULL, last_error = NULL "
+            "WHERE id = :id AND attempts = :attempts AND status = 'running'"
+        ), {"id": task_id, "attempts": attempts})
+        return bool(result.rowcount)
+
+    def extend(self, task_id: int, attempts: int, lease: timedelta) -> bool:
+        """
+        Renew the lease of a task this worker is still running.
+
+        Args:
+            task_id (int): Task ID.
+            attempts (int): Attempt number returned by claim().
+            lease (timedelta): New lease, from now.
+
+        Returns:
+            bool: False if the task is no longer this worker's.
+        """
+        result = self.db.execute(text(
+            "UPDATE scrape_tasks SET lease_until = now() + :lease "
+            "WHERE id = :id AND attempts = :attempts AND status = 'running'"
+        ), {"id": task_id, "attempts": attempts, "lease": lease})
+        return bool(result.rowcount)
+
+    def retry(
+        self, task_id: int, attempts: int, error: str, delay: timedelta, max_attempts: int
+    ) -> bool:
+        """
+        Put a claimed task back after a failure, to be retried after
+        `delay`, or mark it failed once it used `max_attempts`.
+
+        Args:
+            task_id (int): Task ID.
+            attempts (int): Attempt number returned by claim().
+            error (str): Error message kept on the task.
+            delay (timedelta): Wait before the task may be claimed again.
+            max_attempts (int): Attempts before a task fails for good.
+
+        Returns:
+            bool: True if the task will be retried.
+        """
+        row = self.db.execute(text(
+            "UPDATE scrape_tasks SET "
+            "status = CASE WHEN attempts >= :max_attempts THEN 'failed' ELSE 'pending' END, "
+            "finished_at = CASE WHEN attempts >= :max_attempts THEN now() END, "
+            "run_after = now() + :delay, lease_until = NULL, last_error = :error "
+            "WHERE id = :id AND attempts = :attempts AND status = 'running' "
+            "RETURNING status"
+        ), {
+            "id": task_id, "attempts": attempts, "error": error[:2000],
+            "delay": delay, "max_attempts": max_attempts,
+        }).first()
+        return row is not None and row.status == "pending"
+
+    def has_work(self, run: Optional[str] = None, kinds: Sequence[str] = TASK_KINDS) -> bool:
+        """
+        Tell whether any task is still pending or running.
+
+        Args:
+            run (Optional[str]): Restrict to one run.
+            kinds (Sequence[str]): Task kinds to consider.
+
+        Returns:
+            bool: True while work remains.
+        """
+        return bool(self.db.execute(text(
+            "SELECT EXISTS (SELECT 1 FROM scrape_tasks "
+            "WHERE status IN ('pending', 'running') AND kind = ANY(:kinds) "
+            "AND (CAST(:run AS text) IS NULL OR run = :run))"
+        ), {"run": run, "kinds": list(kinds)}).scalar())
+
+    def counts(self, run: Optional[str] = None) -> dict[str, dict[str, int]]:
+        """
+        Count tasks per kind and status.
+
+        Args:
+            run (Optional[str]): Restrict to one run.
+
+        Returns:
+            dict[str, dict[str, int]]: {kind: {status: count}}.
+        """
+        rows = self.db.execute(text(
+            "SELECT kind, status, count(*) AS n FROM scrape_tasks "
+            "WHERE CAST(:run AS text) IS NULL OR run = :run "
+            "GROUP BY kind, status"
+        ), {"run": run}).all()
+        counts: dict[str, dict[str, int]] = {}
+        for row in rows:
+            counts.setdefault(row.kind, {})[row.status] = row.n
+        return counts
@@ -0,0 +1,92 @@
+from collections.abc import Sequence
+from typing import Optional
+from pydantic import TypeAdapter
+from typing_extensions import TypedDict
+from .job_schema import JobRead
+
+# Plain-dict mirrors of ListResponseModel / ProjectedListResponseModel /
+# SingleResponseModel, generated from JobRead so the fields cannot drift.
+# Column values are serialized as they come from the database: no model
+# instances, no validation, one pass in pydantic-core. job_url is stored
+# already normalized by HttpUrl, so it is dumped as a plain string.
+JobRow = TypedDict(
+    "JobRow",
+    {
+        name: (str if name == "job_url" else field.annotation)
+        for name, field in JobRead.model_fields.items()
+    },
+    total=False,
+)
+
+
+class JobPage(TypedDict):
+    status: str
+    data: list[JobRow]
+    next_cursor: Optional[int]
+
+
+SearchRow = TypedDict(
+    "SearchRow",
+    {**JobRow.__annotations__, "score": float},
+    total=False,
+)
+
+
+class SearchPage(TypedDict):
+    status: str
+    data: list[SearchRow]
+    next_offset: Optional[int]
+
+
+class SingleJob(TypedDict):
+    status: str
+    data: JobRow
+
+
+JOB_PAGE = TypeAdapter(JobPage)
+SINGLE_JOB = TypeAdapter(SingleJob)
+SEARCH_PAGE = TypeAdapter(SearchPage)
+
+
+def page_json(
+    rows: Sequence[tuple],
+    columns: Sequence[str],
+    limit: int,
+    fields: Optional[Sequence[str]] = None,
+) -> bytes:
+    """
+    Serialize `limit + 1` fetched column tuples to a page response body.
+
+    `columns` names the tuple positions (it must include id, used for the
+    next cursor); `fields` is the requested projection, in output order.
+    """
+    # The extra row only tells whether another page exists
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = rows[-1][columns.index("id")] if has_more else None
+
+    names = list(fields) if fields else list(columns)
+    if names == list(columns):
+        data = [dict(zip(names, row)) for row in rows]
+    else:
+        positions = [columns.index(name) for name in names]
+        data = [{name: row[pos] for name, pos in zip(names, positions)} for row in rows]
+    return JOB_PAGE.dump_json({"status": "success", "data": data, "next_cursor": next_cursor})
+
+
+def job_json(row: tuple, columns: Sequence[str]) -> bytes:
+    """
+    Serialize one column tuple to a single-job response body.
+    """
+    return SINGLE_JOB.dump_json({"status": "success", "data": dict(zip(columns, row))})
+
+
+def search_json(rows: Sequence[tuple], columns: Sequence[str], limit: int, offset: int) -> bytes:
+    """
+    Serialize `limit + 1` ranked rows (`columns` + score) to a search response body.
+    """
+    has_more = len(rows) > limit
+    names = [*columns, "score"]
+    data = [dict(zip(names, row)) for row in rows[:limit]]
+    next_offset = offset + limit if has_more else None
+    return SEARCH_PAGE.dump_json({"status": "success", "data": data, "next_offset": next_offset})
@@ -1,5 +1,6 @@
-from datetime import date
-from pydantic import BaseModel, Field, HttpUrl, ConfigDict
+from datetime import date, datetime
+from pydantic import BaseModel, Field, HttpUrl, ConfigDict, field_validator
+from backend.utils.linkedin import canonical_job_url, job_id_from_url
 
 class JobBase(BaseModel):
     title: str = Field(..., min_length=1, max_length=256)
@@ -31,9 +32,108 @@ class JobBase(BaseModel):
 class JobCreate(JobBase):
     """Schema for creating or updating a job listing"""
 
+    @field_validator("job_url")
+    @classmethod
+    def canonical_job_url(cls, value: HttpUrl) -> HttpUrl:
+        # Listings are keyed on the posting ID, so every variant of a
+        # posting's URL is stored as the same canonical URL
+        job_id = job_id_from_url(str(value))
+        if job_id is None:
+            raise ValueError("job_url must contain a LinkedIn job ID")
+        return HttpUrl(canonical_job_url(job_id))
+
 class JobRead(JobBase):
     id: int = Field(..., ge=1)
+    linkedin_id: int | None = Field(
+        None,
+        description="Numeric LinkedIn job ID taken from job_url"
+    )
+    last_seen_at: datetime | None = Field(
+        None,
+        description="Last time a scrape or upload saw this listing"
+    )
 
     model_config = ConfigDict(
         from_attributes=True
     )
+
+
+class JobSearchHit(JobRead):
+    score: float = Field(..., description="Relevance; higher is better")
+
+
+class ApplicantObservationRead(BaseModel):
+    """One applicant count read for a job"""
+
+    observed_at: datetime
+    applicants: int
+    days_since_posted: int | None = None
+
+    model_config = ConfigDict(
+        from_attributes=True
+    )
+
+
+class ApplicantSeries(BaseModel):
+    """Applicant history of one job listing"""
+
+    job_id: int
+    points: list[ApplicantObservationRead]
+    growth: int | None = Field(
+        None,
+        description="Applicants gained between the first and last observation"
+    )
+
+
+class CompanyApplicantBucket(BaseModel):
+    """Applicants of a company's listings within one time bucket"""
+
+    bucket: datetime
+    jobs: int = Field(..., description="Listings observed in the bucket")
+    applicants: int = Field(..., description="Sum of each listing's highest count")
+
+
+class CompanyApplicantSeries(BaseModel):
+    """Applicant history of a company's listings"""
+
+    company: str
+    bucket: str
+    points: list[CompanyApplicantBucket]
+    growth: int | None = Field(
+        None,
+        description="Applicants gained between the first and last bucket"
+    )
+
+
+class JobFilters(BaseModel):
+    """Query filters for listing job listings"""
+
+    company: str | None = Field(None, description="Exact company name")
+    location: str | None = Field(None, description="Exact location")
+    posted_from: date | None = Field(None, description="Earliest date_posted (inclusive)")
+    posted_to: date | None = Field(None, description="Latest date_posted (inclusive)")
+    min_applicants: int | None = Field(None, ge=0, description="Minimum applicants")
+    max_applicants: int | None = Field(None, ge=0, description="Maximum applicants")
+
+
+class UpsertResult(BaseModel):
+    """Row counts of a bulk upsert"""
+
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    # Unchanged rows whose last_seen_at was refreshed
+    refreshed: int = 0
+    # Applicant observations appended
+    observed: int = 0
+    # Records dropped because their job_url has no LinkedIn job ID
+    skipped: int = 0
+
+    def add(self, other: "UpsertResult") -> "UpsertResult":
+        self.inserted += other.inserted
+        self.updated += other.updated
+        self.unchanged += other.unchanged
+        self.refreshed += other.refreshed
+        self.observed += other.observed
+        self.skipped += other.skipped
+        return self
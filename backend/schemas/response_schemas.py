@@ -1,6 +1,6 @@
 from pydantic import BaseModel
-from typing import Optional, List
-from .job_schema import JobRead
+from typing import Any, Dict, Optional, List
+from .job_schema import ApplicantSeries, CompanyApplicantSeries, JobRead, JobSearchHit
 
 class ResponseModel(BaseModel):
     status: str = "success"
@@ -10,7 +10,50 @@ class ResponseModel(BaseModel):
 class ListResponseModel(BaseModel):
     status: str = "success"
     data: List[JobRead]
+    next_cursor: Optional[int] = None
+
+class ProjectedListResponseModel(BaseModel):
+    status: str = "success"
+    data: List[Dict[str, Any]]
+    next_cursor: Optional[int] = None
+
+class SearchResponseModel(BaseModel):
+    status: str = "success"
+    data: List[JobSearchHit]
+    next_offset: Optional[int] = None
 
 class SingleResponseModel(BaseModel):
     status: str = "success"
     data: JobRead
+
+class ApplicantSeriesResponseModel(BaseModel):
+    status: str = "success"
+    data: ApplicantSeries
+
+class CompanyApplicantSeriesResponseModel(BaseModel):
+    status: str = "success"
+    data: CompanyApplicantSeries
+
+class IngestChunkResult(BaseModel):
+    chunk: int
+    upserted: int
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    refreshed: int = 0
+    observed: int = 0
+
+class IngestError(BaseModel):
+    line: int
+    error: str
+
+class IngestReport(BaseModel):
+    accepted: int = 0
+    rejected: int = 0
+    chunks: List[IngestChunkResult] = []
+    errors: List[IngestError] = []
+
+class IngestResponseModel(BaseModel):
+    status: str = "success"
+    message: Optional[str] = None
+    data: IngestReport
@@ -4,7 +4,7 @@ import logging
 from datetime import datetime, timedelta
 from argparse import ArgumentParser
 from apscheduler.schedulers.blocking import BlockingScheduler
-from scraping.pipeline import run as run_scrape
+from scraping.pipeline import run_from_file as run_scrape
 from backend.config.config_db import settings
 
 # Configure logger
@@ -77,15 +77,40 @@ def incremental_load(csv_path: str = "dataset_linkedin.csv") -> None:
         logger.error(f"Incremental load failed: {e}")
 
 
-def schedule_tasks() -> None:
+def enqueue_scrape(campaign: str | None = None) -> str:
+    """
+    Enqueue a campaign (defaults to CAMPAIGN_FILE, or the default search)
+    as a new run of the work queue, for `worker` processes to execute.
+    """
+    from scraping.campaign import SearchSpec, load_campaign
+    from scraping.config import settings as scraper_settings
+    from scraping.work_queue import enqueue_campaign
+
+    path = campaign or scraper_settings.CAMPAIGN_FILE
+    specs = load_campaign(path) if path else [SearchSpec(keyword="Python Developer")]
+    return enqueue_campaign(specs)
+
+
+def run_worker(drain: bool = False, kinds: list[str] | None = None, name: str | None = None) -> None:
+    """
+    Run a work-queue worker. Start one per browser, on as many machines
+    as needed; they coordinate through the scrape_tasks table.
+    """
+    from backend.models.scrape_task import TASK_KINDS
+    from scraping.work_queue import QueueWorker
+
+    QueueWorker(name=name, kinds=kinds or TASK_KINDS).run(drain=drain)
+
+
+def schedule_tasks(queue: bool = False) -> None:
     """
     Schedule periodic tasks using APScheduler:
-      - Daily scraping at 01:00
+      - Daily scraping at 01:00 (run here, or enqueued for workers with `queue`)
       - Daily backup at 02:00
       - Daily cleanup at 02:12
     """
     scheduler = BlockingScheduler()
-    scheduler.add_job(run_scrape, "cron", hour=1, minute=0)
+    scheduler.add_job(enqueue_scrape if queue else run_scrape, "cron", hour=1, minute=0)
     scheduler.add_job(backup_db, "cron", hour=10, minute=54)
     scheduler.add_job(cleanup_old_backups, "cron", hour=10, minute=55)
     logger.info("Scheduler started: scrape@01:00, backup@10:54, cleanup@010:55")
@@ -96,30 +121,71 @@ def main() -> None:
     """
     CLI entry point. Parses arguments and dispatches to the appropriate function:
       scrape   : Run scraping pipeline immediately
+      enqueue  : Enqueue a campaign run for queue workers
+      worker   : Claim and run queued scrape tasks
       backup   : Perform a full database backup now
       cleanup  : Remove old backup files
       schedule : Start the scheduler loop
     """
     parser = ArgumentParser(
-        description="Automation CLI: scrape, backup, cleanup, schedule"
+        description="Automation CLI: scrape, enqueue, worker, backup, cleanup, schedule"
     )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
-    subparsers.add_parser("scrape", help="Run scraping pipeline now")
+    scrape_parser = subparsers.add_parser("scrape", help="Run scraping pipeline now")
+    scrape_parser.add_argument(
+        "--campaign",
+        default=None,
+        help="JSON file of search specs (defaults to CAMPAIGN_FILE)",
+    )
+    scrape_parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Ignore the journal of an interrupted run and start over",
+    )
+    enqueue_parser = subparsers.add_parser("enqueue", help="Enqueue a campaign run")
+    enqueue_parser.add_argument(
+        "--campaign",
+        default=None,
+        help="JSON file of search specs (defaults to CAMPAIGN_FILE)",
+    )
+    worker_parser = subparsers.add_parser("worker", help="Run a scrape queue worker")
+    worker_parser.add_argument(
+        "--drain",
+        action="store_true",
+        help="Exit once no task is pending or running",
+    )
+    worker_parser.add_argument(
+        "--kind",
+        dest="kinds",
+        action="append",
+        choices=["search", "detail"],
+        help="Only run this kind of task (repeatable; default: all)",
+    )
+    worker_parser.add_argument("--name", default=None, help="Worker name (default: host-pid)")
     subparsers.add_parser("backup", help="Perform a full DB backup")
     subparsers.add_parser("cleanup", help="Cleanup old backups")
-    subparsers.add_parser("schedule", help="Start the APScheduler loop")
+    schedule_parser = subparsers.add_parser("schedule", help="Start the APScheduler loop")
+    schedule_parser.add_argument(
+        "--queue",
+        action="store_true",
+        help="Enqueue the daily scrape for workers instead of running it here",
+    )
 
     args = parser.parse_args()
 
     if args.command == "scrape":
-        run_scrape()
+        run_scrape(args.campaign, fresh=args.fresh)
+    elif args.command == "enqueue":
+        enqueue_scrape(args.campaign)
+    elif args.command == "worker":
+        run_worker(args.drain, args.kinds, args.name)
     elif args.command == "backup":
         backup_db()
     elif args.command == "cleanup":
         cleanup_old_backups()
     elif args.command == "schedule":
-        schedule_tasks()
+        schedule_tasks(args.queue)
     else:
         parser.print_help()
 
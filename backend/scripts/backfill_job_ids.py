@@ -0,0 +1,67 @@
+import logging
+from argparse import ArgumentParser
+from sqlalchemy import text
+from backend.config.config_db import engine, init_db
+from backend.db.job_ids import migrate_job_ids
+
+default_fmt = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+logging.basicConfig(level=logging.INFO, format=default_fmt)
+logger = logging.getLogger("backfill_job_ids")
+
+
+def backfill(batch_size: int = 5000, delete_unparseable: bool = False, dry_run: bool = False) -> None:
+    """
+    Give every job listing its LinkedIn job ID, merge listings that turn
+    out to be the same posting, and retire the job_url unique index.
+
+    Runs in one transaction under an advisory lock, so it can be rerun
+    safely and two runs never interleave.
+    """
+    # init_db would otherwise migrate (and commit) before a dry run
+    init_db(migrate=False)
+    with engine.connect() as conn:
+        transaction = conn.begin()
+        counts = migrate_job_ids(conn, batch_size, delete_unparseable)
+
+        logger.info(
+            f"{counts['parsed']} listings got a job ID, {counts['merged']} duplicates merged "
+            f"({counts['moved']} observations moved), "
+            f"{counts['unparseable']} URLs without a job ID"
+            + (f" ({counts['deleted']} deleted)" if counts["deleted"] else "")
+        )
+        if counts["unparseable"] and not delete_unparseable:
+            logger.warning(
+                "linkedin_id stays nullable until the listings without a job ID are fixed "
+                "or removed (--delete-unparseable)."
+            )
+
+        if dry_run:
+            transaction.rollback()
+            logger.info("Dry run: changes rolled back.")
+        else:
+            transaction.commit()
+            # Cached API responses may show the merged or deleted listings
+            conn.execute(text("SELECT nextval('response_cache_generation')"))
+            conn.commit()
+
+
+def main() -> None:
+    """
+    Migration for databases created before job listings were keyed on the
+    LinkedIn job ID. init_db runs it on startup; run it by hand to preview
+    it (--dry-run) or to delete listings whose URL has no job ID.
+    """
+    parser = ArgumentParser(description="Backfill linkedin_id and merge duplicate listings")
+    parser.add_argument("--batch-size", type=int, default=5000, help="Rows parsed per query")
+    parser.add_argument(
+        "--delete-unparseable",
+        action="store_true",
+        help="Delete listings whose job_url has no job ID",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Report, then roll back")
+    args = parser.parse_args()
+    backfill(args.batch_size, args.delete_unparseable, args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
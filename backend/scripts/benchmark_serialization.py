@@ -0,0 +1,107 @@
+import json
+import time
+from argparse import ArgumentParser
+from datetime import date, datetime, timedelta, timezone
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from backend.models.job_listing import JobListing
+from backend.schemas.job_json import page_json
+from backend.schemas.job_schema import JobRead
+from backend.schemas.response_schemas import ListResponseModel
+from backend.services.job_service import JOB_FIELDS
+
+LIST_RESPONSE = TypeAdapter(ListResponseModel)
+
+
+def _rows(count: int) -> list[tuple]:
+    today = date.today()
+    seen = datetime.now(timezone.utc)
+    values = {
+        "title": lambda i: f"Python Developer {i}",
+        "company": lambda i: f"Company {i % 500}",
+        "location": lambda i: "Nueva York, Estados Unidos",
+        "date_posted": lambda i: today - timedelta(days=i % 90),
+        "days_since_posted": lambda i: i % 90,
+        "applicants": lambda i: i % 300,
+        "job_url": lambda i: f"https://www.linkedin.com/jobs/view/{4200000000 + i}/",
+        "id": lambda i: i + 1,
+        "linkedin_id": lambda i: 4200000000 + i,
+        "last_seen_at": lambda i: seen,
+    }
+    return [tuple(values[name](i) for name in JOB_FIELDS) for i in range(count)]
+
+
+def orm_path(rows: list[tuple]) -> bytes:
+    """
+    The previous read path: ORM instances, JobRead.from_orm per row, then
+    FastAPI's response_model handling (dump, validate again, dump to JSON).
+    """
+    jobs = [JobListing(**dict(zip(JOB_FIELDS, row))) for row in rows]
+    model = ListResponseModel(data=[JobRead.model_validate(job) for job in jobs])
+    validated = LIST_RESPONSE.validate_python(model.model_dump())
+    return json.dumps(LIST_RESPONSE.dump_python(validated, mode="json")).encode()
+
+
+def tuple_path(rows: list[tuple]) -> bytes:
+    return page_json(rows, JOB_FIELDS, len(rows))
+
+
+def _per_row(fn, rows: list[tuple], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(rows)
+        best = min(best, time.perf_counter() - start)
+    return best / len(rows) * 1e6
+
+
+def _database(count: int, repeat: int) -> None:
+    from backend.config.config_db import SessionLocal
+
+    columns = [JobListing.__table__.c[name] for name in JOB_FIELDS]
+    with SessionLocal() as db:
+        def fetch_orm(_):
+            db.expunge_all()
+            return db.scalars(select(JobListing).order_by(JobListing.id).limit(count)).all()
+
+        def fetch_tuples(_):
+            return db.execute(select(*columns).order_by(JobListing.id).limit(count)).all()
+
+        fetched = len(fetch_tuples(None))
+        if not fetched:
+            print("job_listings is empty, skipping the database fetch")
+            return
+        orm = _per_row(fetch_orm, range(fetched), repeat)
+        plain = _per_row(fetch_tuples, range(fetched), repeat)
+    print(f"fetch {fetched} rows   ORM instances {orm:7.2f} us/row   column tuples {plain:7.2f} us/row")
+
+
+def main() -> None:
+    """
+    Measure the per-row cost of serializing a GET /jobs page through ORM
+    instances and pydantic models versus column tuples and job_json.
+
+    With --database the fetch cost (ORM hydration versus plain rows) is
+    measured as well, against DATABASE_URL.
+    """
+    parser = ArgumentParser(description="Per-row cost of the /jobs read paths")
+    parser.add_argument("--rows", type=int, default=1000, help="Rows per page")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs; the best is kept")
+    parser.add_argument("--database", action="store_true", help="Also time the DB fetch")
+    args = parser.parse_args()
+
+    rows = _rows(args.rows)
+    assert json.loads(orm_path(rows)) == json.loads(tuple_path(rows))
+
+    orm = _per_row(orm_path, rows, args.repeat)
+    plain = _per_row(tuple_path, rows, args.repeat)
+    print(
+        f"serialize {args.rows} rows   ORM + models {orm:7.2f} us/row   "
+        f"tuples + TypeAdapter {plain:7.2f} us/row   ({orm / plain:.1f}x)"
+    )
+    if args.database:
+        _database(args.rows, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
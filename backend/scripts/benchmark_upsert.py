@@ -0,0 +1,92 @@
+import random
+import time
+from argparse import ArgumentParser
+from datetime import date, datetime, timedelta, timezone
+from sqlalchemy import delete, text
+from backend.config.config_db import SessionLocal, init_db
+from backend.models.job_listing import JobListing
+from backend.repository.job_repository import JobRepository
+
+
+CHECKED_AT = datetime.now(timezone.utc)
+
+
+# Far above real LinkedIn job IDs, so benchmark rows never collide with them
+FIRST_BENCH_ID = 9_000_000_000_000
+
+
+def _records(first_id: int, count: int, revision: int = 0) -> list[dict]:
+    today = date.today()
+    return [
+        {
+            "title": f"Python Developer {i}",
+            "company": f"Company {i % 500}",
+            "location": "Nueva York, Estados Unidos",
+            "date_posted": today - timedelta(days=i % 90),
+            "days_since_posted": i % 90,
+            # Only every tenth row changes between revisions
+            "applicants": i % 300 + (revision if i % 10 == 0 else 0),
+            "job_url": f"https://www.linkedin.com/jobs/view/{first_id + i}",
+            "linkedin_id": first_id + i,
+            "applicants_checked_at": CHECKED_AT,
+        }
+        for i in range(count)
+    ]
+
+
+def _wal_lsn(repo: JobRepository) -> str:
+    return repo.db.execute(text("SELECT pg_current_wal_lsn()")).scalar()
+
+
+def _timed(repo: JobRepository, records: list[dict], mode: str):
+    lsn = _wal_lsn(repo)
+    start = time.perf_counter()
+    result = repo.upsert_batch(records, mode=mode)
+    elapsed = time.perf_counter() - start
+    wal = repo.db.execute(
+        text("SELECT pg_wal_lsn_diff(pg_current_wal_lsn(), :lsn)"), {"lsn": lsn}
+    ).scalar()
+    repo.db.commit()
+    return elapsed, int(wal), result
+
+
+def main() -> None:
+    """
+    Benchmark the statement and COPY upsert paths against DATABASE_URL.
+
+    For each mode it inserts --rows new listings, re-upserts them with 10%
+    of rows changed, re-upserts the same data once more (nothing changed),
+    and deletes them again. WAL bytes are cluster-wide, so run it on an
+    otherwise idle database. Uses its own range of job IDs,
+    so existing listings are not touched.
+    """
+    parser = ArgumentParser(description="Compare statement vs COPY upserts")
+    parser.add_argument("--rows", type=int, default=50000, help="Rows per run")
+    args = parser.parse_args()
+
+    init_db()
+    for mode in ("statement", "copy"):
+        first_id = FIRST_BENCH_ID + random.randrange(1_000_000) * 1_000_000
+        with SessionLocal() as db:
+            repo = JobRepository(db)
+            try:
+                runs = [
+                    ("insert", _timed(repo, _records(first_id, args.rows), mode)),
+                    ("re-upsert", _timed(repo, _records(first_id, args.rows, revision=1), mode)),
+                    ("repeat", _timed(repo, _records(first_id, args.rows, revision=1), mode)),
+                ]
+            finally:
+                db.execute(delete(JobListing).where(
+                    JobListing.linkedin_id.between(first_id, first_id + args.rows)
+                ))
+                db.commit()
+        for label, (elapsed, wal, result) in runs:
+            print(
+                f"{mode:<9} {label:<9} {args.rows} rows: {elapsed:6.2f}s "
+                f"({args.rows / elapsed:8.0f} rows/s, WAL {wal / 1024 / 1024:7.1f} MiB) "
+                f"{result.model_dump()}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import asyncio
+import statistics
+import time
+from argparse import ArgumentParser
+import httpx
+
+
+async def _worker(
+    client: httpx.AsyncClient,
+    paths: list[str],
+    queue: asyncio.Queue,
+    latencies: list,
+    errors: list,
+) -> None:
+    while True:
+        try:
+            i = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+        start = time.perf_counter()
+        try:
+            response = await client.get(paths[i % len(paths)])
+            if response.status_code >= 500:
+                errors.append(response.status_code)
+        except httpx.HTTPError as e:
+            errors.append(type(e).__name__)
+        latencies.append(time.perf_counter() - start)
+
+
+async def run_load(base_url: str, paths: list[str], requests: int, concurrency: int) -> dict:
+    """
+    Fire `requests` GETs over `paths` with `concurrency` in-flight requests
+    and return throughput and latency percentiles.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    for i in range(requests):
+        queue.put_nowait(i)
+    latencies: list[float] = []
+    errors: list = []
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        start = time.perf_counter()
+        await asyncio.gather(*(
+            _worker(client, paths, queue, latencies, errors) for _ in range(concurrency)
+        ))
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "elapsed": elapsed,
+        "rps": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "max_ms": latencies[-1] * 1000,
+    }
+
+
+def main() -> None:
+    """
+    CLI entry point. Load-tests a running API instance, e.g.:
+
+        python -m backend.scripts.load_test --url http://localhost:8000 \\
+            --path /jobs/1 --path "/jobs/?limit=50" --concurrency 50
+    """
+    parser = ArgumentParser(description="Concurrent GET load test for the jobs API")
+    parser.add_argument("--url", default="http://localhost:8000", help="API base URL")
+    parser.add_argument("--path", action="append", help="Path to request (repeatable)")
+    parser.add_argument("--requests", type=int, default=2000, help="Total requests")
+    parser.add_argument("--concurrency", type=int, default=50, help="In-flight requests")
+    args = parser.parse_args()
+
+    paths = args.path or ["/jobs/?limit=50"]
+    result = asyncio.run(run_load(args.url, paths, args.requests, args.concurrency))
+    print(
+        f"{result['requests']} requests ({result['errors']} errors) in {result['elapsed']:.2f}s: "
+        f"{result['rps']:.1f} req/s, p50 {result['p50_ms']:.1f} ms, "
+        f"p95 {result['p95_ms']:.1f} ms, max {result['max_ms']:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
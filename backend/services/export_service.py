@@ -0,0 +1,124 @@
+import csv
+import io
+import json
+import zlib
+from collections.abc import AsyncIterator
+from datetime import date, datetime
+from typing import Sequence
+from backend.config.config_db import AsyncSessionLocal
+from backend.repository.job_repository import AsyncJobRepository
+from backend.services.job_service import JOB_FIELDS
+from backend.utils.metrics import ROWS_SERIALIZED
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def accepts_gzip(accept_encoding: str | None) -> bool:
+    """
+    Return True if an Accept-Encoding header value allows gzip: listed (or
+    covered by "*") with a q-value above 0, as RFC 9110 defines it.
+    """
+    qualities = {}
+    for entry in (accept_encoding or "").split(","):
+        coding, _, params = entry.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+    for coding in ("gzip", "x-gzip", "*"):
+        if coding in qualities:
+            return qualities[coding] > 0
+    return False
+
+
+def _json_default(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _ndjson_chunk(rows: Sequence, columns: Sequence[str]) -> bytes:
+    return "".join(
+        json.dumps(
+            dict(zip(columns, row)),
+            default=_json_default,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ) + "\n"
+        for row in rows
+    ).encode("utf-8")
+
+
+def _csv_chunk(rows: Sequence, header: Sequence[str] | None = None) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(header)
+    writer.writerows(rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+class ExportService:
+
+    def __init__(self, session_factory=AsyncSessionLocal) -> None:
+        """
+        Initialize the service with an async session factory.
+
+        The export opens its own session: the response body is produced after
+        the request's dependencies have already been closed.
+
+        Args:
+            session_factory: Callable returning an AsyncSession context manager.
+        """
+        self.session_factory = session_factory
+
+    async def export_jobs(
+        self, fmt: str, compress: bool = False, chunk_size: int = 1000
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream every job listing as NDJSON or CSV, chunk by chunk.
+
+        Args:
+            fmt (str): "ndjson" or "csv".
+            compress (bool): Gzip the stream.
+            chunk_size (int): Rows read from the server-side cursor per chunk.
+
+        Yields:
+            bytes: Encoded (and optionally gzipped) chunks of the export.
+        """
+        columns = list(JOB_FIELDS)
+        gzipper = zlib.compressobj(wbits=31) if compress else None
+
+        def encode(payload: bytes) -> bytes:
+            # A sync flush per chunk sends each chunk's rows as they are read
+            # instead of leaving them in zlib's window until the end
+            if gzipper:
+                return gzipper.compress(payload) + gzipper.flush(zlib.Z_SYNC_FLUSH)
+            return payload
+
+        # Sent right away so the client gets its first byte before any query
+        if fmt == "csv":
+            yield encode(_csv_chunk([], header=columns))
+
+        async with self.session_factory() as db:
+            async for rows in AsyncJobRepository(db).stream_rows(columns, chunk_size):
+                if fmt == "csv":
+                    payload = _csv_chunk(rows)
+                else:
+                    payload = _ndjson_chunk(rows, columns)
+                ROWS_SERIALIZED.inc(len(rows), endpoint=f"export_{fmt}")
+                yield encode(payload)
+
+        if gzipper:
+            yield gzipper.flush()
@@ -1,7 +1,111 @@
-from typing import List, Optional
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from backend.repository.job_repository import JobRepository
-from backend.schemas.job_schema import JobCreate, JobRead
+from backend.config.config_db import settings
+from backend.repository.job_repository import AsyncJobRepository, JobRepository
+from backend.repository.observation_repository import AsyncObservationRepository
+from backend.schemas.job_schema import (
+    ApplicantObservationRead,
+    ApplicantSeries,
+    CompanyApplicantBucket,
+    CompanyApplicantSeries,
+    JobCreate,
+    JobFilters,
+    JobRead,
+    UpsertResult,
+)
+from backend.schemas.job_json import job_json, page_json, search_json
+from backend.schemas.response_schemas import IngestChunkResult, IngestError, IngestReport
+from backend.utils.linkedin import job_id_from_url
+from backend.utils.metrics import ROWS_SERIALIZED, SERIALIZE_LATENCY
+from backend.utils.response_cache import response_cache
+
+# Fields that can be requested through the `fields=` projection
+JOB_FIELDS = tuple(JobRead.model_fields)
+
+
+def to_records(jobs_in: List[JobCreate]) -> List[dict]:
+    """
+    Convert validated schemas to upsert records (HttpUrl becomes a plain
+    string) keyed by their LinkedIn job ID.
+    """
+    records = []
+    for job in jobs_in:
+        data = job.model_dump()
+        data["job_url"] = str(data["job_url"])
+        data["linkedin_id"] = job_id_from_url(data["job_url"])
+        records.append(data)
+    return records
+
+
+def _validation_message(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(p) for p in err['loc']) or 'line'}: {err['msg']}"
+        for err in exc.errors()
+    )
+
+
+async def iter_lines(
+    body: AsyncIterator[bytes], max_line_bytes: int = settings.INGEST_MAX_LINE_BYTES
+) -> AsyncIterator[Optional[bytes]]:
+    """
+    Re-split an arbitrary byte stream into lines, scanning each received
+    chunk once. A line longer than `max_line_bytes` is never buffered: the
+    rest of it is skipped up to its newline and it is yielded as None.
+    """
+    buffer = bytearray()
+    # Inside an oversized line, discarding bytes until its newline
+    skipping = False
+    async for data in body:
+        view = memoryview(data)
+        start = 0
+        while (end := data.find(b"\n", start)) >= 0:
+            if skipping or len(buffer) + end - start > max_line_bytes:
+                yield None
+            elif buffer:
+                buffer += view[start:end]
+                yield bytes(buffer)
+            else:
+                yield bytes(view[start:end])
+            buffer.clear()
+            skipping = False
+            start = end + 1
+        if not skipping:
+            if len(buffer) + len(data) - start > max_line_bytes:
+                buffer.clear()
+                skipping = True
+            else:
+                buffer += view[start:]
+    if skipping:
+        yield None
+    elif buffer:
+        yield bytes(buffer)
+
+
+def build_page(
+    rows: List[Any], limit: int, fields: Optional[List[str]] = None
+) -> Tuple[List[Any], Optional[int]]:
+    """
+    Turn `limit + 1` fetched rows into a page and the next cursor.
+    """
+    # The extra row only tells whether another page exists
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = rows[-1].id if has_more else None
+    if fields:
+        data: List[Any] = [{name: getattr(row, name) for name in fields} for row in rows]
+    else:
+        data = [JobRead.model_validate(job) for job in rows]
+    return data, next_cursor
+
+
+def page_columns(fields: Optional[List[str]]) -> Optional[List[str]]:
+    # `id` is always selected, it is needed for the next cursor
+    return list(dict.fromkeys(["id", *fields])) if fields else None
+
 
 class JobService:
 
@@ -14,7 +118,7 @@ class JobService:
         """
         self.repo = JobRepository(db)
 
-    def create_jobs(self, jobs_in: List[JobCreate]) -> None:
+    def create_jobs(self, jobs_in: List[JobCreate]) -> UpsertResult:
         """
         Bulk create or update job listings.
 
@@ -22,13 +126,11 @@ class JobService:
 
         Args:
             jobs_in (List[JobCreate]): List of validated job creation schemas.
+
+        Returns:
+            UpsertResult: Inserted, updated and unchanged row counts.
         """
-        records = []
-        for job in jobs_in:
-            data = job.dict()
-            data["job_url"] = str(data["job_url"])
-            records.append(data)
-        self.repo.upsert_batch(records)
+        return self.repo.upsert_batch(to_records(jobs_in))
 
     def get_jobs(self) -> List[JobRead]:
         """
@@ -38,7 +140,31 @@ class JobService:
             List[JobRead]: List of job reading schemas.
         """
         jobs = self.repo.list_all()
-        return [JobRead.from_orm(job) for job in jobs]
+        return [JobRead.model_validate(job) for job in jobs]
+
+    def get_jobs_page(
+        self,
+        cursor: Optional[int],
+        limit: int,
+        filters: Optional[JobFilters] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Tuple[List[Any], Optional[int]]:
+        """
+        Retrieve one keyset page of job listings.
+
+        Args:
+            cursor (Optional[int]): id of the last row of the previous page.
+            limit (int): Page size.
+            filters (Optional[JobFilters]): Optional column filters.
+            fields (Optional[List[str]]): Optional projection; when given,
+                rows are returned as dicts holding only these fields.
+
+        Returns:
+            Tuple[List[Any], Optional[int]]: The page (JobRead schemas or
+            dicts) and the cursor of the next page, or None on the last page.
+        """
+        rows = self.repo.list_page(cursor, limit + 1, filters, page_columns(fields))
+        return build_page(rows, limit, fields)
 
     def get_job(self, job_id: int) -> Optional[JobRead]:
         """
@@ -51,7 +177,7 @@ class JobService:
             Optional[JobRead]: The job reading schema if found, else None.
         """
         job = self.repo.get_by_id(job_id)
-        return JobRead.from_orm(job) if job else None
+        return JobRead.model_validate(job) if job else None
 
     def delete_job(self, job_id: int) -> bool:
         """
@@ -63,4 +189,248 @@ class JobService:
         Returns:
             bool: True if deletion succeeded, False if no record was found.
         """
-        return self.repo.delete(job_id)
\ No newline at end of file
+        return self.repo.delete(job_id)
+
+
+class AsyncJobService:
+
+    def __init__(self, db: AsyncSession) -> None:
+        """
+        Initialize the service with an async database session.
+
+        Args:
+            db (AsyncSession): SQLAlchemy async database session.
+        """
+        self.repo = AsyncJobRepository(db)
+        self.observations = AsyncObservationRepository(db)
+
+    async def create_jobs(self, jobs_in: List[JobCreate]) -> UpsertResult:
+        """
+        Bulk create or update job listings.
+
+        Args:
+            jobs_in (List[JobCreate]): List of validated job creation schemas.
+
+        Returns:
+            UpsertResult: Inserted, updated and unchanged row counts.
+        """
+        result = await self.repo.upsert_batch(to_records(jobs_in))
+        await response_cache.invalidate()
+        return result
+
+    async def ingest_ndjson(
+        self, body: AsyncIterator[bytes], chunk_size: int = settings.UPSERT_CHUNK_SIZE
+    ) -> IngestReport:
+        """
+        Validate and upsert an NDJSON stream, one chunk at a time.
+
+        Each line is validated as a JobCreate as it arrives; valid lines are
+        upserted every `chunk_size` rows, invalid lines are reported (up to
+        INGEST_MAX_ERRORS) without failing the rest of the request.
+
+        Args:
+            body (AsyncIterator[bytes]): Raw request body stream.
+            chunk_size (int): Valid rows per upsert.
+
+        Returns:
+            IngestReport: Accepted/rejected counts, per-chunk results and errors.
+        """
+        report = IngestReport()
+        # Keyed by job ID: one statement must not touch the same row twice
+        pending: dict[int, dict] = {}
+
+        async def flush() -> None:
+            records = list(pending.values())
+            result = await self.repo.upsert_batch(records)
+            report.chunks.append(IngestChunkResult(
+                chunk=len(report.chunks) + 1, upserted=len(records), **result.model_dump()
+            ))
+            pending.clear()
+
+        line_no = 0
+        async for line in iter_lines(body):
+            line_no += 1
+            if line is None:
+                report.rejected += 1
+                if len(report.errors) < settings.INGEST_MAX_ERRORS:
+                    report.errors.append(IngestError(
+                        line=line_no,
+                        error=f"line: longer than {settings.INGEST_MAX_LINE_BYTES} bytes",
+                    ))
+                continue
+            if not line.strip():
+                continue
+            try:
+                job = JobCreate.model_validate_json(line)
+            except ValidationError as e:
+                report.rejected += 1
+                if len(report.errors) < settings.INGEST_MAX_ERRORS:
+                    report.errors.append(IngestError(line=line_no, error=_validation_message(e)))
+                continue
+
+            record = to_records([job])[0]
+            pending[record["linkedin_id"]] = record
+            report.accepted += 1
+            if len(pending) >= chunk_size:
+                await flush()
+
+        if pending:
+            await flush()
+        if report.accepted:
+            await response_cache.invalidate()
+        return report
+
+    async def get_jobs_page_json(
+        self,
+        cursor: Optional[int],
+        limit: int,
+        filters: Optional[JobFilters] = None,
+        fields: Optional[List[str]] = None,
+    ) -> bytes:
+        """
+        Retrieve one keyset page of job listings as a serialized response body.
+
+        Rows are selected as plain column tuples and dumped straight to JSON
+        (see backend.schemas.job_json); the body has the shape of
+        ListResponseModel, or ProjectedListResponseModel when `fields` is given.
+
+        Args:
+            cursor (Optional[int]): id of the last row of the previous page.
+            limit (int): Page size.
+            filters (Optional[JobFilters]): Optional column filters.
+            fields (Optional[List[str]]): Optional projection.
+
+        Returns:
+            bytes: The JSON response body.
+        """
+        columns = page_columns(fields) or list(JOB_FIELDS)
+        rows = await self.repo.list_page(cursor, limit + 1, filters, columns)
+        with SERIALIZE_LATENCY.time(endpoint="page"):
+            body = page_json(rows, columns, limit, fields)
+        ROWS_SERIALIZED.inc(min(len(rows), limit), endpoint="page")
+        return body
+
+    async def search_jobs_json(
+        self, q: str, limit: int, offset: int = 0, fuzzy: bool = True
+    ) -> bytes:
+        """
+        Search job listings by title, company and location, best match first.
+
+        Args:
+            q (str): Web-search style query.
+            limit (int): Page size.
+            offset (int): Hits to skip (the previous page's next_offset).
+            fuzzy (bool): Also match near spellings when pg_trgm is installed.
+
+        Returns:
+            bytes: A serialized SearchResponseModel body.
+        """
+        rows = await self.repo.search(q, limit + 1, offset, fuzzy, JOB_FIELDS)
+        with SERIALIZE_LATENCY.time(endpoint="search"):
+            body = search_json(rows, JOB_FIELDS, limit, offset)
+        ROWS_SERIALIZED.inc(min(len(rows), limit), endpoint="search")
+        return body
+
+    async def get_job(self, job_id: int) -> Optional[JobRead]:
+        """
+        Retrieve a single job listing by its ID.
+
+        Args:
+            job_id (int): The ID of the job to retrieve.
+
+        Returns:
+            Optional[JobRead]: The job reading schema if found, else None.
+        """
+        job = await self.repo.get_by_id(job_id)
+        return JobRead.model_validate(job) if job else None
+
+    async def get_job_json(self, job_id: int) -> Optional[bytes]:
+        """
+        Retrieve a single job listing as a serialized SingleResponseModel body.
+
+        Args:
+            job_id (int): The ID of the job to retrieve.
+
+        Returns:
+            Optional[bytes]: The JSON response body if found, else None.
+        """
+        row = await self.repo.get_row_by_id(job_id, JOB_FIELDS)
+        if not row:
+            return None
+        ROWS_SERIALIZED.inc(endpoint="job")
+        return job_json(row, JOB_FIELDS)
+
+    async def get_job_applicants(
+        self,
+        job_id: int,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: int = 1000,
+    ) -> Optional[ApplicantSeries]:
+        """
+        Retrieve the applicant history of one job listing: its latest
+        `limit` observations, and the growth over the whole range.
+
+        Args:
+            job_id (int): The ID of the job.
+            since (Optional[datetime]): Earliest observation (inclusive).
+            until (Optional[datetime]): Latest observation (exclusive).
+            limit (int): Maximum number of observations (the latest are kept).
+
+        Returns:
+            Optional[ApplicantSeries]: The series, or None if the job does not exist.
+        """
+        rows = await self.observations.job_series(job_id, since, until, limit)
+        if not rows and not await self.repo.get_by_id(job_id):
+            return None
+        points = [ApplicantObservationRead.model_validate(row) for row in rows]
+        if len(rows) < limit:
+            growth = points[-1].applicants - points[0].applicants if points else None
+        else:
+            # The points are the latest `limit`; growth covers the whole range
+            growth = await self.observations.job_growth(job_id, since, until)
+        return ApplicantSeries(job_id=job_id, points=points, growth=growth)
+
+    async def get_company_applicants(
+        self,
+        company: str,
+        bucket: str = "day",
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> CompanyApplicantSeries:
+        """
+        Retrieve the applicant history of a company's listings per time bucket.
+
+        Args:
+            company (str): Exact company name.
+            bucket (str): Bucket size: hour, day, week or month.
+            since (Optional[datetime]): Earliest observation (inclusive).
+            until (Optional[datetime]): Latest observation (exclusive).
+
+        Returns:
+            CompanyApplicantSeries: One point per bucket with observations.
+        """
+        rows = await self.observations.company_series(company, bucket, since, until)
+        points = [
+            CompanyApplicantBucket(bucket=row.bucket, jobs=row.jobs, applicants=row.applicants)
+            for row in rows
+        ]
+        growth = points[-1].applicants - points[0].applicants if points else None
+        return CompanyApplicantSeries(
+            company=company, bucket=bucket, points=points, growth=growth
+        )
+
+    async def delete_job(self, job_id: int) -> bool:
+        """
+        Delete a job listing by its ID.
+
+        Args:
+            job_id (int): The ID of the job to delete.
+
+        Returns:
+            bool: True if deletion succeeded, False if no record was found.
+        """
+        deleted = await self.repo.delete(job_id)
+        if deleted:
+            await response_cache.invalidate()
+        return deleted
@@ -0,0 +1,44 @@
+import re
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+# The numeric posting ID is the last path segment of a job URL, alone or at
+# the end of a slug: /jobs/view/4218326468 or
+# /jobs/view/python-developer-at-capgemini-4218326468. Guest API and URN
+# forms carry it after jobPosting.
+_VIEW_ID = re.compile(r"/jobs/view/(?:[^/]*-)?(\d+)/?$")
+_POSTING_ID = re.compile(r"jobPosting[:/](\d+)")
+# Search and collection pages point at a posting through a query parameter
+_ID_PARAMS = ("currentJobId", "jobId")
+
+
+def job_id_from_url(url: str) -> Optional[int]:
+    """
+    Extract the numeric LinkedIn job ID from a job URL, slug URL, search URL
+    with currentJobId, or jobPosting URN.
+
+    Args:
+        url (str): Raw URL or URN, with or without tracking parameters.
+
+    Returns:
+        Optional[int]: The job ID, or None if the URL does not name a posting.
+    """
+    parsed = urlparse(url.strip())
+    match = _VIEW_ID.search(parsed.path)
+    if match is None:
+        match = _POSTING_ID.search(parsed.path)
+    if match is not None:
+        return int(match.group(1))
+    query = parse_qs(parsed.query)
+    for name in _ID_PARAMS:
+        value = query.get(name, [""])[0]
+        if value.isdigit():
+            return int(value)
+    return None
+
+
+def canonical_job_url(job_id: int) -> str:
+    """
+    Return the canonical job URL for a LinkedIn job ID.
+    """
+    return f"https://www.linkedin.com/jobs/view/{job_id}"
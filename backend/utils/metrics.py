@@ -0,0 +1,252 @@
+import math
+import threading
+import time
+from collections.abc import Sequence
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple
+
+# Latency buckets in seconds, from a cache hit to a slow page load
+DEFAULT_BUCKETS = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Metric:
+    """A named family of labelled samples"""
+
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(Metric):
+    """Monotonic total per label set"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, help, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return {",".join(key) or "total": value for key, value in self._values.items()}
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                labels = _format_labels(self.labelnames, key)
+                lines.append(f"{self.name}{labels} {_format_value(value)}")
+        return lines
+
+
+class Histogram(Metric):
+    """Bucketed distribution of observed values per label set"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        # Per label set: bucket counts (not cumulative), sum, count
+        self._values: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = next(i for i, bound in enumerate(self.buckets) if value <= bound)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """
+        Observe the duration of the `with` block, even if it raises.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def _quantile(self, counts: List[int], total: int, q: float) -> float:
+        # Upper bound of the bucket holding the q-th observation
+        rank = q * total
+        cumulative = 0
+        for bound, count in zip(self.buckets, counts):
+            cumulative += count
+            if cumulative >= rank:
+                return bound if not math.isinf(bound) else self.buckets[-2]
+        return self.buckets[-2]
+
+    def snapshot(self) -> Dict[str, dict]:
+        with self._lock:
+            result = {}
+            for key, (counts, total, count) in self._values.items():
+                result[",".join(key) or "total"] = {
+                    "count": count,
+                    "sum": round(total, 6),
+                    "mean": round(total / count, 6),
+                    "p50_le": self._quantile(counts, count, 0.5),
+                    "p95_le": self._quantile(counts, count, 0.95),
+                }
+            return result
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        with self._lock:
+            for key, (counts, total, count) in sorted(self._values.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets, counts):
+                    cumulative += bucket_count
+                    labels = _format_labels(
+                        self.labelnames, key, f'le="{_format_value(bound)}"'
+                    )
+                    lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                labels = _format_labels(self.labelnames, key)
+                lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+                lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Process-wide set of metrics, rendered in the Prometheus text format.
+    Dependency-free: only counters and histograms are needed here.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: Metric) -> Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, help, labelnames, buckets))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> Dict[str, dict]:
+        """
+        Every metric with observations, as plain data for a summary file.
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return {metric.name: data for metric in metrics if (data := metric.snapshot())}
+
+
+registry = MetricsRegistry()
+
+# API
+REQUEST_LATENCY = registry.histogram(
+    "http_request_duration_seconds",
+    "API request latency by route template",
+    ("method", "route", "status"),
+)
+DB_POOL_CHECKOUT = registry.histogram(
+    "db_pool_checkout_seconds",
+    "Time spent waiting for a pooled database connection",
+    ("pool",),
+)
+ROWS_SERIALIZED = registry.counter(
+    "rows_serialized_total",
+    "Job listing rows serialized into response bodies",
+    ("endpoint",),
+)
+SERIALIZE_LATENCY = registry.histogram(
+    "serialize_duration_seconds",
+    "Time to serialize a response body from fetched rows",
+    ("endpoint",),
+)
+
+# Shared by the API and the scraper
+DB_UPSERT = registry.histogram(
+    "db_upsert_duration_seconds",
+    "Job listing batch upsert time, including the commit",
+    ("path",),
+)
+DB_UPSERT_ROWS = registry.counter(
+    "db_upsert_rows_total",
+    "Job listing rows upserted, by outcome",
+    ("outcome",),
+)
+
+# Scraper
+SCRAPE_STAGE = registry.histogram(
+    "scrape_stage_duration_seconds",
+    "Scraper time per stage: login, search_load, scroll, parse, detail_fetch, detail_http",
+    ("stage",),
+)
+SCRAPE_PAGES = registry.counter(
+    "scrape_pages_total",
+    "Pages loaded by the scraper, by page type and outcome",
+    ("page", "outcome"),
+)
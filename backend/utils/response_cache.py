@@ -0,0 +1,259 @@
+import hashlib
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Optional
+from sqlalchemy import text
+from backend.config.config_db import async_engine, settings
+from backend.utils.logger import logger
+
+# Bumped by JobRepository after each committed write (see BUMP_CACHE_GENERATION),
+# whatever process made it; NULL until the first one
+_DB_GENERATION = text("SELECT coalesce(pg_sequence_last_value('response_cache_generation'), 0)")
+
+
+class CacheBackend(ABC):
+    """Byte store behind ResponseCache; subclasses may be shared between processes"""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        ...
+
+    @abstractmethod
+    async def clear(self) -> None:
+        ...
+
+    @abstractmethod
+    async def generation(self) -> int:
+        """Write generation of the processes sharing this backend"""
+
+    @abstractmethod
+    async def bump(self) -> None:
+        ...
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process LRU with a per-entry TTL"""
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    async def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    async def generation(self) -> int:
+        return self._generation
+
+    async def bump(self) -> None:
+        with self._lock:
+            self._generation += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisCacheBackend(CacheBackend):
+    """Redis store shared by every API worker; needs the optional `redis` package"""
+
+    def __init__(self, url: str, prefix: str = "jobs-api:") -> None:
+        from redis import asyncio as redis
+
+        self.client = redis.from_url(url)
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[bytes]:
+        try:
+            return await self.client.get(self.prefix + key)
+        except Exception as e:
+            logger.warning(f"Response cache read failed: {e}")
+            return None
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        try:
+            await self.client.set(self.prefix + key, value, px=int(ttl * 1000))
+        except Exception as e:
+            logger.warning(f"Response cache write failed: {e}")
+
+    async def clear(self) -> None:
+        try:
+            keys = [key async for key in self.client.scan_iter(match=self.prefix + "*")]
+            if keys:
+                await self.client.unlink(*keys)
+        except Exception as e:
+            logger.warning(f"Response cache invalidation failed: {e}")
+
+    async def generation(self) -> int:
+        try:
+            return int(await self.client.get(self.prefix + "generation") or 0)
+        except Exception as e:
+            logger.warning(f"Response cache generation read failed: {e}")
+            return 0
+
+    async def bump(self) -> None:
+        try:
+            await self.client.incr(self.prefix + "generation")
+        except Exception as e:
+            logger.warning(f"Response cache invalidation failed: {e}")
+
+
+def etag_for(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Return True if an If-None-Match header value covers `etag`
+    (weak comparison, as RFC 9110 requires for If-None-Match).
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+class ResponseCache:
+    """
+    Serialized JSON responses keyed by path and query, each stored with its
+    ETag. Hit/miss counters are per process.
+
+    Keys carry the write generation read before the response is built, so
+    an entry built from rows older than the last write is never served
+    again, even if it was stored after the write; old entries expire by
+    TTL. API writes bump the backend's generation right after committing.
+    Writes from other processes (the scraper, queue workers) bump a
+    database sequence, polled at most every `poll_interval` seconds.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        ttl: float,
+        enabled: bool = True,
+        poll_interval: float = 5.0,
+    ) -> None:
+        self.backend = backend
+        self.ttl = ttl
+        self.enabled = enabled
+        self.poll_interval = poll_interval
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.invalidations = 0
+        self._db_generation = 0
+        self._polled_at: Optional[float] = None
+
+    async def _poll_db_generation(self) -> int:
+        now = time.monotonic()
+        if self._polled_at is None or now - self._polled_at >= self.poll_interval:
+            # Claimed before awaiting, so concurrent requests do not all poll
+            self._polled_at = now
+            try:
+                async with async_engine.connect() as conn:
+                    self._db_generation = await conn.scalar(_DB_GENERATION)
+            except Exception as e:
+                logger.warning(f"Response cache generation poll failed: {e}")
+        return self._db_generation
+
+    async def generation(self) -> str:
+        """
+        Current write generation, to be read before building a response and
+        passed in its key.
+        """
+        if not self.enabled:
+            return "0"
+        return f"{await self._poll_db_generation()}.{await self.backend.generation()}"
+
+    async def invalidate(self) -> None:
+        """
+        Retire every cached response; called after each committed API write.
+        """
+        self.invalidations += 1
+        if self.enabled:
+            await self.backend.bump()
+
+    async def get(self, key: str) -> Optional[tuple[str, bytes]]:
+        """
+        Return (etag, body) for `key`, or None on a miss.
+        """
+        if not self.enabled:
+            return None
+        value = await self.backend.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        etag, _, body = value.partition(b"\n")
+        return etag.decode(), body
+
+    async def set(self, key: str, body: bytes) -> str:
+        """
+        Store `body` under `key` and return its ETag.
+        """
+        etag = etag_for(body)
+        if self.enabled:
+            await self.backend.set(key, etag.encode() + b"\n" + body, self.ttl)
+        return etag
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "backend": type(self.backend).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            "not_modified": self.not_modified,
+            "db_generation": self._db_generation,
+            "invalidations": self.invalidations,
+        }
+
+
+def _build_backend() -> CacheBackend:
+    if settings.RESPONSE_CACHE_BACKEND == "redis":
+        if not settings.REDIS_URL:
+            logger.warning("RESPONSE_CACHE_BACKEND=redis without REDIS_URL; using memory.")
+        else:
+            try:
+                return RedisCacheBackend(settings.REDIS_URL)
+            except ImportError:
+                logger.warning("redis is not installed; using the in-memory response cache.")
+    return MemoryCacheBackend(settings.RESPONSE_CACHE_MAX_ENTRIES)
+
+
+response_cache = ResponseCache(
+    _build_backend(),
+    ttl=settings.RESPONSE_CACHE_TTL_SECONDS,
+    enabled=settings.RESPONSE_CACHE_ENABLED,
+    poll_interval=settings.RESPONSE_CACHE_POLL_SECONDS,
+)
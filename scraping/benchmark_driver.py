@@ -0,0 +1,56 @@
+"""
+Live benchmark of the full and lean Chrome profiles: loads the same pages
+with each one and compares load time, bytes and requests per page.
+
+    python -m scraping.benchmark_driver --login https://www.linkedin.com/jobs/view/4218326468
+
+Without URLs it loads a public job search. Needs Chrome, and network
+access to the pages.
+"""
+from argparse import ArgumentParser
+from .config import settings
+from .driver import _network_usage, ensure_session, init_driver, navigate
+from .scraper import build_search_url
+from .waits import page_stats
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Compare page cost of the full and lean driver profiles")
+    parser.add_argument("urls", nargs="*", help="Pages to load (default: a job search)")
+    parser.add_argument("--repeat", type=int, default=3, help="Loads per page and profile")
+    parser.add_argument("--login", action="store_true", help="Log in (or reuse the session) first")
+    args = parser.parse_args()
+    urls = args.urls or [build_search_url("Python Developer")]
+    settings.DRIVER_PAGE_METRICS = True
+
+    for profile, lean in (("full", False), ("lean", True)):
+        driver = init_driver(headless=True, lean=lean)
+        try:
+            if args.login:
+                ensure_session(driver)
+            for _ in range(args.repeat):
+                for url in urls:
+                    navigate(driver, url, check=False, label=profile)
+            # Traffic of the last page is only counted when leaving it
+            page_stats.add_traffic(profile, *_network_usage(driver))
+        finally:
+            driver.quit()
+
+    summary = page_stats.summary()
+    for profile in ("full", "lean"):
+        s = summary[profile]
+        print(
+            f"{profile:<5} {s['pages']:3d} pages  load mean {s['mean']:6.2f}s p95 {s['p95']:6.2f}s  "
+            f"{s['bytes_per_page'] / 1024:8.0f} KiB/page  {s['requests_per_page']:5.0f} requests/page  "
+            f"{s['blocked_per_page']:4.0f} blocked/page"
+        )
+    full, lean = summary["full"], summary["lean"]
+    if full["bytes_per_page"]:
+        print(
+            f"lean: {1 - lean['bytes_per_page'] / full['bytes_per_page']:.0%} fewer bytes, "
+            f"{1 - lean['mean'] / full['mean']:.0%} faster loads"
+        )
+
+
+if __name__ == "__main__":
+    main()
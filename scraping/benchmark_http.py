@@ -0,0 +1,135 @@
+"""
+Offline benchmark of the HTTP detail-page client against a local stand-in
+server that serves the job detail fixture with a simulated latency.
+
+First checks how the client handles each kind of response: a parsed count,
+None for a removed posting, and NEEDS_BROWSER for a login wall (which also
+stops the HTTP path for the rest of the run), 429s that outlast the
+retries, other error statuses and markup without the count, with results
+in input order however the responses arrive. Then checks that every page's
+count matches the fixture's and reports pages per second for each
+concurrency. The rate limiter is off: this measures the client, not
+LinkedIn's pacing.
+
+    python -m scraping.benchmark_http --pages 200 --latency 0.3
+"""
+import threading
+import time
+from argparse import ArgumentParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from .config import settings
+from .http_detail import NEEDS_BROWSER, DetailFetcher
+from .parser import parse_applicants
+from .rate_limit import rate_limiter
+
+FIXTURES = Path(__file__).parent / "fixtures"
+# Served for /jobs/view/<id> when id % js_every == 0: a shell whose count
+# is only rendered by JavaScript
+_JS_SHELL = b"<html><body><div id='app'></div><script src='/app.js'></script></body></html>"
+
+
+def _serve(detail_html: bytes, latency: float, js_every: int) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args) -> None:
+            pass
+
+        def _send(self, status: int, body: bytes = b"", location: str = "") -> None:
+            self.send_response(status)
+            if location:
+                self.send_header("Location", location)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:
+            time.sleep(latency)
+            # /<kind>/<id> for the fallback checks (a login wall redirects to
+            # /uas/login), /jobs/view/<id> otherwise
+            kind, job_id = self.path.split("?")[0].strip("/").split("/")[-2:]
+            if kind == "login-wall":
+                self._send(302, location="/uas/login?session_redirect=" + self.path)
+            elif job_id == "login":
+                self._send(200, b"<html><body><form id='login'></form></body></html>")
+            elif kind == "throttled":
+                self._send(429, b"Too Many Requests")
+            elif kind == "error":
+                self._send(500, b"Internal Server Error")
+            elif kind == "gone":
+                self._send(404, b"Not Found")
+            elif kind == "js":
+                self._send(200, _JS_SHELL)
+            else:
+                if kind == "slow":
+                    time.sleep(0.5)
+                needs_js = kind == "view" and js_every and int(job_id) % js_every == 0
+                self._send(200, _JS_SHELL if needs_js else detail_html)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def check_fallbacks(base: str, expected: int) -> None:
+    urls = [f"{base}/{kind}/1" for kind in ("slow", "throttled", "error", "js", "gone", "ok")]
+    counts = DetailFetcher(concurrency=8).fetch_counts(urls)
+    assert counts[0] == expected, f"slow page (answered last) out of order: {counts[0]!r}"
+    assert counts[1] is NEEDS_BROWSER, f"429 after the retries: {counts[1]!r}"
+    assert counts[2] is NEEDS_BROWSER, f"HTTP 500: {counts[2]!r}"
+    assert counts[3] is NEEDS_BROWSER, f"markup without the count: {counts[3]!r}"
+    assert counts[4] is None, f"removed posting: {counts[4]!r}"
+    assert counts[5] == expected, f"parsed page: {counts[5]!r}"
+
+    fetcher = DetailFetcher(concurrency=1)
+    counts = fetcher.fetch_counts([f"{base}/login-wall/1", f"{base}/ok/1"])
+    assert fetcher.session_rejected, "a login redirect should reject the session"
+    # Once rejected, every page goes to the browser without a request
+    assert counts == [NEEDS_BROWSER, NEEDS_BROWSER], f"after a login wall: {counts!r}"
+    print("fallbacks ok: count, 404, 429, 500, JS-only markup, login wall, input order")
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Benchmark the HTTP detail-page client")
+    parser.add_argument("--pages", type=int, default=200, help="Detail pages per run")
+    parser.add_argument("--latency", type=float, default=0.3, help="Server latency in seconds")
+    parser.add_argument(
+        "--concurrency", type=int, nargs="+", default=[1, 8, 32], help="Requests in flight"
+    )
+    parser.add_argument("--js-every", type=int, default=10, help="Every Nth page needs JS (0: none)")
+    args = parser.parse_args()
+
+    detail_html = (FIXTURES / "job_detail.html").read_bytes()
+    expected = parse_applicants(detail_html.decode("utf-8"))
+    server = _serve(detail_html, args.latency, args.js_every)
+    base = f"http://127.0.0.1:{server.server_port}/jobs/view/"
+    urls = [f"{base}{job_id}" for job_id in range(1, args.pages + 1)]
+    rate_limiter.enabled = False
+    settings.APPLICANT_DELAY = 0.05
+
+    try:
+        check_fallbacks(f"http://127.0.0.1:{server.server_port}", expected)
+        for concurrency in args.concurrency:
+            fetcher = DetailFetcher(concurrency)
+            start = time.perf_counter()
+            counts = fetcher.fetch_counts(urls)
+            elapsed = time.perf_counter() - start
+            for job_id, count in enumerate(counts, start=1):
+                needs_js = args.js_every and job_id % args.js_every == 0
+                if needs_js:
+                    assert count is NEEDS_BROWSER, f"page {job_id}: should need the browser"
+                else:
+                    assert count == expected, f"page {job_id}: {count!r} != {expected}"
+            print(
+                f"concurrency {concurrency:3d}: {len(urls) / elapsed:7.1f} pages/s "
+                f"({fetcher.fetched} parsed, {fetcher.fallbacks} to the browser)"
+            )
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
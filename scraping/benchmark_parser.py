@@ -0,0 +1,63 @@
+"""
+Offline benchmark for the parser backends using the saved HTML fixtures.
+
+Checks that every available backend returns exactly the same records as
+the reference `bs4` backend, then times each one.
+
+    python -m scraping.benchmark_parser --cards 1000 --repeat 5
+"""
+import re
+import timeit
+from argparse import ArgumentParser
+from pathlib import Path
+from .parser import BACKENDS, lxml, parse_applicants, parse_cards
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _scale_search_page(html: str, cards: int) -> str:
+    # Repeat the fixture's result list items until the page holds `cards`
+    items = re.findall(r"    <li>\n      <div class=\"base-card.*?\n    </li>", html, re.S)
+    body = "\n".join(items[i % len(items)] for i in range(cards))
+    start = html.index(items[0])
+    end = html.index(items[-1]) + len(items[-1])
+    return html[:start] + body + html[end:]
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Benchmark the card/detail parser backends")
+    parser.add_argument("--cards", type=int, default=500, help="Cards on the synthetic page")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per backend")
+    args = parser.parse_args()
+
+    search_html = _scale_search_page(
+        (FIXTURES / "search_results.html").read_text(encoding="utf-8"), args.cards
+    )
+    detail_html = (FIXTURES / "job_detail.html").read_text(encoding="utf-8")
+    backends = [b for b in BACKENDS if b != "lxml" or lxml is not None]
+
+    reference_cards = parse_cards(search_html, backend="bs4")
+    reference_count = parse_applicants(detail_html, backend="bs4")
+    print(f"{len(reference_cards)} records, {reference_count} applicants (bs4 reference)")
+
+    for backend in backends:
+        cards = parse_cards(search_html, backend=backend)
+        count = parse_applicants(detail_html, backend=backend)
+        assert cards == reference_cards, f"{backend}: card records differ from bs4"
+        assert count == reference_count, f"{backend}: applicant count differs from bs4"
+
+        card_time = min(timeit.repeat(
+            lambda: parse_cards(search_html, backend=backend), number=1, repeat=args.repeat
+        ))
+        detail_time = min(timeit.repeat(
+            lambda: parse_applicants(detail_html, backend=backend), number=20, repeat=args.repeat
+        )) / 20
+        print(
+            f"{backend:<9} cards: {card_time * 1000:8.1f} ms "
+            f"({card_time / len(cards) * 1e6:6.1f} us/card)  "
+            f"detail: {detail_time * 1000:6.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+Offline check of the adaptive rate limiter against a local stand-in
+server that answers HTTP 429 once it gets more than --capacity requests
+in a second.
+
+Checks, for the in-process bucket (and the shared one with --postgres):
+  * refill: a burst goes out at once, then requests queue at the rate;
+  * AIMD: a throttle halves the rate and starts a backoff that doubles
+    with the streak up to its ceiling, throttles during a backoff change
+    nothing, and healthy responses raise the rate and reset the streak;
+  * slowdown: workers hammering the server get mostly 429s with the
+    limiter off, and mostly pages once the throttles slow the limiter down.
+
+    python -m scraping.benchmark_rate_limit --capacity 10 --duration 8
+    python -m scraping.benchmark_rate_limit --postgres   # needs DATABASE_URL
+"""
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from argparse import ArgumentParser
+from collections import Counter, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from .rate_limit import MemoryBucket, PostgresBucket, RateLimiter
+
+
+def _serve(capacity: float) -> tuple[ThreadingHTTPServer, Counter]:
+    # Every request counts towards the window, rejected ones included, so
+    # hammering a throttled server keeps it throttled
+    hits: deque = deque()
+    served: Counter = Counter()
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args) -> None:
+            pass
+
+        def do_GET(self) -> None:
+            now = time.monotonic()
+            with lock:
+                while hits and hits[0] <= now - 1:
+                    hits.popleft()
+                hits.append(now)
+                status = 429 if len(hits) > capacity else 200
+                served[status] += 1
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, served
+
+
+def _approx(actual: float, expected: float, tolerance: float, what: str) -> None:
+    assert abs(actual - expected) <= tolerance, f"{what}: {actual:.3f} != {expected:.3f}"
+
+
+def check_refill(make_bucket) -> None:
+    bucket = make_bucket(rate=20.0, burst=5.0)
+    waits = [bucket.take()[0] for _ in range(25)]
+    assert all(wait <= 0.02 for wait in waits[:5]), f"burst should not wait: {waits[:5]}"
+    # Each request past the burst queues 1/rate behind the previous one
+    for i, wait in enumerate(waits[5:], start=1):
+        _approx(wait, i / 20.0, 0.05, f"wait of request {i + 5}")
+    print(f"  refill: burst of 5 immediate, then {1 / (waits[-1] - waits[-2]):.1f} req/s (rate 20)")
+
+
+def check_aimd(make_bucket) -> None:
+    limiter = RateLimiter(
+        make_bucket(rate=1.0, burst=1.0),
+        min_rate=0.1, max_rate=2.0, increase=0.25, decrease=0.5, backoff=0.2, backoff_max=0.5,
+    )
+
+    def rate() -> float:
+        return limiter.stats()["rate"]
+
+    expected_rate = 1.0
+    for expected_backoff in (0.2, 0.4, 0.5, 0.5):
+        limiter.record_throttle("HTTP 429")
+        expected_rate = max(0.1, expected_rate * 0.5)
+        _approx(rate(), expected_rate, 1e-6, "rate after a throttle")
+        _approx(limiter.max_backoff, expected_backoff, 0.05, "backoff")
+        _approx(limiter.stats()["backoff_remaining"], expected_backoff, 0.05, "backoff remaining")
+        # Responses to requests sent before the backoff change nothing
+        limiter.record_throttle("HTTP 429")
+        _approx(rate(), expected_rate, 1e-6, "rate after a throttle during the backoff")
+        # Nothing goes out until the backoff is over
+        wait, _ = limiter.bucket.take()
+        assert wait >= expected_backoff - 0.05, f"took a token {wait:.3f}s into a backoff"
+        time.sleep(expected_backoff + 0.05)
+    assert limiter.backoffs == 4, f"{limiter.backoffs} backoffs, expected 4"
+    _approx(rate(), 0.1, 1e-6, "rate floor")
+
+    for _ in range(10):
+        limiter.record_success()
+    _approx(rate(), 2.0, 1e-6, "rate ceiling after recovering")
+    # A success ends the streak: the next backoff is the initial one again
+    limiter.record_throttle("HTTP 429")
+    _approx(limiter.stats()["backoff_remaining"], 0.2, 0.05, "backoff after recovering")
+    print("  AIMD: rate 1 -> 0.5 -> 0.25 -> 0.125 -> 0.1 (floor), backoff 0.2 -> 0.4 -> 0.5 (max), "
+          "10 successes -> 2.0 (max), streak reset")
+
+
+def _hammer(url: str, limiter: RateLimiter, workers: int, duration: float) -> Counter:
+    outcomes: Counter = Counter()
+    lock = threading.Lock()
+    stop = time.monotonic() + duration
+
+    def worker() -> None:
+        while time.monotonic() < stop:
+            limiter.acquire()
+            try:
+                urllib.request.urlopen(url, timeout=5).read()
+                status = 200
+            except urllib.error.HTTPError as e:
+                status = e.code
+            if status == 429:
+                limiter.record_throttle("HTTP 429")
+            else:
+                limiter.record_success()
+            with lock:
+                outcomes[status] += 1
+
+    threads = [threading.Thread(target=worker) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+
+def check_slowdown(make_bucket, capacity: float, workers: int, duration: float) -> None:
+    results = {}
+    for enabled in (False, True):
+        # A fresh server: the unpaced run leaves the old one's window full
+        server, _ = _serve(capacity)
+        url = f"http://127.0.0.1:{server.server_port}/jobs/view/1"
+        limiter = RateLimiter(
+            make_bucket(rate=capacity / 2, burst=2.0),
+            min_rate=0.5, max_rate=capacity * 3, increase=0.5, decrease=0.5,
+            backoff=0.5, backoff_max=4.0, enabled=enabled,
+        )
+        try:
+            outcomes = _hammer(url, limiter, workers, duration)
+        finally:
+            server.shutdown()
+        total = sum(outcomes.values())
+        throttled = outcomes[429] / total
+        results[enabled] = (outcomes[200] / duration, throttled)
+        print(
+            f"  limiter {'on ' if enabled else 'off'}: {total:6d} requests, "
+            f"{outcomes[200] / duration:5.1f} pages/s, {throttled:6.1%} throttled"
+            + (f", final rate {limiter.stats()['rate']:.2f} req/s, "
+               f"{limiter.backoffs} backoffs" if enabled else "")
+        )
+    off_ok, off_throttled = results[False]
+    on_ok, on_throttled = results[True]
+    assert off_throttled > 0.5, f"the stub server should throttle the unpaced run ({off_throttled:.0%})"
+    assert on_throttled < 0.2, f"the limiter should avoid most throttles ({on_throttled:.0%})"
+    assert on_ok >= capacity * 0.4, f"the limiter should use the capacity ({on_ok:.1f} pages/s)"
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Check the adaptive rate limiter against a stub server")
+    parser.add_argument("--capacity", type=float, default=10.0, help="Requests/s the server accepts")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent request loops")
+    parser.add_argument("--duration", type=float, default=8.0, help="Seconds per slowdown run")
+    parser.add_argument("--postgres", action="store_true", help="Also check the shared bucket")
+    args = parser.parse_args()
+
+    buckets = {"memory": lambda rate, burst: MemoryBucket(rate, burst)}
+    names = []
+    if args.postgres:
+        def postgres_bucket(rate: float, burst: float) -> PostgresBucket:
+            names.append(f"benchmark-{os.getpid()}-{len(names)}")
+            return PostgresBucket(names[-1], rate, burst)
+
+        buckets["postgres"] = postgres_bucket
+
+    try:
+        for backend, make_bucket in buckets.items():
+            print(f"{backend} bucket")
+            check_refill(make_bucket)
+            check_aimd(make_bucket)
+            check_slowdown(make_bucket, args.capacity, args.workers, args.duration)
+    finally:
+        if names:
+            from sqlalchemy import text
+            from backend.config.config_db import SessionLocal
+
+            with SessionLocal() as db:
+                db.execute(
+                    text("DELETE FROM scrape_rate_limits WHERE name = ANY(:names)"), {"names": names}
+                )
+                db.commit()
+    print("ok")
+
+
+if __name__ == "__main__":
+    main()
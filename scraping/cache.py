@@ -0,0 +1,85 @@
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from backend.config.config_db import SessionLocal
+from backend.repository.job_repository import JobRepository
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ApplicantCache:
+    """
+    TTL cache of applicant counts backed by `job_listings`. A stored count
+    is reused while its `applicants_checked_at` is younger than the TTL for
+    the posting's age, so repeat cards skip the detail-page visit.
+    """
+
+    def __init__(self, session_factory=SessionLocal) -> None:
+        self.session_factory = session_factory
+        self._entries: dict[int, tuple[int, datetime]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def ttl_for(days_since_posted: int | None) -> timedelta:
+        # Fresh postings gain applicants quickly; older ones barely move
+        if days_since_posted is not None and days_since_posted > settings.APPLICANT_CACHE_FRESH_DAYS:
+            return timedelta(hours=settings.APPLICANT_CACHE_STALE_TTL_HOURS)
+        return timedelta(hours=settings.APPLICANT_CACHE_TTL_HOURS)
+
+    def load(self, job_ids: list[int | None]) -> None:
+        """
+        Prefetch the stored counts for `job_ids` in a single query.
+        """
+        with self._lock:
+            missing = [
+                job_id for job_id in job_ids
+                if job_id is not None and job_id not in self._entries
+            ]
+        if not missing:
+            return
+        try:
+            with self.session_factory() as db:
+                rows = JobRepository(db).find_by_job_ids(missing)
+        except Exception as e:
+            logger.warning(f"Caché de aplicantes no disponible: {e}")
+            return
+        with self._lock:
+            for row in rows:
+                if row.applicants is not None and row.applicants_checked_at is not None:
+                    self._entries.setdefault(
+                        row.linkedin_id, (row.applicants, row.applicants_checked_at)
+                    )
+
+    def put(self, job_id: int, applicants: int, checked_at: datetime) -> None:
+        """
+        Store a count fetched during this run, so other searches reuse it.
+        """
+        with self._lock:
+            self._entries[job_id] = (applicants, checked_at)
+
+    def get(self, job_id: int | None, days_since_posted: int | None) -> tuple[int, datetime] | None:
+        """
+        Return `(applicants, checked_at)` if a fresh entry exists, else None.
+        """
+        with self._lock:
+            entry = self._entries.get(job_id)
+            if entry is not None:
+                checked_at = entry[1]
+                if checked_at.tzinfo is None:
+                    checked_at = checked_at.replace(tzinfo=timezone.utc)
+                if datetime.now(timezone.utc) - checked_at < self.ttl_for(days_since_posted):
+                    self.hits += 1
+                    return entry
+            self.misses += 1
+            return None
+
+    def log_summary(self) -> None:
+        total = self.hits + self.misses
+        ratio = self.hits / total if total else 0.0
+        logger.info(
+            f"Caché de aplicantes: {self.hits} aciertos, {self.misses} fallos "
+            f"({ratio:.0%} de visitas evitadas)"
+        )
@@ -0,0 +1,50 @@
+import json
+from pathlib import Path
+from pydantic import BaseModel, Field
+
+
+class SearchSpec(BaseModel):
+    """A single keyword/location search of a campaign."""
+
+    keyword: str = Field(..., min_length=1)
+    location: str | None = None
+    job_limit: int | None = Field(None, ge=1)
+
+    @property
+    def label(self) -> str:
+        return f"{self.keyword} @ {self.location}" if self.location else self.keyword
+
+
+class SpecResult(BaseModel):
+    """Outcome of one search spec within a campaign run."""
+
+    spec: SearchSpec
+    scraped: int = 0
+    written: int = 0
+    duplicates: int = 0
+    resumed: int = 0
+    elapsed: float = 0.0
+    error: str | None = None
+
+
+def load_campaign(path: str) -> list[SearchSpec]:
+    """
+    Load search specs from a JSON file: either a list of specs or an object
+    with a `searches` list. `keywords` x `locations` shorthand entries are
+    expanded into one spec per pair.
+    """
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    entries = data["searches"] if isinstance(data, dict) else data
+
+    specs = []
+    for entry in entries:
+        if "keywords" in entry:
+            locations = entry.get("locations") or [None]
+            for keyword in entry["keywords"]:
+                for location in locations:
+                    specs.append(SearchSpec(
+                        keyword=keyword, location=location, job_limit=entry.get("job_limit")
+                    ))
+        else:
+            specs.append(SearchSpec(**entry))
+    return specs
@@ -8,14 +8,82 @@ class ScraperSettings(BaseSettings):
 
     LINKEDIN_USER: str
     LINKEDIN_PASS: str
+    SESSION_FILE: str | None = ".linkedin_session.json"
     SCRAPE_DELAY: float = 5.0
 
-    SCROLLS: int = 5
+    SCROLLS: int = 20
+    SCROLL_STABLE_ROUNDS: int = 2
     JOB_LIMIT: int = 50
     SCROLL_DELAY: float = 2.0
 
     PAGE_LOAD_TIMEOUT: int = 20
+    # Lean Chrome profile: no images, fonts, media or trackers, eager page
+    # loads and a capped JS heap
+    DRIVER_LEAN: bool = True
+    DRIVER_BLOCKED_URLS: list[str] = [
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+        "*.woff", "*.woff2", "*.ttf", "*.otf",
+        "*.mp4", "*.webm", "*.m3u8", "*.mp3",
+        "*media.licdn.com/dms/image*", "*dms.licdn.com/playlist*",
+        "*px.ads.linkedin.com*", "*linkedin.com/li/track*", "*linkedin.com/sensorCollect*",
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+        "*bat.bing.com*", "*connect.facebook.net*",
+    ]
+    DRIVER_JS_HEAP_MB: int = 512
+    # Log bytes and requests per page type (Chrome performance log)
+    DRIVER_PAGE_METRICS: bool = True
     APPLICANT_RETRIES: int = 2
     APPLICANT_DELAY: float = 2.0
+    DETAIL_WORKERS: int = 3
+    # Detail pages are fetched over plain HTTP first; the browser only loads
+    # the ones whose count is not in the served HTML
+    HTTP_DETAIL_ENABLED: bool = True
+    HTTP_DETAIL_CONCURRENCY: int = 8
+    HTTP_DETAIL_USE_SESSION: bool = True
+    # Detail pages per HTTP batch; each batch's records are emitted (and
+    # journaled) before the next one starts
+    HTTP_DETAIL_BATCH_SIZE: int = 25
+    HTTP_USER_AGENT: str = (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/136.0.0.0 Safari/537.36"
+    )
+    PARSER_BACKEND: str = "bs4"
+
+    APPLICANT_CACHE_ENABLED: bool = True
+    APPLICANT_CACHE_TTL_HOURS: float = 12.0
+    APPLICANT_CACHE_STALE_TTL_HOURS: float = 72.0
+    APPLICANT_CACHE_FRESH_DAYS: int = 7
+
+    DB_BATCH_SIZE: int = 25
+    CSV_OUTPUT: str | None = "dataset_linkedin.csv"
+    # Per-run JSON summary of stage timings and counters; empty to disable
+    METRICS_DIR: str | None = "scrape_metrics"
+
+    CAMPAIGN_FILE: str | None = None
+    CAMPAIGN_CONCURRENCY: int = 2
+
+    JOURNAL_ENABLED: bool = True
+    JOURNAL_DIR: str = ".scrape_journal"
+    JOURNAL_MAX_AGE_HOURS: float = 24.0
+
+    QUEUE_LEASE_SECONDS: float = 300.0
+    QUEUE_MAX_ATTEMPTS: int = 3
+    QUEUE_RETRY_DELAY: float = 60.0
+    QUEUE_BATCH_SIZE: int = 1
+    QUEUE_POLL_SECONDS: float = 5.0
+
+    # Pacing of every page load and scroll, shared by all drivers; "postgres"
+    # shares it with the other scraper processes on the database too
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "memory"
+    RATE_LIMIT_NAME: str = "linkedin"
+    RATE_LIMIT_RATE: float = 1.0
+    RATE_LIMIT_BURST: float = 3.0
+    RATE_LIMIT_MIN_RATE: float = 0.05
+    RATE_LIMIT_MAX_RATE: float = 3.0
+    RATE_LIMIT_INCREASE: float = 0.02
+    RATE_LIMIT_DECREASE: float = 0.5
+    RATE_LIMIT_BACKOFF: float = 30.0
+    RATE_LIMIT_BACKOFF_MAX: float = 900.0
 
 settings = ScraperSettings()
\ No newline at end of file
@@ -1,20 +1,264 @@
+import json
+import logging
+import os
+import threading
+import time
 from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.chrome.options import Options
+from backend.utils.metrics import SCRAPE_PAGES, SCRAPE_STAGE
 from .config import settings
-import time
+from .rate_limit import rate_limiter
+from .waits import page_stats, wait_for_selector, wait_until
+
+logger = logging.getLogger(__name__)
+
+_session_lock = threading.Lock()
+
+# URL fragments LinkedIn redirects to when the session is not authenticated
+_LOGGED_OUT_MARKERS = ("/login", "/authwall", "/checkpoint", "/uas/login")
+# Where LinkedIn sends a logged-in session it considers too fast, and the
+# error pages it serves instead of the requested one
+_THROTTLE_URL_MARKERS = ("/authwall", "/checkpoint")
+_THROTTLE_TEXT_MARKERS = ("HTTP ERROR 429", "HTTP ERROR 999", "Too Many Requests")
+_PAGE_TEXT_JS = (
+    "return document.title + ' ' + (document.body ? document.body.innerText.slice(0, 500) : '');"
+)
 
-def init_driver(headless: bool = True):
+# Chrome switches of the lean profile: no background services, no media,
+# bounded memory per renderer
+_LEAN_ARGUMENTS = (
+    "--blink-settings=imagesEnabled=false",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-notifications",
+    "--disable-features=Translate,MediaRouter,OptimizationHints,AutofillServerCommunication",
+    "--autoplay-policy=user-gesture-required",
+    "--mute-audio",
+    "--no-first-run",
+    "--renderer-process-limit=2",
+)
+_LEAN_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.media_stream": 2,
+    "profile.default_content_setting_values.notifications": 2,
+    "profile.default_content_setting_values.geolocation": 2,
+}
+
+
+def init_driver(headless: bool = True, lean: bool = settings.DRIVER_LEAN):
+    """
+    Start Chrome. The lean profile blocks images, fonts, media and
+    trackers (DRIVER_BLOCKED_URLS), turns off Chrome features a scraper
+    never uses, caps the renderer's JS heap and returns from page loads at
+    DOMContentLoaded: every read waits for its own selector anyway.
+    """
     opts = Options()
-    opts.headless = headless
+    if headless:
+        # The Options.headless attribute is ignored by Selenium 4.10+
+        opts.add_argument("--headless=new")
+    if lean:
+        for argument in _LEAN_ARGUMENTS:
+            opts.add_argument(argument)
+        opts.add_argument(f"--js-flags=--max-old-space-size={settings.DRIVER_JS_HEAP_MB}")
+        opts.add_experimental_option("prefs", _LEAN_PREFS)
+        opts.page_load_strategy = "eager"
+    if settings.DRIVER_PAGE_METRICS:
+        # Network events feed the per-page byte counts of page_stats
+        opts.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        opts.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+
     driver = webdriver.Chrome(options=opts)
     driver.set_page_load_timeout(settings.PAGE_LOAD_TIMEOUT)
+    if lean and settings.DRIVER_BLOCKED_URLS:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": settings.DRIVER_BLOCKED_URLS})
+    driver.page_metrics = settings.DRIVER_PAGE_METRICS
+    driver.page_label = None
     return driver
 
 
+def _network_usage(driver) -> tuple[int, int, int]:
+    """
+    Drain the driver's performance log. Returns the bytes received,
+    requests finished and requests blocked since the last call.
+    """
+    received = finished = blocked = 0
+    for entry in driver.get_log("performance"):
+        message = entry["message"]
+        # Most events are neither; skip parsing them
+        if "Network.loading" not in message:
+            continue
+        event = json.loads(message)["message"]
+        if event["method"] == "Network.loadingFinished":
+            received += int(event["params"].get("encodedDataLength", 0))
+            finished += 1
+        elif event["method"] == "Network.loadingFailed" and event["params"].get("blockedReason"):
+            blocked += 1
+    return received, finished, blocked
+
+
 def linkedin_login(driver):
-    driver.get("https://www.linkedin.com/login")
-    time.sleep(settings.SCRAPE_DELAY)
+    with SCRAPE_STAGE.time(stage="login"):
+        _login(driver)
+
+
+def _login(driver):
+    navigate(driver, "https://www.linkedin.com/login", check=False, label="session")
+    wait_for_selector(driver, "#username", settings.SCRAPE_DELAY, "login_form")
     driver.find_element("id", "username").send_keys(settings.LINKEDIN_USER)
     driver.find_element("id", "password").send_keys(settings.LINKEDIN_PASS)
     driver.find_element("xpath", "//button[@type='submit']").click()
-    time.sleep(settings.SCRAPE_DELAY)
\ No newline at end of file
+    wait_until(
+        driver,
+        lambda d: "/login" not in d.current_url,
+        settings.SCRAPE_DELAY,
+        "login_submit",
+    )
+
+
+def is_alive(driver) -> bool:
+    try:
+        driver.current_url
+        return True
+    except WebDriverException:
+        return False
+
+
+def is_logged_out(driver) -> bool:
+    try:
+        url = driver.current_url
+    except WebDriverException:
+        return False
+    return any(marker in url for marker in _LOGGED_OUT_MARKERS)
+
+
+def throttle_reason(driver) -> str | None:
+    """
+    Tell whether the page just loaded is LinkedIn throttling the session.
+
+    Returns:
+        str | None: The marker found, or None for a normal page.
+    """
+    url = driver.current_url
+    for marker in _THROTTLE_URL_MARKERS:
+        if marker in url:
+            return marker.strip("/")
+    text = driver.execute_script(_PAGE_TEXT_JS) or ""
+    for marker in _THROTTLE_TEXT_MARKERS:
+        if marker in text:
+            return marker
+    return None
+
+
+def navigate(driver, url: str, check: bool = True, label: str = "page") -> str | None:
+    """
+    Load `url` once the shared rate limiter allows it. With `check`, the
+    page feeds the limiter: a throttle page slows every driver down, a
+    normal one lets the rate grow. Session pages (login, feed) skip the
+    check, since their redirects to /login are expected.
+
+    Load time, and with DRIVER_PAGE_METRICS the bytes and requests, are
+    recorded in page_stats under `label`. Traffic a page causes after
+    its load returns is counted when the driver leaves it.
+
+    Returns:
+        str | None: The throttle marker if the page was one, else None.
+    """
+    metrics = getattr(driver, "page_metrics", False)
+    if metrics and driver.page_label is not None:
+        page_stats.add_traffic(driver.page_label, *_network_usage(driver))
+    rate_limiter.acquire()
+    start = time.perf_counter()
+    driver.get(url)
+    elapsed = time.perf_counter() - start
+    page_stats.record(label, elapsed)
+    SCRAPE_STAGE.observe(elapsed, stage=f"{label}_load")
+    if metrics:
+        driver.page_label = label
+        page_stats.add_traffic(label, *_network_usage(driver))
+    if not check:
+        SCRAPE_PAGES.inc(page=label, outcome="loaded")
+        return None
+    reason = throttle_reason(driver)
+    if reason is not None:
+        rate_limiter.record_throttle(reason)
+        SCRAPE_PAGES.inc(page=label, outcome="throttled")
+    elif not is_logged_out(driver):
+        rate_limiter.record_success()
+        SCRAPE_PAGES.inc(page=label, outcome="ok")
+    else:
+        SCRAPE_PAGES.inc(page=label, outcome="logged_out")
+    return reason
+
+
+def save_session(driver) -> None:
+    """
+    Persist the driver's LinkedIn cookies to SESSION_FILE (atomically, so
+    concurrent workers never read a half-written file).
+    """
+    if not settings.SESSION_FILE:
+        return
+    cookies = driver.get_cookies()
+    tmp_path = f"{settings.SESSION_FILE}.{threading.get_ident()}.tmp"
+    with _session_lock:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cookies, f)
+        os.replace(tmp_path, settings.SESSION_FILE)
+
+
+def restore_session(driver) -> bool:
+    """
+    Load saved cookies into the driver. Returns False if there is no
+    usable saved session.
+    """
+    if not settings.SESSION_FILE or not os.path.exists(settings.SESSION_FILE):
+        return False
+    with _session_lock:
+        with open(settings.SESSION_FILE, encoding="utf-8") as f:
+            cookies = json.load(f)
+
+    now = time.time()
+    # Cookies can only be added for the domain currently loaded
+    navigate(driver, "https://www.linkedin.com/", check=False, label="session")
+    restored = 0
+    for cookie in cookies:
+        if cookie.get("expiry") and cookie["expiry"] < now:
+            continue
+        try:
+            driver.add_cookie(cookie)
+            restored += 1
+        except WebDriverException:
+            continue
+    return restored > 0
+
+
+def session_active(driver) -> bool:
+    navigate(driver, "https://www.linkedin.com/feed/", check=False, label="session")
+    wait_until(
+        driver,
+        lambda d: "/feed" in d.current_url or is_logged_out(d),
+        settings.SCRAPE_DELAY,
+        "session_check",
+    )
+    return "/feed" in driver.current_url and not is_logged_out(driver)
+
+
+def ensure_session(driver) -> None:
+    """
+    Reuse the saved session when it is still valid; log in (and save the
+    new session) only when it is missing or expired.
+    """
+    try:
+        if restore_session(driver) and session_active(driver):
+            logger.info("Sesión de LinkedIn reutilizada.")
+            return
+    except (OSError, ValueError, WebDriverException) as e:
+        logger.warning(f"No se pudo restaurar la sesión guardada: {e}")
+
+    logger.info("Sesión expirada o inexistente, iniciando sesión.")
+    linkedin_login(driver)
+    save_session(driver)
@@ -0,0 +1,160 @@
+import asyncio
+import json
+import logging
+import threading
+import time
+import httpx
+from backend.utils.metrics import SCRAPE_PAGES, SCRAPE_STAGE
+from .config import settings
+from .parser import parse_applicants
+from .rate_limit import rate_limiter
+from .waits import page_stats
+
+logger = logging.getLogger(__name__)
+
+# Result for a page the HTTP client could not read; a browser must load it
+NEEDS_BROWSER = object()
+
+_THROTTLE_STATUSES = {429: "HTTP 429", 999: "HTTP 999"}
+_THROTTLE_PATHS = ("/authwall", "/checkpoint")
+_LOGIN_PATHS = ("/login", "/uas/login")
+# The posting was removed; a browser would not find a count either
+_GONE_STATUSES = (404, 410)
+
+
+def _session_cookies() -> httpx.Cookies:
+    """
+    Cookies of the saved LinkedIn session (SESSION_FILE), or none.
+    """
+    cookies = httpx.Cookies()
+    if not settings.HTTP_DETAIL_USE_SESSION or not settings.SESSION_FILE:
+        return cookies
+    try:
+        with open(settings.SESSION_FILE, encoding="utf-8") as f:
+            saved = json.load(f)
+    except (OSError, ValueError):
+        return cookies
+    now = time.time()
+    for cookie in saved:
+        if cookie.get("expiry") and cookie["expiry"] < now:
+            continue
+        cookies.set(
+            cookie["name"], cookie["value"],
+            domain=cookie.get("domain", ""), path=cookie.get("path", "/"),
+        )
+    return cookies
+
+
+class DetailFetcher:
+    """
+    Fetches job detail pages over plain HTTP and parses their applicant
+    count, without a browser. One pooled keep-alive client serves a batch
+    of pages with up to HTTP_DETAIL_CONCURRENCY requests in flight, every
+    one paced by the shared rate limiter.
+
+    A page the client cannot read (no count in the served HTML, the
+    session sent to the login page, repeated errors) comes back as
+    NEEDS_BROWSER for the WebDriver path to load.
+    """
+
+    def __init__(self, concurrency: int = settings.HTTP_DETAIL_CONCURRENCY) -> None:
+        self.concurrency = max(1, concurrency)
+        self._lock = threading.Lock()
+        self.fetched = 0
+        self.fallbacks = 0
+        # Once the cookies are rejected, every page would redirect to /login
+        self.session_rejected = False
+
+    def _client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            cookies=_session_cookies(),
+            headers={
+                "User-Agent": settings.HTTP_USER_AGENT,
+                "Accept": "text/html,application/xhtml+xml",
+                "Accept-Language": "en-US,en;q=0.9",
+            },
+            follow_redirects=True,
+            timeout=settings.PAGE_LOAD_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=self.concurrency, max_keepalive_connections=self.concurrency
+            ),
+        )
+
+    async def _fetch(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, url: str):
+        async with semaphore:
+            for attempt in range(1, settings.APPLICANT_RETRIES + 1):
+                if self.session_rejected:
+                    return NEEDS_BROWSER
+                # The limiter sleeps while it paces; keep the loop free
+                await asyncio.to_thread(rate_limiter.acquire)
+                start = time.perf_counter()
+                try:
+                    response = await client.get(url)
+                except httpx.HTTPError as e:
+                    logger.debug(f"Error HTTP en {url} ({attempt}): {e}")
+                    if attempt < settings.APPLICANT_RETRIES:
+                        await asyncio.sleep(settings.APPLICANT_DELAY * 2 ** (attempt - 1))
+                    continue
+                elapsed = time.perf_counter() - start
+                page_stats.record("detail_http", elapsed)
+                SCRAPE_STAGE.observe(elapsed, stage="detail_http")
+                page_stats.add_traffic("detail_http", len(response.content), 1, 0)
+
+                path = response.url.path
+                reason = _THROTTLE_STATUSES.get(response.status_code) or next(
+                    (marker.strip("/") for marker in _THROTTLE_PATHS if marker in path), None
+                )
+                if reason is not None:
+                    # Retried once the backoff every request honours is over
+                    rate_limiter.record_throttle(reason)
+                    SCRAPE_PAGES.inc(page="detail_http", outcome="throttled")
+                    continue
+                if any(marker in path for marker in _LOGIN_PATHS):
+                    if not self.session_rejected:
+                        logger.info("La sesión no sirve para el cliente HTTP; se usa el navegador.")
+                    self.session_rejected = True
+                    return NEEDS_BROWSER
+                if response.status_code in _GONE_STATUSES:
+                    rate_limiter.record_success()
+                    return None
+                if response.status_code != 200:
+                    if attempt < settings.APPLICANT_RETRIES:
+                        await asyncio.sleep(settings.APPLICANT_DELAY * 2 ** (attempt - 1))
+                    continue
+
+                rate_limiter.record_success()
+                with SCRAPE_STAGE.time(stage="parse"):
+                    count = parse_applicants(response.text)
+                # Without the caption the count is rendered client-side
+                outcome = "needs_browser" if count is None else "ok"
+                SCRAPE_PAGES.inc(page="detail_http", outcome=outcome)
+                return NEEDS_BROWSER if count is None else count
+            return NEEDS_BROWSER
+
+    async def _fetch_all(self, job_urls: list[str]) -> list:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        async with self._client() as client:
+            return await asyncio.gather(*(self._fetch(client, semaphore, url) for url in job_urls))
+
+    def fetch_counts(self, job_urls: list[str]) -> list:
+        """
+        Fetch the applicant counts of `job_urls` concurrently, preserving
+        input order. Each entry is a count, None (the posting is gone) or
+        NEEDS_BROWSER.
+        """
+        if not job_urls:
+            return []
+        results = asyncio.run(self._fetch_all(job_urls))
+        fallbacks = sum(1 for count in results if count is NEEDS_BROWSER)
+        with self._lock:
+            self.fetched += len(results) - fallbacks
+            self.fallbacks += fallbacks
+        return results
+
+    def log_summary(self) -> None:
+        total = self.fetched + self.fallbacks
+        if total:
+            logger.info(
+                f"Cliente HTTP de detalle: {self.fetched}/{total} páginas sin navegador, "
+                f"{self.fallbacks} derivadas al navegador."
+            )
@@ -0,0 +1,146 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from .campaign import SearchSpec
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} no es serializable")
+
+
+def _restore(record: dict) -> dict:
+    checked_at = record.get("applicants_checked_at")
+    if isinstance(checked_at, str):
+        record["applicants_checked_at"] = datetime.fromisoformat(checked_at)
+    return record
+
+
+def campaign_key(specs: list[SearchSpec]) -> str:
+    """
+    Identify a campaign by its search specs, so restarting the same
+    campaign finds the journal of the interrupted run.
+    """
+    payload = json.dumps([spec.model_dump() for spec in specs], sort_keys=True)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class RunJournal:
+    """
+    Append-only JSONL journal of a campaign run. Each search records its
+    parsed cards once the scroll finishes, then every completed card with
+    its applicant count, then a `done` mark. Lines are fsynced as they are
+    written, so after a crash a restarted run replays the finished records
+    and only visits the cards that are left.
+
+    Specs are referred to by their position in the campaign, which the
+    journal file name (a hash of the specs) pins down.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._cards: dict[int, list[dict]] = {}
+        self._records: dict[int, dict[str, dict]] = {}
+        self._done: set[int] = set()
+        self._lock = threading.Lock()
+        self._load()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+        if self._file.tell() and not self.path.read_bytes().endswith(b"\n"):
+            self._file.write("\n")
+
+    @classmethod
+    def for_campaign(
+        cls, specs: list[SearchSpec], directory: str | None = None, fresh: bool = False
+    ) -> "RunJournal":
+        """
+        Open the journal of `specs` in `directory`, discarding it first if
+        `fresh` or if it is older than JOURNAL_MAX_AGE_HOURS.
+        """
+        path = Path(directory or settings.JOURNAL_DIR) / f"campaign-{campaign_key(specs)}.jsonl"
+        if path.exists():
+            age_hours = (time.time() - path.stat().st_mtime) / 3600
+            if fresh or age_hours > settings.JOURNAL_MAX_AGE_HOURS:
+                logger.info(f"Descartando diario previo '{path}' ({age_hours:.1f} h).")
+                path.unlink()
+        return cls(path)
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        with open(self.path, encoding="utf-8") as f:
+            for number, line in enumerate(f, 1):
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # Only the last line can be torn, by a crash mid-write
+                    logger.warning(f"Línea {number} del diario '{self.path}' incompleta, ignorada.")
+                    continue
+                spec = entry["spec"]
+                if entry["event"] == "cards":
+                    self._cards[spec] = entry["cards"]
+                elif entry["event"] == "job":
+                    record = _restore(entry["record"])
+                    self._records.setdefault(spec, {})[record["job_url"]] = record
+                elif entry["event"] == "done":
+                    self._done.add(spec)
+        if self._cards or self._records:
+            logger.info(
+                f"Reanudando desde '{self.path}': {len(self._done)} búsquedas completas, "
+                f"{sum(map(len, self._records.values()))} ofertas ya procesadas."
+            )
+
+    def _append(self, entry: dict) -> None:
+        line = json.dumps(entry, default=_default, ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def cards(self, spec: int) -> list[dict] | None:
+        """
+        Return the cards journaled for search `spec`, or None if its
+        search page has not been scrolled to the end yet.
+        """
+        cards = self._cards.get(spec)
+        return [dict(card) for card in cards] if cards is not None else None
+
+    def records(self, spec: int) -> list[dict]:
+        """
+        Return the completed records of search `spec`.
+        """
+        return list(self._records.get(spec, {}).values())
+
+    def is_done(self, spec: int) -> bool:
+        return spec in self._done
+
+    def record_cards(self, spec: int, cards: list[dict]) -> None:
+        self._cards[spec] = [dict(card) for card in cards]
+        self._append({"event": "cards", "spec": spec, "cards": cards})
+
+    def record_job(self, spec: int, record: dict) -> None:
+        self._records.setdefault(spec, {})[record["job_url"]] = dict(record)
+        self._append({"event": "job", "spec": spec, "record": record})
+
+    def mark_done(self, spec: int) -> None:
+        self._done.add(spec)
+        self._append({"event": "done", "spec": spec})
+
+    def close(self, remove: bool = False) -> None:
+        """
+        Close the file; with `remove`, delete it (the run is complete).
+        """
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+        if remove:
+            self.path.unlink(missing_ok=True)
@@ -0,0 +1,44 @@
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from backend.utils.metrics import registry
+from .config import settings
+from .rate_limit import rate_limiter
+from .waits import page_stats, wait_stats
+
+logger = logging.getLogger(__name__)
+
+
+def write_run_summary(name: str, details: dict) -> str | None:
+    """
+    Write `details` with this process's stage timings, page costs, waits
+    and rate limiter state to METRICS_DIR/<name>.json. Returns the path,
+    or None if METRICS_DIR is unset or the file could not be written.
+    """
+    if not settings.METRICS_DIR:
+        return None
+    try:
+        limiter = rate_limiter.stats()
+    except Exception as e:
+        limiter = {"error": str(e)}
+    summary = {
+        "run": name,
+        "written_at": datetime.now(timezone.utc),
+        **details,
+        "stages": registry.snapshot(),
+        "pages": page_stats.summary(),
+        "waits": wait_stats.summary(),
+        "rate_limiter": limiter,
+    }
+    path = os.path.join(settings.METRICS_DIR, f"{name}.json")
+    try:
+        os.makedirs(settings.METRICS_DIR, exist_ok=True)
+        with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2, default=str)
+        os.replace(f"{path}.tmp", path)
+    except OSError as e:
+        logger.warning(f"No se pudo escribir el resumen de métricas: {e}")
+        return None
+    logger.info(f"Métricas de la ejecución en '{path}'.")
+    return path
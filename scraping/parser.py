@@ -0,0 +1,166 @@
+import logging
+import re
+from datetime import datetime, date
+from bs4 import BeautifulSoup, SoupStrainer
+from .config import settings
+from backend.utils.linkedin import canonical_job_url, job_id_from_url
+from .utils import normalize_job_url
+
+try:
+    import lxml.etree
+    import lxml.html
+except ImportError:  # optional fast backend
+    lxml = None
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("bs4", "strainer", "lxml")
+
+# While parsing, `class` is still the raw attribute string, so the strainers
+# match a whole class token with a regex rather than a plain class name
+_CARD_STRAINER = SoupStrainer("div", class_=re.compile(r"(^|\s)base-search-card(\s|$)"))
+_APPLICANTS_STRAINER = SoupStrainer(
+    "span", class_=re.compile(r"(^|\s)num-applicants__caption(\s|$)")
+)
+
+
+def _has_class(cls: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')"
+
+
+# Compiled once: each card runs five queries, and XPath() skips the
+# per-call compilation of element.xpath(str)
+if lxml is not None:
+    _X_CARD = lxml.etree.XPath(f"//div[{_has_class('base-search-card')}]")
+    _X_LINK = lxml.etree.XPath(f".//a[{_has_class('base-card__full-link')}]")
+    _X_TITLE = lxml.etree.XPath(f".//h3[{_has_class('base-search-card__title')}]")
+    _X_COMPANY = lxml.etree.XPath(f".//h4[{_has_class('base-search-card__subtitle')}]")
+    _X_LOCATION = lxml.etree.XPath(f".//span[{_has_class('job-search-card__location')}]")
+    _X_TIME = lxml.etree.XPath(".//time")
+    _X_TEXT = lxml.etree.XPath(".//text()")
+    _X_APPLICANTS = lxml.etree.XPath(f"//span[{_has_class('num-applicants__caption')}]")
+
+
+def _build_record(href, urn, title, company, location, raw_date) -> dict:
+    days_since = None
+    if raw_date:
+        pub_date = datetime.fromisoformat(raw_date).date()
+        days_since = (date.today() - pub_date).days
+
+    # The card's URN names the posting even when the link is a redirect
+    job_id = job_id_from_url(urn) if urn else None
+    job_url = canonical_job_url(job_id) if job_id else normalize_job_url(href.strip())
+
+    return {
+        "title":             title,
+        "company":           company,
+        "location":          location,
+        "date_posted":       raw_date,
+        "days_since_posted": days_since,
+        "job_url":           job_url,
+        "linkedin_id":       job_id or job_id_from_url(job_url),
+        "applicants":        None,
+        "applicants_checked_at": None,
+    }
+
+
+def _bs4_text(el) -> str:
+    return el.get_text(strip=True) if el else ""
+
+
+def _bs4_card(card) -> dict | None:
+    link_el  = card.select_one("a.base-card__full-link")
+    title_el = card.select_one("h3.base-search-card__title")
+    date_el  = card.select_one("time")
+    if not link_el or not title_el:
+        return None
+
+    raw_date = date_el["datetime"] if date_el and date_el.has_attr("datetime") else None
+    return _build_record(
+        link_el["href"],
+        card.get("data-entity-urn"),
+        _bs4_text(title_el),
+        _bs4_text(card.select_one("h4.base-search-card__subtitle")),
+        _bs4_text(card.select_one("span.job-search-card__location")),
+        raw_date,
+    )
+
+
+def _lxml_text(els) -> str:
+    # Same semantics as bs4's get_text(strip=True): stripped text nodes, joined
+    return "".join(s.strip() for s in _X_TEXT(els[0])) if els else ""
+
+
+def _lxml_card(card) -> dict | None:
+    link_els = _X_LINK(card)
+    title_els = _X_TITLE(card)
+    if not link_els or not title_els:
+        return None
+
+    time_els = _X_TIME(card)
+    raw_date = time_els[0].get("datetime") if time_els else None
+    return _build_record(
+        link_els[0].get("href", ""),
+        card.get("data-entity-urn"),
+        _lxml_text(title_els),
+        _lxml_text(_X_COMPANY(card)),
+        _lxml_text(_X_LOCATION(card)),
+        raw_date,
+    )
+
+
+def _resolve(backend: str | None) -> str:
+    backend = backend or settings.PARSER_BACKEND
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown parser backend '{backend}', expected one of {BACKENDS}")
+    if backend == "lxml" and lxml is None:
+        logger.warning("lxml no está instalado, usando el backend 'strainer'.")
+        return "strainer"
+    return backend
+
+
+def parse_cards(html: str, backend: str | None = None) -> list[dict]:
+    """
+    Extract one record per `div.base-search-card` in `html`, skipping cards
+    without a link or title. Works on a full page or on concatenated cards.
+
+    Backends:
+        bs4      : full BeautifulSoup tree with html.parser (reference)
+        strainer : BeautifulSoup restricted to the card subtrees
+        lxml     : lxml.html with precompiled XPath queries
+    """
+    backend = _resolve(backend)
+    if backend == "lxml":
+        if not html.strip():
+            return []
+        cards = _X_CARD(lxml.html.fromstring(html))
+        parse = _lxml_card
+    else:
+        strainer = _CARD_STRAINER if backend == "strainer" else None
+        soup = BeautifulSoup(html, "html.parser", parse_only=strainer)
+        cards = soup.select("div.base-search-card")
+        parse = _bs4_card
+
+    records = []
+    for card in cards:
+        record = parse(card)
+        if record:
+            records.append(record)
+    return records
+
+
+def parse_applicants(html: str, backend: str | None = None) -> int | None:
+    """
+    Extract the applicant count from a job detail page, or None if absent.
+    """
+    backend = _resolve(backend)
+    if backend == "lxml":
+        els = _X_APPLICANTS(lxml.html.fromstring(html)) if html.strip() else []
+        text = _lxml_text(els)
+    else:
+        strainer = _APPLICANTS_STRAINER if backend == "strainer" else None
+        soup = BeautifulSoup(html, "html.parser", parse_only=strainer)
+        text = _bs4_text(soup.select_one("span.num-applicants__caption"))
+
+    nums = re.findall(r"\d+", text)
+    return int(nums[-1]) if nums else None
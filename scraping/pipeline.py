@@ -1,27 +1,197 @@
 import logging
-from .driver import init_driver, linkedin_login
-from .scraper import scrape_jobs
-from .to_db import load_csv_to_db
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from datetime import datetime, timezone
+from .driver import ensure_session, init_driver
+from .cache import ApplicantCache
+from .campaign import SearchSpec, SpecResult, load_campaign
+from .http_detail import DetailFetcher
+from .journal import RunJournal, campaign_key
+from .metrics import write_run_summary
+from .pool import DriverPool
+from .scraper import iter_jobs, search_cards
+from .sinks import CsvSink, DatabaseSink
 from .config import settings
+from .rate_limit import rate_limiter
+from .waits import page_stats, wait_stats
 
 logger = logging.getLogger(__name__)
 
-def run(keyword: str = "Python Developer"):
-    driver = init_driver(headless=True)
+
+def _scrape_spec(
+    index: int, spec: SearchSpec, pool, cache, fetcher, emit, journal
+) -> SpecResult:
+    result = SpecResult(spec=spec)
+    start = time.perf_counter()
+
+    # Records finished by an interrupted run are written again (the upsert
+    # is idempotent and the CSV is rewritten) instead of being scraped again
+    cards = None
+    if journal is not None:
+        for record in journal.records(index):
+            result.resumed += 1
+            emit(record)
+        if journal.is_done(index):
+            result.elapsed = time.perf_counter() - start
+            return result
+        cards = journal.cards(index)
+        if cards is not None:
+            finished = {record["job_url"] for record in journal.records(index)}
+            cards = [card for card in cards if card["job_url"] not in finished]
+
+    driver = None
+    try:
+        if cards != []:
+            driver = init_driver(headless=True)
+            ensure_session(driver)
+        if cards is None:
+            cards = search_cards(
+                driver, spec.keyword, location=spec.location, limit=spec.job_limit
+            )
+            if journal is not None:
+                journal.record_cards(index, cards)
+        for record in iter_jobs(
+            driver, spec.keyword, pool=pool, cache=cache, cards=cards, fetcher=fetcher
+        ):
+            # Journaled before the sinks: a crash in between replays the
+            # record on restart rather than losing it
+            if journal is not None:
+                journal.record_job(index, record)
+            result.scraped += 1
+            if emit(record):
+                result.written += 1
+            else:
+                result.duplicates += 1
+        if journal is not None:
+            journal.mark_done(index)
+    except Exception as e:
+        result.error = str(e)
+        logger.error(f"Error en la búsqueda '{spec.label}': {e}", exc_info=True)
+    finally:
+        if driver is not None:
+            driver.quit()
+        result.elapsed = time.perf_counter() - start
+    return result
+
+
+def run_campaign(
+    specs: list[SearchSpec],
+    concurrency: int = settings.CAMPAIGN_CONCURRENCY,
+    fresh: bool = False,
+) -> list[SpecResult]:
+    """
+    Run every search spec with at most `concurrency` searches at once.
+    Detail-page drivers and the applicant cache are shared by all searches,
+    and a job seen under several searches is written only once.
+
+    Progress is journaled under JOURNAL_DIR (if JOURNAL_ENABLED), so a rerun
+    of the same campaign after a crash only scrapes what was left; `fresh`
+    discards that journal first. It is deleted once every search has
+    finished without errors.
+    """
+    pool = DriverPool(settings.DETAIL_WORKERS) if settings.DETAIL_WORKERS > 1 else None
+    cache = ApplicantCache() if settings.APPLICANT_CACHE_ENABLED else None
+    fetcher = DetailFetcher() if settings.HTTP_DETAIL_ENABLED else None
+    journal = RunJournal.for_campaign(specs, fresh=fresh) if settings.JOURNAL_ENABLED else None
+    results: list[SpecResult] = []
+    started_at = datetime.now(timezone.utc)
+    start = time.perf_counter()
     try:
-        linkedin_login(driver)
-        df = scrape_jobs(driver, keyword)
-        csv_path = "dataset_linkedin.csv"
-        df.to_csv(csv_path, index=False)
-        logger.info(f"CSV guardado en '{csv_path}' con {len(df)} registros.")
-        load_csv_to_db(csv_path)
-        logger.info("Datos volcados a la base de datos.")
+        # Records stream from the scraper into the sinks; leaving the
+        # ExitStack flushes the last partial batch even if scraping fails
+        with ExitStack() as stack:
+            sinks = [stack.enter_context(DatabaseSink(settings.DB_BATCH_SIZE))]
+            if settings.CSV_OUTPUT:
+                sinks.append(stack.enter_context(CsvSink(settings.CSV_OUTPUT)))
+
+            seen: set[str] = set()
+            lock = threading.Lock()
+
+            def emit(record: dict) -> bool:
+                with lock:
+                    if record["job_url"] in seen:
+                        return False
+                    seen.add(record["job_url"])
+                    for sink in sinks:
+                        sink.write(record)
+                if (
+                    cache is not None
+                    and record["applicants_checked_at"] is not None
+                    and record.get("linkedin_id") is not None
+                ):
+                    cache.put(
+                        record["linkedin_id"], record["applicants"], record["applicants_checked_at"]
+                    )
+                return True
+
+            with ThreadPoolExecutor(
+                max_workers=max(1, concurrency), thread_name_prefix="search"
+            ) as executor:
+                results = list(executor.map(
+                    lambda item: _scrape_spec(*item, pool, cache, fetcher, emit, journal),
+                    enumerate(specs),
+                ))
+
+        for r in results:
+            status = f"error: {r.error}" if r.error else "ok"
+            resumed = f", {r.resumed} recuperados del diario" if r.resumed else ""
+            logger.info(
+                f"Búsqueda '{r.spec.label}': {r.scraped} extraídos, {r.written} nuevos, "
+                f"{r.duplicates} duplicados{resumed} en {r.elapsed:.1f}s ({status})"
+            )
+        logger.info(f"Datos volcados a la base de datos: {sinks[0].written} registros.")
     except Exception as e:
         logger.error(f"Error en pipeline: {e}", exc_info=True)
     finally:
-        driver.quit()
-        logger.info("Driver cerrado.")
+        if journal is not None:
+            complete = len(results) == len(specs) and not any(r.error for r in results)
+            journal.close(remove=complete)
+            if not complete:
+                logger.info(f"Diario conservado en '{journal.path}' para reanudar la campaña.")
+        wait_stats.log_summary()
+        page_stats.log_summary()
+        rate_limiter.log_summary()
+        if cache is not None:
+            cache.log_summary()
+        if fetcher is not None:
+            fetcher.log_summary()
+        if pool is not None:
+            pool.close()
+        logger.info("Drivers cerrados.")
+        write_run_summary(f"run-{campaign_key(specs)}-{started_at:%Y%m%dT%H%M%S}", {
+            "started_at": started_at,
+            "elapsed": round(time.perf_counter() - start, 3),
+            "searches": [r.model_dump(mode="json") for r in results],
+            "applicant_cache": (
+                {"hits": cache.hits, "misses": cache.misses} if cache is not None else None
+            ),
+            "http_detail": (
+                {"fetched": fetcher.fetched, "fallbacks": fetcher.fallbacks}
+                if fetcher is not None else None
+            ),
+        })
+    return results
+
+
+def run(
+    keyword: str = "Python Developer",
+    location: str | None = None,
+    fresh: bool = False,
+) -> list[SpecResult]:
+    return run_campaign(
+        [SearchSpec(keyword=keyword, location=location)], concurrency=1, fresh=fresh
+    )
+
+
+def run_from_file(path: str | None = None, fresh: bool = False) -> list[SpecResult]:
+    path = path or settings.CAMPAIGN_FILE
+    if not path:
+        return run(fresh=fresh)
+    return run_campaign(load_campaign(path), fresh=fresh)
+
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
-    run()
\ No newline at end of file
+    run_from_file()
@@ -0,0 +1,134 @@
+import logging
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from selenium.common.exceptions import WebDriverException
+from .driver import ensure_session, init_driver, is_alive, is_logged_out
+from .utils import get_applicants_count
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class DriverPool:
+    """
+    Bounded pool of logged-in WebDriver workers used to visit job detail
+    pages concurrently. Drivers are created lazily (up to `size`) and a
+    driver that fails is discarded and replaced on the next acquire.
+    """
+
+    def __init__(self, size: int = settings.DETAIL_WORKERS, headless: bool = True) -> None:
+        self.size = max(1, size)
+        self.headless = headless
+        self._idle: list = []
+        self._drivers: list = []
+        # Notified when a driver is released or a slot frees up (discard,
+        # failed spawn), so waiters re-check whether they can spawn
+        self._available = threading.Condition()
+
+    def _spawn(self):
+        driver = init_driver(headless=self.headless)
+        try:
+            ensure_session(driver)
+        except Exception:
+            driver.quit()
+            raise
+        return driver
+
+    def _acquire(self):
+        with self._available:
+            while not self._idle and len(self._drivers) >= self.size:
+                self._available.wait()
+            if self._idle:
+                return self._idle.pop()
+            # Reserve the slot before the (slow) login happens
+            self._drivers.append(None)
+
+        try:
+            driver = self._spawn()
+        except Exception:
+            with self._available:
+                self._drivers.remove(None)
+                self._available.notify()
+            raise
+
+        with self._available:
+            self._drivers[self._drivers.index(None)] = driver
+        return driver
+
+    def _release(self, driver) -> None:
+        with self._available:
+            self._idle.append(driver)
+            self._available.notify()
+
+    def _discard(self, driver) -> None:
+        with self._available:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+            self._available.notify()
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def _fetch(self, job_url: str):
+        for attempt in range(1, settings.APPLICANT_RETRIES + 1):
+            try:
+                driver = self._acquire()
+            except Exception as e:
+                logger.warning(f"No se pudo iniciar un worker ({attempt}): {e}")
+                continue
+
+            # Any failure below, the re-login included, discards the driver
+            # so its slot is freed and a waiting worker can spawn another
+            renewed = False
+            try:
+                count = get_applicants_count(driver, job_url)
+                if count is None and not is_alive(driver):
+                    raise WebDriverException("worker driver is unresponsive")
+                if count is None and is_logged_out(driver):
+                    # Session expired mid-run: log in again and retry
+                    logger.info(f"Sesión expirada en {job_url}, renovando.")
+                    ensure_session(driver)
+                    renewed = True
+            except Exception as e:
+                logger.warning(f"Worker caído en {job_url}, reemplazando: {e}")
+                self._discard(driver)
+                continue
+
+            self._release(driver)
+            if not renewed:
+                return count
+        return None
+
+    def iter_applicants(self, job_urls: list[str]) -> Iterator:
+        """
+        Yield applicant counts for `job_urls` in input order, each one as
+        soon as it (and every count before it) is available.
+        """
+        with ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="detail") as executor:
+            yield from executor.map(self._fetch, job_urls)
+
+    def fetch_applicants(self, job_urls: list[str]) -> list:
+        """
+        Fetch applicant counts for `job_urls`, preserving input order.
+        """
+        return list(self.iter_applicants(job_urls))
+
+    def close(self) -> None:
+        with self._available:
+            drivers = [d for d in self._drivers if d is not None]
+            self._drivers.clear()
+            self._idle.clear()
+            self._available.notify_all()
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
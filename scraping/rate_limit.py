@@ -0,0 +1,278 @@
+import logging
+import threading
+import time
+from collections import defaultdict
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ThrottledError(RuntimeError):
+    """LinkedIn served a throttle page instead of the one requested"""
+
+
+class MemoryBucket:
+    """
+    Token bucket shared by the threads of one process. Same semantics as
+    RateLimitRepository: tokens refill at `rate` up to `burst`, never during
+    a backoff, and a negative balance queues requests behind each other.
+    """
+
+    def __init__(self, rate: float, burst: float) -> None:
+        self.burst = burst
+        self.rate = rate
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._backoff_until = self._updated
+        self._streak = 0
+        self._throttles = 0
+        self._lock = threading.Lock()
+
+    def take(self) -> tuple[float, int]:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._backoff_until)
+            if start > self._updated:
+                self._tokens = min(self.burst, self._tokens + (start - self._updated) * self.rate)
+                self._updated = start
+            self._tokens -= 1
+            return start - now + max(0.0, -self._tokens) / self.rate, self._throttles
+
+    def throttles(self) -> int:
+        with self._lock:
+            return self._throttles
+
+    def succeed(self, increase: float, max_rate: float) -> float:
+        with self._lock:
+            self.rate = min(max_rate, self.rate + increase)
+            self._streak = 0
+            return self.rate
+
+    def throttle(
+        self, decrease: float, min_rate: float, backoff: float, backoff_max: float
+    ) -> tuple[float, float] | None:
+        with self._lock:
+            now = time.monotonic()
+            if self._backoff_until > now:
+                return None
+            backoff = min(backoff_max, backoff * 2 ** self._streak)
+            self.rate = max(min_rate, self.rate * decrease)
+            self._streak += 1
+            self._throttles += 1
+            self._backoff_until = self._updated = now + backoff
+            self._tokens = 1
+            return self.rate, backoff
+
+    def state(self) -> dict:
+        with self._lock:
+            return {
+                "rate": self.rate,
+                "backoff_remaining": max(0.0, self._backoff_until - time.monotonic()),
+                "streak": self._streak,
+                "throttles": self._throttles,
+            }
+
+
+class PostgresBucket:
+    """
+    Token bucket kept in the scrape_rate_limits table, so every scraper
+    process on the database (pipeline runs, queue workers) shares one rate
+    and one backoff. The learned rate survives restarts.
+    """
+
+    def __init__(self, name: str, rate: float, burst: float, session_factory=None) -> None:
+        if session_factory is None:
+            from backend.config.config_db import SessionLocal
+            session_factory = SessionLocal
+        self.name = name
+        self.burst = burst
+        self.session_factory = session_factory
+        self._initial_rate = rate
+        self._ready = False
+
+    def _repository(self, db):
+        from backend.repository.rate_limit_repository import RateLimitRepository
+
+        repository = RateLimitRepository(db)
+        if not self._ready:
+            from sqlalchemy import text
+            from backend.models.scrape_rate_limit import ScrapeRateLimit
+
+            # Processes starting together would race on CREATE TABLE
+            db.execute(text("SELECT pg_advisory_xact_lock(hashtext('scrape_rate_limits'))"))
+            ScrapeRateLimit.__table__.create(bind=db.connection(), checkfirst=True)
+            repository.ensure(self.name, self._initial_rate, self.burst)
+            db.commit()
+            self._ready = True
+        return repository
+
+    def take(self) -> tuple[float, int]:
+        with self.session_factory() as db:
+            result = self._repository(db).take(self.name, self.burst)
+            db.commit()
+        return result
+
+    def throttles(self) -> int:
+        with self.session_factory() as db:
+            return self._repository(db).throttles(self.name)
+
+    def succeed(self, increase: float, max_rate: float) -> float:
+        with self.session_factory() as db:
+            rate = self._repository(db).succeed(self.name, increase, max_rate)
+            db.commit()
+        return rate
+
+    def throttle(
+        self, decrease: float, min_rate: float, backoff: float, backoff_max: float
+    ) -> tuple[float, float] | None:
+        with self.session_factory() as db:
+            result = self._repository(db).throttle(
+                self.name, decrease, min_rate, backoff, backoff_max
+            )
+            db.commit()
+        return result
+
+    def state(self) -> dict:
+        with self.session_factory() as db:
+            return self._repository(db).state(self.name)
+
+
+class RateLimiter:
+    """
+    Paces every request the scraper's browsers send, whatever driver sends
+    it. The rate adapts AIMD-style: each healthy page adds `increase`
+    requests per second up to `max_rate`, and a throttle page (auth wall,
+    checkpoint, HTTP 429/999) multiplies it by `decrease` and pauses all
+    traffic with an exponential backoff.
+
+    If the shared bucket's database is unreachable the limiter falls back
+    to an in-process bucket rather than stopping the scrape.
+    """
+
+    def __init__(
+        self,
+        bucket,
+        min_rate: float = settings.RATE_LIMIT_MIN_RATE,
+        max_rate: float = settings.RATE_LIMIT_MAX_RATE,
+        increase: float = settings.RATE_LIMIT_INCREASE,
+        decrease: float = settings.RATE_LIMIT_DECREASE,
+        backoff: float = settings.RATE_LIMIT_BACKOFF,
+        backoff_max: float = settings.RATE_LIMIT_BACKOFF_MAX,
+        enabled: bool = True,
+    ) -> None:
+        self.bucket = bucket
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.waited = 0.0
+        self.successes = 0
+        self.throttle_reasons: dict[str, int] = defaultdict(int)
+        self.backoffs = 0
+        self.max_backoff = 0.0
+
+    def _call(self, method: str, *args):
+        try:
+            return getattr(self.bucket, method)(*args)
+        except Exception as e:
+            if isinstance(self.bucket, MemoryBucket):
+                raise
+            logger.warning(f"Limitador compartido no disponible, se usa uno local: {e}")
+            self.bucket = MemoryBucket(settings.RATE_LIMIT_RATE, self.bucket.burst)
+            return getattr(self.bucket, method)(*args)
+
+    def acquire(self) -> float:
+        """
+        Block until the next request may be sent. Returns the seconds waited.
+        """
+        if not self.enabled:
+            return 0.0
+        waited = 0.0
+        while True:
+            wait, throttles = self._call("take")
+            if wait <= 0:
+                break
+            time.sleep(wait)
+            waited += wait
+            # A throttle while this request was queued starts a backoff its
+            # reservation did not account for
+            if self._call("throttles") == throttles:
+                break
+        with self._lock:
+            self.requests += 1
+            self.waited += waited
+        return waited
+
+    def record_success(self) -> None:
+        if not self.enabled:
+            return
+        self._call("succeed", self.increase, self.max_rate)
+        with self._lock:
+            self.successes += 1
+
+    def record_throttle(self, reason: str) -> None:
+        if not self.enabled:
+            return
+        result = self._call("throttle", self.decrease, self.min_rate, self.backoff, self.backoff_max)
+        with self._lock:
+            self.throttle_reasons[reason] += 1
+            if result is not None:
+                self.backoffs += 1
+                self.max_backoff = max(self.max_backoff, result[1])
+        if result is not None:
+            rate, backoff = result
+            logger.warning(
+                f"LinkedIn limita las peticiones ({reason}): pausa de {backoff:.0f}s, "
+                f"ritmo reducido a {rate:.2f} pet/s."
+            )
+
+    def stats(self) -> dict:
+        """
+        Current rate and backoff of the (possibly shared) bucket, and this
+        process's request, wait and throttle counters.
+        """
+        state = (self._call("state") or {}) if self.enabled else {}
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "backend": type(self.bucket).__name__,
+                "rate": state.get("rate"),
+                "backoff_remaining": state.get("backoff_remaining", 0.0),
+                "requests": self.requests,
+                "waited_seconds": round(self.waited, 3),
+                "successes": self.successes,
+                "throttles": dict(self.throttle_reasons),
+                "backoffs": self.backoffs,
+                "max_backoff": self.max_backoff,
+            }
+
+    def log_summary(self) -> None:
+        if not self.enabled:
+            return
+        try:
+            s = self.stats()
+        except Exception as e:
+            logger.warning(f"Estado del limitador no disponible: {e}")
+            return
+        throttles = ", ".join(f"{reason}={n}" for reason, n in s["throttles"].items()) or "ninguno"
+        logger.info(
+            f"Limitador: {s['requests']} peticiones, {s['waited_seconds']:.1f}s de espera, "
+            f"ritmo actual {s['rate']:.2f} pet/s, bloqueos: {throttles}, "
+            f"{s['backoffs']} pausas (máx {s['max_backoff']:.0f}s)."
+        )
+
+
+def _build_bucket():
+    if settings.RATE_LIMIT_BACKEND == "postgres":
+        return PostgresBucket(
+            settings.RATE_LIMIT_NAME, settings.RATE_LIMIT_RATE, settings.RATE_LIMIT_BURST
+        )
+    return MemoryBucket(settings.RATE_LIMIT_RATE, settings.RATE_LIMIT_BURST)
+
+
+rate_limiter = RateLimiter(_build_bucket(), enabled=settings.RATE_LIMIT_ENABLED)
@@ -1,60 +1,188 @@
 import time
-from datetime import datetime, date
-from bs4 import BeautifulSoup
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from urllib.parse import quote, urlencode
 import pandas as pd
-from .utils import get_applicants_count, normalize_job_url
+from backend.utils.metrics import SCRAPE_STAGE
+from .parser import parse_cards
+from .utils import get_applicants_count
 from .config import settings
+from .driver import navigate
+from .http_detail import NEEDS_BROWSER
+from .rate_limit import ThrottledError, rate_limiter
+from .waits import wait_for_selector, wait_until
 
+CARD_SELECTOR = "div.base-search-card"
 
-def scrape_jobs(driver, keyword: str = "Python Developer") -> pd.DataFrame:
+# Returns the outerHTML of every card after index `arguments[0]`, so each
+# scroll only transfers and parses the cards that were just loaded
+_NEW_CARDS_JS = (
+    f"return Array.from(document.querySelectorAll('{CARD_SELECTOR}'))"
+    ".slice(arguments[0]).map(e => e.outerHTML);"
+)
+_CARD_COUNT_JS = f"return document.querySelectorAll('{CARD_SELECTOR}').length;"
+_SHOW_MORE_JS = (
+    "const b = document.querySelector('button.infinite-scroller__show-more-button');"
+    "if (b && b.offsetParent !== null && !b.disabled) { b.click(); return true; }"
+    "return false;"
+)
 
-    search_url = (
-        "https://www.linkedin.com/jobs/search/"
-        f"?keywords={keyword.replace(' ', '%20')}"
-    )
-    driver.get(search_url)
-    time.sleep(settings.SCRAPE_DELAY)
 
-    for _ in range(settings.SCROLLS):
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(settings.SCROLL_DELAY)
+def build_search_url(keyword: str, location: str | None = None) -> str:
+    params = {"keywords": keyword}
+    if location:
+        params["location"] = location
+    return "https://www.linkedin.com/jobs/search/?" + urlencode(params, quote_via=quote)
+
+
+def search_cards(
+    driver, keyword: str, location: str | None = None, limit: int | None = None
+) -> list[dict]:
+    limit = limit or settings.JOB_LIMIT
+    reason = navigate(driver, build_search_url(keyword, location), label="search")
+    if reason is not None:
+        # Failing the search keeps it resumable instead of recording it as
+        # a search without results
+        raise ThrottledError(f"search page throttled ({reason})")
+    wait_for_selector(driver, CARD_SELECTOR, settings.SCRAPE_DELAY, "search_results")
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
-    cards = soup.select("div.base-search-card")
     jobs = []
+    seen = 0
+    stale_rounds = 0
+
+    # SCROLLS is an upper bound: the loop stops as soon as `limit` cards
+    # are parsed or the card count stops growing for SCROLL_STABLE_ROUNDS
+    for _ in range(settings.SCROLLS + 1):
+        new_cards = driver.execute_script(_NEW_CARDS_JS, seen)
+        seen += len(new_cards)
+
+        # All new cards are parsed in one pass over their concatenated HTML
+        if new_cards:
+            remaining = limit - len(jobs)
+            with SCRAPE_STAGE.time(stage="parse"):
+                jobs.extend(parse_cards("".join(new_cards))[:remaining])
 
-    for card in cards:
-        if len(jobs) >= settings.JOB_LIMIT:
+        if len(jobs) >= limit:
             break
 
-        link_el  = card.select_one("a.base-card__full-link")
-        title_el = card.select_one("h3.base-search-card__title")
-        date_el  = card.select_one("time")
-        if not link_el or not title_el:
-            continue
-
-        raw_date = date_el["datetime"] if date_el and date_el.has_attr("datetime") else None
-        days_since = None
-        if raw_date:
-            pub_date = datetime.fromisoformat(raw_date).date()
-            days_since = (date.today() - pub_date).days
-
-        title    = title_el.get_text(strip=True)
-        company  = (card.select_one("h4.base-search-card__subtitle") or "").get_text(strip=True)
-        location = (card.select_one("span.job-search-card__location") or "").get_text(strip=True)
-        raw_url = link_el["href"].strip()
-        job_url = normalize_job_url(raw_url)
-
-        applicants = get_applicants_count(driver, job_url)
-
-        jobs.append({
-            "title":             title,
-            "company":           company,
-            "location":          location,
-            "date_posted":       raw_date,
-            "days_since_posted": days_since,
-            "job_url":           job_url,
-            "applicants":        applicants
-        })
-
-    return pd.DataFrame(jobs)
+        if new_cards:
+            stale_rounds = 0
+        else:
+            stale_rounds += 1
+            if stale_rounds >= settings.SCROLL_STABLE_ROUNDS:
+                break
+
+        # Each scroll or "show more" click fetches the next page of cards
+        scroll_start = time.perf_counter()
+        rate_limiter.acquire()
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        grew = wait_until(
+            driver,
+            lambda d: d.execute_script(_CARD_COUNT_JS) > seen,
+            settings.SCROLL_DELAY,
+            "scroll",
+        )
+        if not grew:
+            rate_limiter.acquire()
+            if driver.execute_script(_SHOW_MORE_JS):
+                # Long result pages stop auto-loading and need the button
+                wait_until(
+                    driver,
+                    lambda d: d.execute_script(_CARD_COUNT_JS) > seen,
+                    settings.SCROLL_DELAY,
+                    "show_more",
+                )
+        SCRAPE_STAGE.observe(time.perf_counter() - scroll_start, stage="scroll")
+
+    return jobs
+
+
+def iter_jobs(
+    driver,
+    keyword: str = "Python Developer",
+    pool=None,
+    cache=None,
+    location: str | None = None,
+    limit: int | None = None,
+    cards: list[dict] | None = None,
+    fetcher=None,
+) -> Iterator[dict]:
+    """
+    Generator mode of `scrape_jobs`: yields one record per card, in card
+    order, as soon as its applicant count is known. Passing `cards` (e.g.
+    restored from a run journal) skips the search page.
+
+    With a `fetcher` (http_detail.DetailFetcher), detail pages are first
+    fetched over plain HTTP; only those it cannot read are loaded in a
+    browser.
+    """
+    if cards is None:
+        cards = search_cards(driver, keyword, location=location, limit=limit)
+    jobs = cards
+
+    # Cards with a fresh cached count skip the detail page entirely
+    pending = jobs
+    if cache is not None:
+        cache.load([job.get("linkedin_id") for job in jobs])
+        pending = []
+        for job in jobs:
+            cached = cache.get(job.get("linkedin_id"), job["days_since_posted"])
+            if cached:
+                job["applicants"], job["applicants_checked_at"] = cached
+            else:
+                pending.append(job)
+
+    # With the HTTP client, detail pages are fetched in batches and every
+    # batch is yielded before the next starts, so records keep streaming
+    # into the sinks and the journal; the browser path streams one by one
+    batch_size = max(1, settings.HTTP_DETAIL_BATCH_SIZE) if fetcher is not None else len(jobs)
+    pending_ids = {id(job) for job in pending}
+    segment: list[dict] = []
+    segment_pending = 0
+    for job in jobs:
+        segment.append(job)
+        if id(job) in pending_ids:
+            segment_pending += 1
+        if segment_pending >= batch_size:
+            yield from _with_counts(driver, segment, pending_ids, pool, fetcher)
+            segment, segment_pending = [], 0
+    yield from _with_counts(driver, segment, pending_ids, pool, fetcher)
+
+
+def _detail_counts(driver, job_urls: list[str], pool, fetcher) -> Iterator:
+    # Over HTTP first, then in a browser for the pages it could not read:
+    # concurrently through the driver pool or one by one on the search driver
+    fetched = fetcher.fetch_counts(job_urls) if fetcher is not None else [NEEDS_BROWSER] * len(job_urls)
+    browser_urls = [url for url, count in zip(job_urls, fetched) if count is NEEDS_BROWSER]
+    if pool is not None:
+        browser_counts = pool.iter_applicants(browser_urls)
+    else:
+        browser_counts = (get_applicants_count(driver, url) for url in browser_urls)
+    for count in fetched:
+        yield next(browser_counts) if count is NEEDS_BROWSER else count
+
+
+def _with_counts(driver, jobs: list[dict], pending_ids: set, pool, fetcher) -> Iterator[dict]:
+    counts = _detail_counts(
+        driver, [job["job_url"] for job in jobs if id(job) in pending_ids], pool, fetcher
+    )
+    for job in jobs:
+        if id(job) in pending_ids:
+            applicants = next(counts)
+            job["applicants"] = applicants
+            if applicants is not None:
+                job["applicants_checked_at"] = datetime.now(timezone.utc)
+        yield job
+
+
+def scrape_jobs(
+    driver,
+    keyword: str = "Python Developer",
+    pool=None,
+    cache=None,
+    location: str | None = None,
+    limit: int | None = None,
+) -> pd.DataFrame:
+    return pd.DataFrame(list(iter_jobs(
+        driver, keyword, pool=pool, cache=cache, location=location, limit=limit
+    )))
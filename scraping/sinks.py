@@ -0,0 +1,95 @@
+import csv
+import logging
+from backend.config.config_db import SessionLocal, init_db
+from backend.repository.job_repository import JobRepository
+from .to_db import to_record
+
+logger = logging.getLogger(__name__)
+
+CSV_FIELDS = [
+    "title",
+    "company",
+    "location",
+    "date_posted",
+    "days_since_posted",
+    "job_url",
+    "applicants",
+    "applicants_checked_at",
+]
+
+
+class DatabaseSink:
+    """
+    Upserts scraped records in bounded micro-batches, so memory stays flat
+    and a crash only loses the records of the current batch.
+    """
+
+    def __init__(self, batch_size: int = 25, session_factory=SessionLocal) -> None:
+        self.batch_size = max(1, batch_size)
+        self.session_factory = session_factory
+        self._buffer: dict[str, dict] = {}
+        self.written = 0
+        init_db()
+
+    def write(self, row: dict) -> None:
+        record = to_record(row)
+        # Keyed by job_url: a batch must not hit the same row twice
+        self._buffer[record["job_url"]] = record
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        records = list(self._buffer.values())
+        with self.session_factory() as db:
+            result = JobRepository(db).upsert_batch(records)
+        self._buffer.clear()
+        self.written += len(records)
+        logger.info(
+            f"Lote de {len(records)} registros volcado a la base de datos "
+            f"({result.inserted} nuevos, {result.updated} actualizados, "
+            f"{result.unchanged} sin cambios)."
+        )
+        if result.skipped:
+            logger.warning(f"{result.skipped} registros sin ID de oferta de LinkedIn descartados.")
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class CsvSink:
+    """
+    Appends scraped records to a CSV file as they arrive.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.written = 0
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._writer = csv.DictWriter(self._file, fieldnames=CSV_FIELDS, extrasaction="ignore")
+        self._writer.writeheader()
+
+    def write(self, row: dict) -> None:
+        self._writer.writerow(row)
+        self.written += 1
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+            logger.info(f"CSV guardado en '{self.path}' con {self.written} registros.")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -1,26 +1,61 @@
+from datetime import date, datetime
 import pandas as pd
 from dotenv import load_dotenv
 from backend.config.config_db import SessionLocal, init_db
 from backend.repository.job_repository import JobRepository
+from backend.schemas.job_schema import UpsertResult
+from backend.utils.linkedin import job_id_from_url
+from .utils import normalize_job_url
 
 load_dotenv()
 
-def load_csv_to_db(csv_path: str = "dataset_linkedin.csv") -> None:
+
+def _is_missing(value) -> bool:
+    return value is None or (not isinstance(value, str) and pd.isna(value))
+
+
+def to_record(row: dict) -> dict:
+    """
+    Normalize a scraped row (from the scraper or a CSV line) into the dict
+    shape expected by JobRepository.upsert_batch.
+    """
+    applicants_val = row.get("applicants")
+    days_val = row.get("days_since_posted")
+    date_val = row.get("date_posted")
+    checked_val = row.get("applicants_checked_at")
+
+    if _is_missing(date_val):
+        date_posted = None
+    elif isinstance(date_val, datetime):
+        date_posted = date_val.date()
+    elif isinstance(date_val, date):
+        date_posted = date_val
+    else:
+        date_posted = pd.to_datetime(date_val).date()
+
+    # Old CSVs hold slug and tracking URLs; the upsert is keyed on the ID
+    job_url = normalize_job_url(row["job_url"])
+
+    return {
+        "title":             row["title"],
+        "company":           row["company"],
+        "location":          row["location"],
+        "date_posted":       date_posted,
+        "days_since_posted": None if _is_missing(days_val) else int(days_val),
+        "applicants":        None if _is_missing(applicants_val) else int(applicants_val),
+        "job_url":           job_url,
+        "linkedin_id":       job_id_from_url(job_url),
+        "applicants_checked_at": (
+            None if _is_missing(checked_val)
+            else pd.to_datetime(checked_val, utc=True).to_pydatetime()
+        ),
+    }
+
+
+def load_csv_to_db(csv_path: str = "dataset_linkedin.csv") -> UpsertResult:
     init_db()
     df = pd.read_csv(csv_path, parse_dates=["date_posted"])
-    records = []
-    for row in df.to_dict(orient="records"):
-        applicants_val = row.get("applicants")
-        days_val = row.get("days_since_posted")
-        records.append({
-            "title":             row["title"],
-            "company":           row["company"],
-            "location":          row["location"],
-            "date_posted":       row["date_posted"].date() if row["date_posted"] else None,
-            "days_since_posted": int(days_val) if days_val is not None and not pd.isna(days_val) else None,
-            "applicants":        int(applicants_val) if applicants_val is not None and not pd.isna(applicants_val) else None,
-            "job_url":           row["job_url"],
-        })
+    records = [to_record(row) for row in df.to_dict(orient="records")]
     with SessionLocal() as db:
         repo = JobRepository(db)
-        repo.upsert_batch(records)
+        return repo.upsert_batch(records)
@@ -1,34 +1,49 @@
 import time
-import re
-from bs4 import BeautifulSoup
 from urllib.parse import urlparse
 from selenium.common.exceptions import TimeoutException, WebDriverException
+from backend.utils.linkedin import canonical_job_url, job_id_from_url
+from backend.utils.metrics import SCRAPE_STAGE
 from .config import settings
+from .driver import is_logged_out, navigate
+from .waits import wait_for_selector
 
 
 def get_applicants_count(driver, job_url) -> int:
+    with SCRAPE_STAGE.time(stage="detail_fetch"):
+        return _applicants_count(driver, job_url)
+
+
+def _applicants_count(driver, job_url) -> int:
+    # Imported here: the parser module depends on normalize_job_url below
+    from .parser import parse_applicants
+
     last_exc = None
     for attempt in range(1, settings.APPLICANT_RETRIES + 1):
         try:
-            driver.get(job_url)
-            time.sleep(settings.APPLICANT_DELAY)
-            soup = BeautifulSoup(driver.page_source, "html.parser")
-            el = soup.select_one("span.num-applicants__caption")
-            if el:
-                nums = re.findall(r"\d+", el.get_text())
-                if nums:
-                    return int(nums[-1])
-            return None
+            # A throttle page is retried once the rate limiter's backoff,
+            # which every other driver honours too, is over
+            if navigate(driver, job_url, label="detail") is not None:
+                # /authwall and /checkpoint also mean the session expired:
+                # retrying only doubles the backoff, the caller logs in again
+                if is_logged_out(driver):
+                    return None
+                continue
+            wait_for_selector(
+                driver, "span.num-applicants__caption", settings.APPLICANT_DELAY, "applicants"
+            )
+            html = driver.page_source
+            with SCRAPE_STAGE.time(stage="parse"):
+                return parse_applicants(html)
         except (TimeoutException, WebDriverException) as e:
             last_exc = e
-            time.sleep(settings.APPLICANT_DELAY)
+            if attempt < settings.APPLICANT_RETRIES:
+                time.sleep(settings.APPLICANT_DELAY * 2 ** (attempt - 1))
     return None
 
 def normalize_job_url(raw_url: str) -> str:
+    # Slug and tracking variants of a posting all map to its numeric ID
+    job_id = job_id_from_url(raw_url)
+    if job_id is not None:
+        return canonical_job_url(job_id)
     parsed = urlparse(raw_url)
-    path = parsed.path
-    m = re.search(r"/jobs/view/(\d+)", path)
-    if m:
-        job_id = m.group(1)
-        return f"https://www.linkedin.com/jobs/view/{job_id}"
-    return f"{parsed.scheme}://{parsed.netloc}{path}"
+    return f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
@@ -0,0 +1,142 @@
+import logging
+import threading
+import time
+from collections import defaultdict
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+logger = logging.getLogger(__name__)
+
+
+class WaitStats:
+    """
+    Thread-safe record of how long each named wait actually took, so the
+    *_DELAY timeouts can be tuned from real data.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._samples: dict[str, list[float]] = defaultdict(list)
+        self._timeouts: dict[str, int] = defaultdict(int)
+
+    def record(self, label: str, elapsed: float, timed_out: bool) -> None:
+        with self._lock:
+            self._samples[label].append(elapsed)
+            if timed_out:
+                self._timeouts[label] += 1
+
+    def summary(self) -> dict[str, dict]:
+        with self._lock:
+            result = {}
+            for label, samples in self._samples.items():
+                ordered = sorted(samples)
+                result[label] = {
+                    "count": len(ordered),
+                    "timeouts": self._timeouts[label],
+                    "mean": sum(ordered) / len(ordered),
+                    "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+                    "max": ordered[-1],
+                }
+            return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+            self._timeouts.clear()
+
+    def log_summary(self) -> None:
+        for label, s in self.summary().items():
+            logger.info(
+                f"Espera '{label}': n={s['count']} timeouts={s['timeouts']} "
+                f"media={s['mean']:.2f}s p95={s['p95']:.2f}s max={s['max']:.2f}s"
+            )
+
+
+wait_stats = WaitStats()
+
+
+class PageStats:
+    """
+    Thread-safe per-label record of page load times and, when the driver
+    logs network events, of the bytes and requests each kind of page costs.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loads: dict[str, list[float]] = defaultdict(list)
+        self._traffic: dict[str, list[int]] = defaultdict(lambda: [0, 0, 0])
+
+    def record(self, label: str, elapsed: float) -> None:
+        with self._lock:
+            self._loads[label].append(elapsed)
+
+    def add_traffic(self, label: str, received: int, requests: int, blocked: int) -> None:
+        with self._lock:
+            traffic = self._traffic[label]
+            traffic[0] += received
+            traffic[1] += requests
+            traffic[2] += blocked
+
+    def summary(self) -> dict[str, dict]:
+        with self._lock:
+            result = {}
+            for label, loads in self._loads.items():
+                ordered = sorted(loads)
+                received, requests, blocked = self._traffic.get(label, (0, 0, 0))
+                result[label] = {
+                    "pages": len(ordered),
+                    "mean": sum(ordered) / len(ordered),
+                    "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+                    "bytes_per_page": received / len(ordered),
+                    "requests_per_page": requests / len(ordered),
+                    "blocked_per_page": blocked / len(ordered),
+                }
+            return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._loads.clear()
+            self._traffic.clear()
+
+    def log_summary(self) -> None:
+        for label, s in self.summary().items():
+            logger.info(
+                f"Páginas '{label}': n={s['pages']} carga media={s['mean']:.2f}s "
+                f"p95={s['p95']:.2f}s {s['bytes_per_page'] / 1024:.0f} KiB/página "
+                f"{s['requests_per_page']:.0f} peticiones/página "
+                f"({s['blocked_per_page']:.0f} bloqueadas)"
+            )
+
+
+page_stats = PageStats()
+
+
+def wait_until(driver, condition, timeout: float, label: str) -> bool:
+    """
+    Block until `condition` holds or `timeout` seconds pass.
+
+    Returns:
+        bool: True if the condition was met, False on timeout.
+    """
+    start = time.perf_counter()
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(condition)
+        met = True
+    except TimeoutException:
+        met = False
+    wait_stats.record(label, time.perf_counter() - start, timed_out=not met)
+    return met
+
+
+def wait_for_selector(driver, css: str, timeout: float, label: str | None = None) -> bool:
+    """
+    Wait until an element matching the CSS selector `css` is present.
+    """
+    return wait_until(
+        driver,
+        EC.presence_of_element_located((By.CSS_SELECTOR, css)),
+        timeout,
+        label or css,
+    )
@@ -0,0 +1,283 @@
+import hashlib
+import logging
+import os
+import socket
+import threading
+import time
+from collections.abc import Sequence
+from datetime import datetime, timedelta, timezone
+from selenium.common.exceptions import WebDriverException
+from backend.config.config_db import SessionLocal, init_db
+from backend.models.scrape_task import TASK_KINDS
+from backend.repository.job_repository import JobRepository
+from backend.repository.task_repository import TaskRepository
+from .cache import ApplicantCache
+from .campaign import SearchSpec
+from .config import settings
+from .driver import ensure_session, init_driver, is_alive, is_logged_out
+from .http_detail import NEEDS_BROWSER, DetailFetcher
+from .journal import campaign_key
+from .metrics import write_run_summary
+from .scraper import search_cards
+from .to_db import to_record
+from .utils import get_applicants_count
+from .rate_limit import rate_limiter
+from .waits import page_stats, wait_stats
+
+logger = logging.getLogger(__name__)
+
+
+def detail_key(card: dict) -> str:
+    # One detail task per posting and run, whichever searches found it
+    if card.get("linkedin_id") is not None:
+        return f"detail:{card['linkedin_id']}"
+    return "detail:" + hashlib.sha1(card["job_url"].encode("utf-8")).hexdigest()
+
+
+def enqueue_campaign(specs: list[SearchSpec], run: str | None = None) -> str:
+    """
+    Enqueue one search task per spec as a new run, for queue workers to
+    pick up. Returns the run name.
+    """
+    init_db()
+    run = run or f"{campaign_key(specs)}-{datetime.now(timezone.utc):%Y%m%dT%H%M%S}"
+    with SessionLocal() as db:
+        added = TaskRepository(db).enqueue(
+            run, "search", ((f"search:{i}", spec.model_dump()) for i, spec in enumerate(specs))
+        )
+        db.commit()
+    logger.info(f"Ejecución '{run}' encolada con {added} búsquedas.")
+    return run
+
+
+class LeaseHeartbeat:
+    """
+    Renews the leases of a claimed batch every third of the lease while its
+    tasks run. A task can outlive one lease without being stuck: the rate
+    limiter pauses all traffic for up to RATE_LIMIT_BACKOFF_MAX seconds, and
+    another worker re-running the same search would only add traffic while
+    LinkedIn is throttling.
+    """
+
+    def __init__(self, session_factory, tasks: list, lease: timedelta) -> None:
+        self.session_factory = session_factory
+        self.tasks = tasks
+        self.lease = lease
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="lease-heartbeat", daemon=True)
+
+    def _run(self) -> None:
+        interval = self.lease.total_seconds() / 3
+        while not self._stop.wait(interval):
+            try:
+                with self.session_factory() as db:
+                    tasks = TaskRepository(db)
+                    for task in self.tasks:
+                        tasks.extend(task.id, task.attempts, self.lease)
+                    db.commit()
+            except Exception as e:
+                logger.warning(f"No se pudo renovar el lease de las tareas: {e}")
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+class QueueWorker:
+    """
+    Claims scrape tasks from the Postgres queue and runs them on one
+    browser. Search tasks parse the results page and enqueue one detail
+    task per card without a fresh cached count; detail tasks fetch the
+    applicant count, over plain HTTP when HTTP_DETAIL_ENABLED (the claimed
+    batch concurrently) and in the browser otherwise. Each task's records are upserted in the same
+    transaction that marks it done, so a crash never loses or half-applies
+    a task: its lease, renewed while the worker runs it, expires and
+    another worker runs it again.
+    """
+
+    def __init__(
+        self,
+        name: str | None = None,
+        kinds: Sequence[str] = TASK_KINDS,
+        session_factory=SessionLocal,
+    ) -> None:
+        self.name = name or f"{socket.gethostname()}-{os.getpid()}"
+        self.kinds = list(kinds)
+        self.session_factory = session_factory
+        self.cache = ApplicantCache(session_factory) if settings.APPLICANT_CACHE_ENABLED else None
+        self.fetcher = DetailFetcher() if settings.HTTP_DETAIL_ENABLED else None
+        # Counts fetched over HTTP for the claimed detail tasks, by job URL
+        self._prefetched: dict[str, object] = {}
+        self.lease = timedelta(seconds=settings.QUEUE_LEASE_SECONDS)
+        self._driver = None
+        self.done = 0
+        self.retried = 0
+        self.failed = 0
+
+    def _browser(self):
+        if self._driver is None:
+            driver = init_driver(headless=True)
+            try:
+                ensure_session(driver)
+            except Exception:
+                driver.quit()
+                raise
+            self._driver = driver
+        return self._driver
+
+    def _discard_browser(self) -> None:
+        if self._driver is not None:
+            try:
+                self._driver.quit()
+            except Exception:
+                pass
+            self._driver = None
+
+    def _search(self, payload: dict) -> tuple[list[dict], list[tuple[str, dict]]]:
+        spec = SearchSpec(**payload)
+        cards = search_cards(
+            self._browser(), spec.keyword, location=spec.location, limit=spec.job_limit
+        )
+        records, details = [], []
+        if self.cache is not None:
+            self.cache.load([card.get("linkedin_id") for card in cards])
+        for card in cards:
+            cached = None
+            if self.cache is not None:
+                cached = self.cache.get(card.get("linkedin_id"), card["days_since_posted"])
+            if cached:
+                card["applicants"], card["applicants_checked_at"] = cached
+                records.append(card)
+            else:
+                details.append((detail_key(card), card))
+        logger.info(
+            f"Búsqueda '{spec.label}': {len(cards)} tarjetas, {len(details)} detalles encolados, "
+            f"{len(records)} desde la caché."
+        )
+        return records, details
+
+    def _prefetch(self, tasks: list) -> None:
+        urls = [task.payload["job_url"] for task in tasks if task.kind == "detail"]
+        if self.fetcher is None or not urls:
+            return
+        try:
+            self._prefetched = dict(zip(urls, self.fetcher.fetch_counts(urls)))
+        except Exception as e:
+            # The tasks fall back to the browser
+            logger.warning(f"Cliente HTTP de detalle no disponible: {e}")
+
+    def _detail(self, payload: dict) -> list[dict]:
+        count = self._prefetched.pop(payload["job_url"], NEEDS_BROWSER)
+        if count is NEEDS_BROWSER:
+            driver = self._browser()
+            count = get_applicants_count(driver, payload["job_url"])
+            if count is None and not is_alive(driver):
+                raise WebDriverException("worker driver is unresponsive")
+            if count is None and is_logged_out(driver):
+                ensure_session(driver)
+                raise WebDriverException("session expired")
+        record = dict(payload, applicants=count)
+        if count is not None:
+            record["applicants_checked_at"] = datetime.now(timezone.utc)
+            if self.cache is not None and record.get("linkedin_id") is not None:
+                self.cache.put(record["linkedin_id"], count, record["applicants_checked_at"])
+        return [record]
+
+    def _retry(self, task, error: Exception) -> None:
+        delay = timedelta(seconds=settings.QUEUE_RETRY_DELAY * 2 ** (task.attempts - 1))
+        with self.session_factory() as db:
+            retried = TaskRepository(db).retry(
+                task.id, task.attempts, str(error), delay, settings.QUEUE_MAX_ATTEMPTS
+            )
+            db.commit()
+        if retried:
+            self.retried += 1
+            logger.warning(
+                f"Tarea {task.task_key} fallida (intento {task.attempts}), "
+                f"reintento en {delay}: {error}"
+            )
+        else:
+            self.failed += 1
+            logger.error(f"Tarea {task.task_key} descartada tras {task.attempts} intentos: {error}")
+
+    def _run_task(self, task) -> None:
+        try:
+            if task.kind == "search":
+                records, details = self._search(task.payload)
+            else:
+                records, details = self._detail(task.payload), []
+        except Exception as e:
+            if isinstance(e, WebDriverException):
+                self._discard_browser()
+            self._retry(task, e)
+            return
+
+        try:
+            with self.session_factory() as db:
+                tasks = TaskRepository(db)
+                if not tasks.complete(task.id, task.attempts):
+                    # Lease expired and the task was claimed again; its new
+                    # owner writes the result
+                    logger.warning(f"Tarea {task.task_key} reasignada, resultado descartado.")
+                    return
+                tasks.enqueue(task.run, "detail", details)
+                JobRepository(db).upsert_batch([to_record(record) for record in records])
+                db.commit()
+        except Exception as e:
+            logger.error(f"Error guardando la tarea {task.task_key}: {e}", exc_info=True)
+            self._retry(task, e)
+            return
+        self.done += 1
+
+    def run(self, drain: bool = False, max_tasks: int | None = None) -> None:
+        """
+        Claim and run tasks until stopped. With `drain`, return once no
+        task of this worker's kinds is pending or running; `max_tasks`
+        bounds the tasks run.
+        """
+        init_db()
+        logger.info(f"Worker '{self.name}' iniciado ({', '.join(self.kinds)}).")
+        started_at = datetime.now(timezone.utc)
+        start = time.perf_counter()
+        try:
+            while max_tasks is None or self.done + self.retried + self.failed < max_tasks:
+                with self.session_factory() as db:
+                    claimed = TaskRepository(db).claim(
+                        self.name,
+                        settings.QUEUE_BATCH_SIZE,
+                        self.lease,
+                        settings.QUEUE_MAX_ATTEMPTS,
+                        self.kinds,
+                    )
+                    if not claimed and drain and not TaskRepository(db).has_work(kinds=self.kinds):
+                        break
+                if not claimed:
+                    time.sleep(settings.QUEUE_POLL_SECONDS)
+                    continue
+                with LeaseHeartbeat(self.session_factory, claimed, self.lease):
+                    self._prefetch(claimed)
+                    for task in claimed:
+                        self._run_task(task)
+                self._prefetched.clear()
+        finally:
+            self._discard_browser()
+            logger.info(
+                f"Worker '{self.name}': {self.done} tareas completadas, "
+                f"{self.retried} reintentadas, {self.failed} descartadas."
+            )
+            wait_stats.log_summary()
+            page_stats.log_summary()
+            rate_limiter.log_summary()
+            if self.cache is not None:
+                self.cache.log_summary()
+            if self.fetcher is not None:
+                self.fetcher.log_summary()
+            write_run_summary(f"worker-{self.name}-{started_at:%Y%m%dT%H%M%S}", {
+                "started_at": started_at,
+                "elapsed": round(time.perf_counter() - start, 3),
+                "tasks": {"done": self.done, "retried": self.retried, "failed": self.failed},
+            })